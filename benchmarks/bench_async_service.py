@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Concurrent throughput: sync FalkorDBService vs AsyncFalkorDBService.
+
+Runs the same Cypher query many times against a live FalkorDB instance
+(configured through the usual FALKORDB_* environment variables) and reports
+queries per second for both service layers.
+
+The sync path is driven from an event loop exactly as the old ``def`` MCP
+tools were: each call blocks the loop, so concurrent callers serialize. The
+async path issues the same calls as overlapping coroutines.
+
+Usage:
+    uv run python benchmarks/bench_async_service.py --graph social \\
+        --query "MATCH (n) RETURN count(n)" --requests 500 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from falkordb_mcp.async_service import AsyncFalkorDBService  # noqa: E402
+from falkordb_mcp.service import FalkorDBService  # noqa: E402
+
+
+def _report(label: str, elapsed: float, latencies: List[float]) -> None:
+    """Print throughput and latency percentiles for one run."""
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(
+        f"{label:<6} {len(latencies) / elapsed:>10.1f} q/s   "
+        f"p50 {p50:>8.2f} ms   p99 {p99:>8.2f} ms   total {elapsed:.2f} s"
+    )
+
+
+async def bench_sync(args: argparse.Namespace) -> None:
+    """Run the workload through the blocking service on the event loop."""
+    service = FalkorDBService()
+    latencies: List[float] = []
+    remaining = args.requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            service.execute_query(args.graph, args.query)
+            latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    _report("sync", time.perf_counter() - start, latencies)
+    service.close()
+
+
+async def bench_async(args: argparse.Namespace) -> None:
+    """Run the workload through the asyncio service with overlapping calls."""
+    service = AsyncFalkorDBService()
+    await service.initialize()
+    latencies: List[float] = []
+    remaining = args.requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            await service.execute_query(args.graph, args.query)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    _report("async", time.perf_counter() - start, latencies)
+    await service.close()
+
+
+def main() -> None:
+    """Parse arguments and run both benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--graph", required=True, help="Graph to query")
+    parser.add_argument("--query", default="MATCH (n) RETURN count(n)")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    print(f"{args.requests} requests, concurrency {args.concurrency}: {args.query}")
+    asyncio.run(bench_sync(args))
+    asyncio.run(bench_async(args))
+
+
+if __name__ == "__main__":
+    main()
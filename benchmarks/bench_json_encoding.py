@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Response encoding: payload size and encode time per JSON backend.
+
+Builds an execute_query response with a synthetic result set (no database
+needed) and encodes it with every available backend, compact and pretty,
+reporting the payload size and the median encode time.
+
+Usage:
+    uv run python benchmarks/bench_json_encoding.py --rows 10000 --repeat 20
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from falkordb_mcp import encoding  # noqa: E402
+
+
+def build_payload(rows: int) -> Dict[str, Any]:
+    """Build a response shaped like execute_query's, with node-like rows."""
+    result_set: List[List[Any]] = [
+        [
+            {
+                "id": i,
+                "labels": ["Entity"],
+                "properties": {
+                    "name": f"entity-{i}",
+                    "summary": "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
+                    "group_id": f"group-{i % 8}",
+                    "score": i / rows,
+                },
+            },
+            f"entity-{i}",
+            i % 100,
+        ]
+        for i in range(rows)
+    ]
+    return {
+        "success": True,
+        "data": {
+            "result_set": result_set,
+            "headers": [[1, "n"], [1, "n.name"], [1, "degree"]],
+            "statistics": {"nodes_created": 0, "run_time_ms": 12.5},
+        },
+        "metadata": {"graphName": "graphiti", "query": "MATCH (n:Entity) RETURN n"},
+    }
+
+
+def bench(payload: Dict[str, Any], backend: str, pretty: bool, repeat: int) -> None:
+    """Print payload bytes and median encode time for one configuration."""
+    timings = []
+    with patch.object(encoding, "backend", backend):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            encoded = encoding.dumps(payload, pretty=pretty)
+            timings.append(time.perf_counter() - start)
+    size = len(encoded.encode())
+    label = f"{backend} {'pretty' if pretty else 'compact'}"
+    print(
+        f"{label:<16} {size / 1024:>10.1f} KiB   "
+        f"median {statistics.median(timings) * 1000:>8.2f} ms"
+    )
+
+
+def main() -> None:
+    """Parse arguments and benchmark every backend."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payload = build_payload(args.rows)
+    backends = [encoding.STDLIB]
+    if encoding.orjson is not None:
+        backends.append(encoding.ORJSON)
+    else:
+        print("orjson is not installed; only the stdlib backend is measured")
+
+    print(f"{args.rows} rows, median of {args.repeat} runs")
+    for backend in backends:
+        for pretty in (True, False):
+            bench(payload, backend, pretty, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Result serialization throughput in rows per second.
+
+Builds result sets from the same values as the serialization test fixtures
+(``mock_node``, ``mock_edge`` and the ``mock_query_result*`` rows in
+tests/conftest.py), but with real falkordb Node and Edge objects, and times
+the service's row serializer against the previous recursive implementation.
+No database is needed.
+
+Usage:
+    uv run python benchmarks/bench_serialization.py --rows 10000 --repeat 10
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from falkordb.edge import Edge  # noqa: E402
+from falkordb.node import Node  # noqa: E402
+
+from falkordb_mcp.service import _serialize_row  # noqa: E402
+
+
+def recursive_baseline(value: Any) -> Any:
+    """The recursive isinstance-chain serializer, kept for comparison."""
+    if isinstance(value, Node):
+        return {
+            "type": "node",
+            "id": value.id,
+            "labels": list(value.labels),
+            "properties": dict(value.properties),
+        }
+    elif isinstance(value, Edge):
+        return {
+            "type": "edge",
+            "id": value.id,
+            "relation": value.relation,
+            "src_node": value.src_node,
+            "dest_node": value.dest_node,
+            "properties": dict(value.properties),
+        }
+    elif isinstance(value, (list, tuple)):
+        return [recursive_baseline(v) for v in value]
+    elif isinstance(value, dict):
+        return {k: recursive_baseline(v) for k, v in value.items()}
+    return value
+
+
+def build_workloads(rows: int) -> Dict[str, List[List[Any]]]:
+    """Result sets shaped like the test fixtures, repeated to ``rows`` rows."""
+    node = Node(
+        node_id=123,
+        labels=["Entity", "Person"],
+        properties={"name": "Alice", "age": 30, "tags": ["developer", "python"]},
+    )
+    edge = Edge(123, "KNOWS", 789, edge_id=456, properties={"since": "2020", "strength": 0.8})
+    return {
+        "primitives": [[i, "Alice", 30] for i in range(rows)],
+        "nodes": [[node] for _ in range(rows)],
+        "edges": [[edge] for _ in range(rows)],
+        "mixed": [[node, edge, "Alice", 30] for _ in range(rows)],
+        "nested": [
+            [{
+                "nodes": [node, node],
+                "edges": [edge],
+                "metadata": {"count": 2, "nested": [1, 2, node]},
+            }]
+            for _ in range(rows)
+        ],
+    }
+
+
+def bench(label: str, serialize_row: Callable[[Any], Any], rows: List[List[Any]],
+          repeat: int) -> float:
+    """Print and return the median rows/second for one serializer."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for row in rows:
+            serialize_row(row)
+        timings.append(time.perf_counter() - start)
+    rate = len(rows) / statistics.median(timings)
+    print(f"  {label:<10} {rate:>14,.0f} rows/s")
+    return rate
+
+
+def main() -> None:
+    """Parse arguments and benchmark every workload."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{args.rows} rows, median of {args.repeat} runs")
+    for name, rows in build_workloads(args.rows).items():
+        print(name)
+        baseline = bench("recursive", recursive_baseline, rows, args.repeat)
+        current = bench("current", _serialize_row, rows, args.repeat)
+        print(f"  speedup    {current / baseline:>14.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""Admission control: concurrency limits per graph and per client with a bounded queue."""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+# Client key for calls made outside an MCP session
+ANONYMOUS = "<anonymous>"
+
+QUEUE_FULL = "queue_full"
+QUEUE_TIMEOUT = "queue_timeout"
+
+
+class AdmissionRejectedError(RuntimeError):
+    """Raised when a call is turned away instead of queued or admitted."""
+
+    def __init__(self, reason: str, retry_after: float, message: str):
+        """
+        Initialize the error.
+
+        Args:
+            reason: "queue_full" or "queue_timeout"
+            retry_after: Suggested seconds to wait before retrying
+            message: Human-readable description
+        """
+        super().__init__(message)
+        self.reason = reason
+        self.retry_after = retry_after
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Structured form for tool error responses."""
+        return {"reason": self.reason, "retry_after": self.retry_after}
+
+
+@dataclass
+class _Waiter:
+    graph: str
+    client: str
+    future: asyncio.Future = field(repr=False)
+
+
+class AdmissionController:
+    """Limits concurrent calls per graph and per client.
+
+    A call runs once both its graph and its client are below their limits.
+    Otherwise it waits in a FIFO queue shared by all callers; a waiter is
+    admitted as soon as its own limits allow, even when callers ahead of it
+    are still blocked on a busy graph or client. The queue holds at most
+    ``max_queue`` calls and each waits at most ``queue_timeout`` seconds;
+    past either bound the call is rejected with a retry-after hint, so a
+    burst from one agent fails fast instead of piling up on FalkorDB.
+
+    Limits of 0 disable that check.
+    """
+
+    def __init__(
+        self,
+        max_per_graph: int,
+        max_per_client: int,
+        max_queue: int,
+        queue_timeout: float,
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            max_per_graph: Concurrent calls allowed per graph (0 for no limit)
+            max_per_client: Concurrent calls allowed per client (0 for no limit)
+            max_queue: Calls allowed to wait at once (0 rejects instead of queuing)
+            queue_timeout: Seconds a call may wait before it is rejected
+        """
+        self.max_per_graph = max(0, max_per_graph)
+        self.max_per_client = max(0, max_per_client)
+        self.max_queue = max(0, max_queue)
+        self.queue_timeout = queue_timeout
+        self._active_by_graph: Dict[str, int] = {}
+        self._active_by_client: Dict[str, int] = {}
+        self._queue: Deque[_Waiter] = deque()
+        # Moving average of how long admitted calls hold their slot
+        self._avg_hold = 0.0
+        self._admitted = 0
+        self._queued = 0
+        self._rejected = {QUEUE_FULL: 0, QUEUE_TIMEOUT: 0}
+
+    @property
+    def waiting(self) -> int:
+        """Number of calls queued for admission."""
+        return len(self._queue)
+
+    def _fits(self, graph: str, client: str) -> bool:
+        return (
+            not self.max_per_graph or self._active_by_graph.get(graph, 0) < self.max_per_graph
+        ) and (
+            not self.max_per_client or self._active_by_client.get(client, 0) < self.max_per_client
+        )
+
+    def _grant(self, graph: str, client: str) -> None:
+        self._active_by_graph[graph] = self._active_by_graph.get(graph, 0) + 1
+        self._active_by_client[client] = self._active_by_client.get(client, 0) + 1
+        self._admitted += 1
+
+    def _release(self, graph: str, client: str) -> None:
+        for active, key in ((self._active_by_graph, graph), (self._active_by_client, client)):
+            remaining = active.get(key, 1) - 1
+            if remaining:
+                active[key] = remaining
+            else:
+                active.pop(key, None)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Admit queued calls whose graph and client have room, oldest first."""
+        for waiter in list(self._queue):
+            if waiter.future.done():
+                self._queue.remove(waiter)
+            elif self._fits(waiter.graph, waiter.client):
+                self._queue.remove(waiter)
+                self._grant(waiter.graph, waiter.client)
+                waiter.future.set_result(None)
+
+    def retry_after(self) -> float:
+        """
+        Estimate how long until a rejected call would be admitted.
+
+        Uses the average slot hold time scaled by the queue ahead of the
+        caller, and never suggests less than 50 ms.
+        """
+        slots = self.max_per_graph or self.max_per_client or 1
+        estimate = self._avg_hold * (1 + self.waiting / slots)
+        return round(max(0.05, estimate), 3)
+
+    def _reject(self, reason: str, message: str) -> AdmissionRejectedError:
+        self._rejected[reason] += 1
+        return AdmissionRejectedError(reason, self.retry_after(), message)
+
+    async def acquire(self, graph_name: Optional[str], client_id: Optional[str]) -> None:
+        """
+        Wait until a call on ``graph_name`` from ``client_id`` may run.
+
+        Args:
+            graph_name: Graph the call targets (None for server-level calls)
+            client_id: Calling client or session (None for anonymous calls)
+
+        Raises:
+            AdmissionRejectedError: If the queue is full or the wait exceeds
+                ``queue_timeout``
+        """
+        graph, client = graph_name or "", client_id or ANONYMOUS
+        # Queued calls are admitted the moment they fit, so any still waiting
+        # are blocked on other limits and a call that fits can go ahead
+        if self._fits(graph, client):
+            self._grant(graph, client)
+            return
+        if len(self._queue) >= self.max_queue:
+            raise self._reject(
+                QUEUE_FULL,
+                f"Too many queued calls ({len(self._queue)}/{self.max_queue}); retry later",
+            )
+
+        waiter = _Waiter(graph, client, asyncio.get_running_loop().create_future())
+        self._queue.append(waiter)
+        self._queued += 1
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), self.queue_timeout)
+        except BaseException as e:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted while we were giving up: hand the slot back
+                self._release(graph, client)
+            else:
+                waiter.future.cancel()
+                if waiter in self._queue:
+                    self._queue.remove(waiter)
+            if isinstance(e, asyncio.TimeoutError):
+                raise self._reject(
+                    QUEUE_TIMEOUT,
+                    f"Call not admitted within {self.queue_timeout}s; retry later",
+                ) from None
+            raise
+
+    def release(self, graph_name: Optional[str], client_id: Optional[str], held: float) -> None:
+        """
+        Return a slot taken by :meth:`acquire`.
+
+        Args:
+            graph_name: Graph passed to :meth:`acquire`
+            client_id: Client passed to :meth:`acquire`
+            held: Seconds the slot was held, used for retry-after estimates
+        """
+        self._avg_hold = held if not self._avg_hold else 0.9 * self._avg_hold + 0.1 * held
+        self._release(graph_name or "", client_id or ANONYMOUS)
+
+    @asynccontextmanager
+    async def admit(
+        self, graph_name: Optional[str], client_id: Optional[str]
+    ) -> AsyncIterator[None]:
+        """Hold an admission slot for the duration of the ``async with`` block."""
+        await self.acquire(graph_name, client_id)
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(graph_name, client_id, time.monotonic() - start)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report admission usage.
+
+        Returns:
+            Dictionary with limits, active calls, queue depth and rejection counts
+        """
+        waiting_by_graph: Dict[str, int] = {}
+        for waiter in self._queue:
+            key = waiter.graph or "<server>"
+            waiting_by_graph[key] = waiting_by_graph.get(key, 0) + 1
+        return {
+            "max_per_graph": self.max_per_graph,
+            "max_per_client": self.max_per_client,
+            "max_queue": self.max_queue,
+            "queue_timeout": self.queue_timeout,
+            "active": sum(self._active_by_graph.values()),
+            "active_by_graph": {
+                key or "<server>": count for key, count in self._active_by_graph.items()
+            },
+            "clients": len(self._active_by_client),
+            "waiting": self.waiting,
+            "waiting_by_graph": waiting_by_graph,
+            "admitted_total": self._admitted,
+            "queued_total": self._queued,
+            "rejected_total": sum(self._rejected.values()),
+            "rejected": dict(self._rejected),
+            "avg_hold_ms": round(self._avg_hold * 1000, 3),
+        }
@@ -0,0 +1,1259 @@
+"""Asynchronous FalkorDB service layer built on the falkordb asyncio client."""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from falkordb.asyncio import FalkorDB
+from falkordb.asyncio.graph import AsyncGraph
+from falkordb.asyncio.query_result import QueryResult
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from .admission import AdmissionController
+from .cache import (
+    GraphHandleCache,
+    GraphListCache,
+    GraphNotFoundError,
+    PlanCacheStats,
+    ResultCache,
+    SchemaCache,
+    is_missing_graph,
+)
+from .config import config
+from .counts import CountTracker
+from .cursors import KEY_PARAM, KEYSET, SKIP_LIMIT, Cursor, CursorRegistry, keyset_query
+from .cypher import resolve_read_only, restore_literals
+from .health import HealthProber
+from .inference import (
+    NODE,
+    RELATIONSHIP,
+    EntityProfile,
+    InferenceCache,
+    InferredSchema,
+    plan_probes,
+    probe_query,
+    reservoir,
+    unique_rows,
+)
+from .metadata import (
+    SCHEMA_PROCEDURES,
+    build_metadata,
+    changes_schema,
+    changes_structure,
+    count_queries,
+    first_column,
+)
+from .paging import Page, paged_query, plan_page, resolve_vectors
+from .pool import FairConnectionPool, IdleConnectionPool, PoolTimeoutError
+from .replicas import Replica, ReplicaRouter
+from .service import (
+    QUERY_CMD,
+    RO_QUERY_CMD,
+    _cached_result,
+    _cached_size,
+    _elapsed_ms,
+    _has_writes,
+    _prepare_query,
+    _query_result_to_dict,
+    _query_statistics,
+    _serialize_row,
+    _serialize_rows,
+    _set_continuation,
+    _timed_result_to_dict,
+)
+from .singleflight import SingleFlight
+from .timeouts import (
+    CLIENT,
+    SERVER,
+    QueryTimeoutError,
+    client_deadline,
+    is_server_timeout,
+    resolve_timeout,
+)
+
+logger = logging.getLogger(__name__)
+
+# Keyspace notification channels of every database
+KEYSPACE_CHANNELS = "__keyspace@*__:*"
+
+# Keyspace events after which a key no longer exists under its name
+KEY_REMOVED_EVENTS = frozenset(
+    {"del", "expired", "evicted", "rename_from", "move_from"}
+)
+
+
+def _text(value: Any) -> str:
+    """Decode a pub/sub field that may arrive as bytes."""
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+class AsyncFalkorDBService:
+    """Asyncio service for interacting with FalkorDB graph database.
+
+    Mirrors :class:`~falkordb_mcp.service.FalkorDBService`, but every database
+    call is awaited so many in-flight queries can overlap on one event loop.
+    Calls are spread over a bounded connection pool with per-graph fair queuing,
+    and read-only calls are balanced across any configured read replicas.
+    """
+
+    def __init__(self):
+        """Initialize async FalkorDB service (call :meth:`initialize` before use)."""
+        self._client: Optional[FalkorDB] = None
+        self._graphs = GraphHandleCache(config.graph_cache_size)
+        self.results = ResultCache(config.result_cache_max_bytes, config.result_cache_ttl)
+        self.schema = SchemaCache(config.schema_cache_ttl)
+        self.inference = InferenceCache(config.schema_cache_ttl)
+        self.counts = CountTracker()
+        self.graph_list = GraphListCache(config.graph_list_ttl)
+        self.health = HealthProber(config.health_interval, config.health_window)
+        self.inflight = SingleFlight()
+        self.plan_cache = PlanCacheStats()
+        self.cursors = CursorRegistry(config.cursor_ttl, config.cursor_max_open)
+        self.admission = AdmissionController(
+            max_per_graph=config.admission_max_per_graph,
+            max_per_client=config.admission_max_per_client,
+            max_queue=config.admission_queue_size,
+            queue_timeout=config.admission_queue_timeout,
+        )
+        self._connection_pool: Optional[IdleConnectionPool] = None
+        self._reaper: Optional[asyncio.Task] = None
+        self._health_checker: Optional[asyncio.Task] = None
+        self._reconciler: Optional[asyncio.Task] = None
+        self._keyspace_watcher: Optional[asyncio.Task] = None
+        self._prober: Optional[asyncio.Task] = None
+        self.pool = FairConnectionPool(
+            max_size=config.pool_max_size,
+            max_per_graph=config.pool_max_per_graph,
+            acquire_timeout=config.pool_acquire_timeout,
+        )
+        self.replicas = ReplicaRouter(
+            [], config.replica_strategy, config.replica_max_latency_ms
+        )
+
+    @staticmethod
+    def _reserved_connections() -> int:
+        """
+        Primary connections used outside the fair pool's leases.
+
+        The health prober holds one connection at a time, and the keyspace
+        watcher holds one for its subscription. The primary's redis pool is
+        sized for them on top of FALKORDB_POOL_MAX_SIZE, so they never take
+        a connection a leased query is entitled to.
+        """
+        return 1 + (1 if config.graph_list_notifications else 0)
+
+    def _make_connection_pool(
+        self, host: str, port: int, reserved: int = 0
+    ) -> IdleConnectionPool:
+        """Create a bounded redis connection pool for one FalkorDB endpoint."""
+        return IdleConnectionPool(
+            host=host,
+            port=port,
+            username=config.username,
+            password=config.password,
+            decode_responses=True,
+            max_connections=self.pool.max_size + reserved,
+            timeout=config.pool_acquire_timeout,
+        )
+
+    async def initialize(self) -> None:
+        """Initialize connection pool to FalkorDB."""
+        try:
+            self._connection_pool = self._make_connection_pool(
+                config.host, config.port, self._reserved_connections()
+            )
+            self._client = FalkorDB(connection_pool=self._connection_pool)
+            # Test connection and open the minimum number of pooled connections
+            await asyncio.gather(
+                *(self._client.connection.ping() for _ in range(max(1, config.pool_min_size)))
+            )
+            self._reaper = asyncio.create_task(self._reap_idle_connections())
+            # Probe once up front so status has readings from the start
+            await self.health.probe(self._client.connection)
+            if config.health_interval > 0:
+                self._prober = asyncio.create_task(self._probe_health())
+            if config.stats_reconcile_interval > 0:
+                self._reconciler = asyncio.create_task(self._reconcile_counts())
+            if config.graph_list_notifications:
+                self._keyspace_watcher = asyncio.create_task(self._watch_keyspace())
+            logger.info(
+                f"✓ Connected to FalkorDB (asyncio) at {config.host}:{config.port}"
+            )
+        except Exception as e:
+            logger.error(f"Failed to connect to FalkorDB: {e}")
+            raise
+
+        if config.replicas:
+            self.replicas.replicas = [
+                Replica(
+                    host,
+                    port,
+                    self._make_connection_pool(host, port),
+                    config.graph_cache_size,
+                )
+                for host, port in config.replicas
+            ]
+            # A replica that is down at startup just starts out of rotation
+            await self.replicas.check_all()
+            self._health_checker = asyncio.create_task(self._check_replicas())
+            logger.info(
+                f"✓ Routing reads across {len(self.replicas.replicas)} replica(s) "
+                f"({self.replicas.strategy})"
+            )
+
+    async def _check_replicas(self) -> None:
+        """Periodically health-check replicas to update the read rotation."""
+        while True:
+            await asyncio.sleep(config.replica_health_interval)
+            try:
+                await self.replicas.check_all()
+            except Exception as e:
+                logger.warning(f"Error health-checking FalkorDB replicas: {e}")
+
+    async def _probe_health(self) -> None:
+        """Periodically refresh the health readings served by falkordb://status."""
+        while True:
+            await asyncio.sleep(config.health_interval)
+            await self.health.probe(self.client.connection)
+
+    async def _reconcile_counts(self) -> None:
+        """Periodically re-count graphs whose tracked counts drifted or aged."""
+        # Drifted graphs are picked up within a tenth of the interval
+        interval = max(1.0, config.stats_reconcile_interval / 10)
+        while True:
+            await asyncio.sleep(interval)
+            await self.reconcile_counts()
+
+    async def reconcile_counts(self) -> List[str]:
+        """
+        Re-count every tracked graph that is due for reconciliation.
+
+        A graph that can no longer be counted (e.g. it was deleted) stops
+        being tracked.
+
+        Returns:
+            Names of the graphs re-counted
+        """
+        reconciled = []
+        for graph_name in self.counts.due(config.stats_reconcile_interval):
+            try:
+                await self._fetch_metadata(graph_name)
+                reconciled.append(graph_name)
+            except Exception as e:
+                logger.warning(f"Error reconciling counts of graph '{graph_name}': {e}")
+                self.counts.forget(graph_name)
+        return reconciled
+
+    async def _watch_keyspace(self) -> None:
+        """Invalidate the cached graph list on keyspace notifications.
+
+        FalkorDB must publish them (e.g. ``notify-keyspace-events KA``).
+        Notifications missed while resubscribing are covered by
+        invalidating the list on every (re)subscription.
+        """
+        while True:
+            pubsub = self.client.connection.pubsub()
+            try:
+                await pubsub.psubscribe(KEYSPACE_CHANNELS)
+                self.graph_list.invalidate()
+                async for message in pubsub.listen():
+                    if message.get("type") == "pmessage":
+                        self.on_keyspace_event(message["channel"], message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Error watching FalkorDB keyspace notifications: {e}")
+                await asyncio.sleep(1.0)
+            finally:
+                await pubsub.aclose()
+
+    def on_keyspace_event(self, channel: Any, event: Any) -> None:
+        """
+        Invalidate the cached graph list if a notification may change it.
+
+        Args:
+            channel: ``__keyspace@<db>__:<key>`` channel of the notification
+            event: Event name, such as ``del`` or ``rename_to``
+        """
+        key = _text(channel).split("__:", 1)[-1]
+        known = self.graph_list.get()
+        if known is None:
+            return
+        if _text(event) in KEY_REMOVED_EVENTS and key in known:
+            self.graph_list.invalidate()
+            self.evict_graph(key)
+        elif key not in known:
+            # Any event on an unlisted key may be a graph being created
+            self.graph_list.invalidate()
+
+    async def _reap_idle_connections(self) -> None:
+        """Periodically close connections idle longer than the idle timeout."""
+        interval = max(1.0, config.pool_idle_timeout / 2)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self._connection_pool.disconnect_idle(
+                    config.pool_idle_timeout, keep=config.pool_min_size
+                )
+                for replica in self.replicas.replicas:
+                    await replica.connection_pool.disconnect_idle(
+                        config.pool_idle_timeout, keep=config.pool_min_size
+                    )
+            except Exception as e:
+                logger.warning(f"Error closing idle FalkorDB connections: {e}")
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Report connection pool utilization.
+
+        Returns:
+            Dictionary with slot usage, queue depth and open connection counts
+        """
+        stats = self.pool.stats()
+        stats["min_size"] = config.pool_min_size
+        stats["idle_timeout"] = config.pool_idle_timeout
+        stats["acquire_timeout"] = config.pool_acquire_timeout
+        stats["reserved_connections"] = self._reserved_connections()
+        if self._connection_pool is not None:
+            stats["open_connections"] = self._connection_pool.open_connections()
+        return stats
+
+    @property
+    def client(self) -> FalkorDB:
+        """Get FalkorDB asyncio client instance."""
+        if self._client is None:
+            raise RuntimeError("FalkorDB client not initialized")
+        return self._client
+
+    def select_graph(self, graph_name: str) -> AsyncGraph:
+        """
+        Get a graph handle, reusing a cached one when available.
+
+        Args:
+            graph_name: Name of the graph
+
+        Returns:
+            Graph handle bound to the FalkorDB client
+        """
+        return self._graphs.get(graph_name, self.client.select_graph)
+
+    def evict_graph(self, graph_name: str) -> None:
+        """Forget the cached handle of a graph that was deleted."""
+        self._graphs.evict(graph_name)
+        self.graph_list.invalidate()
+        for replica in self.replicas.replicas:
+            replica.graphs.evict(graph_name)
+
+    async def _read(
+        self, graph_name: Optional[str], call: Callable[[Any], Awaitable[Any]]
+    ) -> Any:
+        """
+        Run a read-only call on a replica, falling back to the primary.
+
+        Replica calls hold a fair-pool lease like primary calls. Only
+        connection-level failures take a replica out of rotation; running out
+        of pooled connections to it is load, not a fault, and is raised.
+
+        Args:
+            graph_name: Graph the call targets (None for server-level commands)
+            call: Coroutine function receiving a graph handle, or the client
+                when ``graph_name`` is None
+
+        Returns:
+            Whatever ``call`` returns
+        """
+        replica = self.replicas.choose()
+        if replica is not None:
+            target = replica.select_graph(graph_name) if graph_name else replica.client
+            async with self.pool.lease(graph_name):
+                try:
+                    async with self.replicas.track(replica):
+                        return await call(target)
+                except (RedisConnectionError, RedisTimeoutError) as e:
+                    # Connection-level failure: pull the replica and retry on the primary
+                    self.replicas.mark_down(replica, e)
+
+        target = self.select_graph(graph_name) if graph_name else self.client
+        async with self.pool.lease(graph_name):
+            return await call(target)
+
+    def _record_write(self, graph_name: str, query: str, statistics: Dict[str, Any]) -> None:
+        """Drop cached results and metadata that a write made stale, and update counts."""
+        self.counts.apply(graph_name, query, statistics)
+        if _has_writes(statistics):
+            self.results.invalidate_graph(graph_name)
+        if changes_schema(statistics):
+            self.schema.invalidate(graph_name)
+        if changes_structure(statistics):
+            self.inference.mark_stale(graph_name)
+        elif _has_writes(statistics):
+            self.inference.mark_changed(graph_name)
+
+    def _record_failed_write(self, graph_name: str) -> None:
+        """
+        Drop everything a write that failed or timed out may have changed.
+
+        A write cancelled at the client deadline can still commit on the
+        server, and its statistics are lost, so the graph's cached results,
+        schema, inferred profiles, counts and graph list are all treated as
+        stale rather than trusted until their TTLs expire.
+        """
+        self.results.invalidate_graph(graph_name)
+        self.schema.invalidate(graph_name)
+        self.inference.mark_stale(graph_name)
+        self.counts.mark_drifted(graph_name)
+        self.graph_list.record_write(graph_name)
+
+    async def _run(
+        self,
+        graph_name: str,
+        query: str,
+        params: Dict[str, Any],
+        read_only: bool,
+        timeout_ms: int,
+    ) -> Tuple[Any, float]:
+        """
+        Send a prepared query: reads to a replica or the primary, writes to the primary.
+
+        A non-zero ``timeout_ms`` is passed to FalkorDB, which aborts the
+        query once it expires. The client additionally stops waiting after
+        the timeout plus FALKORDB_QUERY_TIMEOUT_GRACE_MS, which drops the
+        connection, so a stalled server or network cannot hold a pool slot.
+
+        Returns:
+            Tuple of the QueryResult and the time spent waiting on FalkorDB,
+            measured inside the lease so pool queuing is not counted
+
+        Reads against a graph known not to exist fail without a round trip.
+        A write that fails or times out may still have committed, so it
+        invalidates the graph's caches as if it had succeeded.
+
+        Raises:
+            GraphNotFoundError: If a read targets a graph known not to exist
+            QueryTimeoutError: If the query ran past its timeout
+        """
+        if read_only and self.graph_list.missing(graph_name):
+            raise GraphNotFoundError(graph_name)
+        network_ms = 0.0
+
+        async def call(graph: AsyncGraph) -> Any:
+            nonlocal network_ms
+            start = time.perf_counter()
+            send = graph.ro_query if read_only else graph.query
+            try:
+                if timeout_ms:
+                    result = await asyncio.wait_for(
+                        send(query, params, timeout=timeout_ms), client_deadline(timeout_ms)
+                    )
+                else:
+                    result = await send(query, params)
+            except PoolTimeoutError:
+                # A TimeoutError subclass, but the query never left the pool
+                raise
+            except asyncio.TimeoutError as e:
+                raise QueryTimeoutError(timeout_ms, _elapsed_ms(start), CLIENT) from e
+            except Exception as e:
+                if is_server_timeout(e):
+                    raise QueryTimeoutError(timeout_ms, _elapsed_ms(start), SERVER) from e
+                if read_only and is_missing_graph(e):
+                    self.graph_list.mark_missing(graph_name)
+                raise
+            network_ms = _elapsed_ms(start)
+            return result
+
+        if read_only:
+            result = await self._read(graph_name, call)
+        else:
+            graph = self.select_graph(graph_name)
+            async with self.pool.lease(graph_name):
+                try:
+                    result = await call(graph)
+                except (Exception, asyncio.CancelledError):
+                    self._record_failed_write(graph_name)
+                    raise
+            self.graph_list.record_write(graph_name)
+        return result, network_ms
+
+    async def execute_query(
+        self,
+        graph_name: str,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        read_only: Optional[bool] = None,
+        parameterize: Optional[bool] = None,
+        max_rows: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        continuation: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        vectors: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Execute a Cypher query against a FalkorDB graph.
+
+        Read-only queries are sent with GRAPH.RO_QUERY so FalkorDB can run them
+        on its concurrent reader threads and on replicas, and their results
+        are cached until the TTL expires or the graph is written to.
+        Concurrent identical reads share a single execution.
+
+        Results are cut off at a row and size budget. A truncated read
+        carries a ``continuation`` token that fetches the rows after it when
+        passed back with the same graph, query and parameters.
+
+        Args:
+            graph_name: Name of the graph to query
+            query: Cypher query to execute
+            params: Optional query parameters
+            read_only: None to classify the query automatically, True to force
+                the read-only path (rejecting writes), False to force a write
+            parameterize: Lift inline literals into parameters so query
+                variants share one FalkorDB plan (None uses the config default)
+            max_rows: Row budget (None uses the config default, 0 is unlimited)
+            max_bytes: Encoded size budget in bytes (None uses the config
+                default, 0 is unlimited)
+            continuation: Token from a previous truncated response
+            timeout_ms: Query timeout (None uses the config default, 0
+                disables it)
+            vectors: Vector projection of the returned rows (None uses
+                the config default), applied before the size budget
+
+        Returns:
+            Dictionary with query results and metadata
+
+        Raises:
+            ReadOnlyViolationError: If read_only is True and the query writes
+            InvalidContinuationError: If the continuation token does not
+                belong to this query
+            QueryTimeoutError: If the query ran past its timeout
+            Exception: If query execution fails
+        """
+        try:
+            read_only = resolve_read_only(query, read_only)
+            page = plan_page(
+                graph_name, query, params, read_only, max_rows, max_bytes, continuation, vectors
+            )
+            timeout_ms = resolve_timeout(timeout_ms)
+            if not read_only:
+                sent_query, sent_params, literals = _prepare_query(query, params, parameterize)
+                result, network_ms = await self._run(
+                    graph_name, sent_query, sent_params, False, timeout_ms
+                )
+                data, _ = _timed_result_to_dict(result, literals, network_ms, page)
+                self.plan_cache.record(data["statistics"]["cached_execution"], len(literals))
+                self._record_write(graph_name, query, data["statistics"])
+                return data
+
+            cache_key = self.results.make_key(
+                graph_name,
+                query,
+                params,
+                page.offset,
+                page.max_rows,
+                page.max_bytes,
+                page.vectors,
+            )
+            cached = self.results.get(cache_key) if self.results.enabled else None
+            if cached is not None:
+                return _cached_result(cached)
+            generation = self.results.generation(graph_name)
+
+            async def fetch() -> Dict[str, Any]:
+                sent_query, sent_params, literals = _prepare_query(
+                    query, params, parameterize, page
+                )
+                result, network_ms = await self._run(
+                    graph_name, sent_query, sent_params, True, timeout_ms
+                )
+                data, rows_size = _timed_result_to_dict(result, literals, network_ms, page)
+                _set_continuation(data, graph_name, query, params, page)
+                self.plan_cache.record(data["statistics"]["cached_execution"], len(literals))
+                self.results.put(
+                    cache_key, data, _cached_size(data, rows_size), generation=generation
+                )
+                return data
+
+            # Identical reads already in flight share one execution; the
+            # generation keeps reads issued after a write from joining a
+            # flight that started before it, and the timeout keeps a caller
+            # from waiting on a flight with a longer deadline than its own
+            return await self.inflight.do((*cache_key, generation, timeout_ms), fetch)
+        except Exception as e:
+            sanitized_graph = graph_name.replace("\n", "").replace("\r", "")
+            logger.error(
+                f"Error executing query on graph '{sanitized_graph}': {e}"
+            )
+            raise
+
+    async def stream_query(
+        self,
+        graph_name: str,
+        query: str,
+        on_chunk: Callable[[Dict[str, Any], int, int], Awaitable[None]],
+        params: Optional[Dict[str, Any]] = None,
+        read_only: Optional[bool] = None,
+        chunk_rows: Optional[int] = None,
+        timeout_ms: Optional[int] = None,
+        parameterize: Optional[bool] = None,
+        vectors: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Execute a query and hand its rows over in chunks as they are serialized.
+
+        The whole reply is received and parsed first; only the conversion to
+        JSON is chunked. Each chunk is serialized and passed to ``on_chunk``
+        before the next one is converted, so no single response has to hold
+        every encoded row, but the parsed rows are all in memory and the
+        first chunk waits for the full query and transfer. Streamed results
+        bypass the result cache and the row/byte budgets, which exist to
+        bound single responses.
+
+        Args:
+            graph_name: Name of the graph to query
+            query: Cypher query to execute
+            on_chunk: Coroutine function called with each chunk (a dictionary
+                with ``result_set`` and ``headers``), the number of rows sent
+                before it and the total row count
+            params: Optional query parameters
+            read_only: None to classify the query automatically, True to force
+                the read-only path (rejecting writes), False to force a write
+            chunk_rows: Rows per chunk (None uses the config default)
+            timeout_ms: Query timeout (None uses the config default, 0
+                disables it)
+            parameterize: Lift inline literals into parameters (None uses
+                the config default)
+            vectors: Vector projection of each chunk's rows (None uses
+                FALKORDB_VECTOR_POLICY)
+
+        Returns:
+            Dictionary with headers, statistics, row and chunk counts, and
+            timings including ``first_chunk_ms``
+
+        Raises:
+            ReadOnlyViolationError: If read_only is True and the query writes
+            ValueError: If chunk_rows is not positive or the vector policy
+                is unknown
+            QueryTimeoutError: If the query ran past its timeout
+            Exception: If query execution fails
+        """
+        try:
+            chunk_rows = config.stream_chunk_rows if chunk_rows is None else chunk_rows
+            if chunk_rows <= 0:
+                raise ValueError("chunk_rows must be positive")
+            page = Page(vectors=resolve_vectors(vectors))
+            timeout_ms = resolve_timeout(timeout_ms)
+            started = time.perf_counter()
+            read_only = resolve_read_only(query, read_only)
+            sent_query, sent_params, literals = _prepare_query(query, params, parameterize)
+            result, network_ms = await self._run(
+                graph_name, sent_query, sent_params, read_only, timeout_ms
+            )
+            statistics = _query_statistics(result)
+            self.plan_cache.record(statistics["cached_execution"], len(literals))
+            if not read_only:
+                self._record_write(graph_name, query, statistics)
+
+            headers = restore_literals(result.header, literals) if result.header else []
+            rows = result.result_set or []
+            serialize_ms = 0.0
+            first_chunk_ms = None
+            chunks = 0
+            for offset in range(0, len(rows), chunk_rows):
+                start = time.perf_counter()
+                chunk, _, _ = _serialize_rows(rows[offset:offset + chunk_rows], page)
+                serialize_ms += _elapsed_ms(start)
+                await on_chunk({"result_set": chunk, "headers": headers}, offset, len(rows))
+                chunks += 1
+                if first_chunk_ms is None:
+                    first_chunk_ms = _elapsed_ms(started)
+
+            return {
+                "headers": headers,
+                "statistics": statistics,
+                "row_count": len(rows),
+                "chunks": chunks,
+                "timings": {
+                    "network_ms": network_ms,
+                    "serialize_ms": round(serialize_ms, 3),
+                    "first_chunk_ms": first_chunk_ms,
+                    "result_cache_hit": False,
+                },
+            }
+        except Exception as e:
+            sanitized_graph = graph_name.replace("\n", "").replace("\r", "")
+            logger.error(
+                f"Error streaming query on graph '{sanitized_graph}': {e}"
+            )
+            raise
+
+    async def execute_batch(self, queries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Execute several Cypher queries in one pipelined round trip per graph.
+
+        Each graph's commands are queued on one primary connection, held
+        under that graph's pool lease, and sent together; FalkorDB runs them
+        in order. The pipelines of different graphs run concurrently. A
+        failing item does not stop the others. Graph-list bookkeeping matches :meth:`execute_query`:
+        reads against a graph known not to exist fail without being sent,
+        and writes may create their graph.
+
+        Args:
+            queries: Items with ``graph_name``, ``query`` and optional
+                ``params``, ``read_only`` and ``timeout_ms`` keys
+
+        Returns:
+            Dictionary with per-item ``results`` (each with ``graph_name``,
+            ``success``, ``data`` or ``error``, and ``timings``) and the
+            longest pipeline round trip
+
+        Raises:
+            ValueError: If the batch is empty or larger than the configured limit
+            QueryTimeoutError: If a graph's pipeline ran past the sum of its
+                item timeouts
+            Exception: If a pipeline itself fails
+        """
+        if not queries:
+            raise ValueError("Batch must contain at least one query")
+        if len(queries) > config.batch_max_size:
+            raise ValueError(
+                f"Batch of {len(queries)} queries exceeds the limit of {config.batch_max_size}"
+            )
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+        # Items per graph, in batch order; each graph gets its own pipeline
+        # and pool lease so the per-graph cap applies to batches too
+        queued: Dict[str, List[Tuple[int, AsyncGraph, str, Dict[str, Any], bool, int]]] = {}
+        for index, item in enumerate(queries):
+            try:
+                if not isinstance(item, dict) or not (item.get("graph_name") and item.get("query")):
+                    raise ValueError("Batch items need 'graph_name' and 'query'")
+                graph_name = item["graph_name"]
+                query = item["query"]
+                params = item.get("params") or {}
+                read_only = resolve_read_only(query, item.get("read_only"))
+                if read_only and self.graph_list.missing(graph_name):
+                    raise GraphNotFoundError(graph_name)
+                timeout_ms = resolve_timeout(item.get("timeout_ms"))
+                graph = self.select_graph(graph_name)
+                queued.setdefault(graph_name, []).append(
+                    (index, graph, query, params, read_only, timeout_ms)
+                )
+            except Exception as e:
+                results[index] = {"success": False, "error": str(e)}
+
+        async def run(graph_name: str, items: List[Tuple[Any, ...]]) -> float:
+            pipe = self.client.connection.pipeline(transaction=False)
+            # FalkorDB runs the items one after another, so the client waits for
+            # the sum of their timeouts; a single unbounded item lifts the deadline
+            total_timeout_ms: Optional[int] = 0
+            for _, graph, query, params, read_only, timeout_ms in items:
+                command = RO_QUERY_CMD if read_only else QUERY_CMD
+                args = [graph._build_params_header(params) + query, "--compact"]
+                if timeout_ms:
+                    args += ["timeout", timeout_ms]
+                pipe.execute_command(command, graph_name, *args)
+                if not timeout_ms:
+                    total_timeout_ms = None
+                elif total_timeout_ms is not None:
+                    total_timeout_ms += timeout_ms
+
+            async with self.pool.lease(graph_name):
+                start = time.perf_counter()
+                if total_timeout_ms:
+                    try:
+                        responses = await asyncio.wait_for(
+                            pipe.execute(raise_on_error=False), client_deadline(total_timeout_ms)
+                        )
+                    except PoolTimeoutError:
+                        raise
+                    except asyncio.TimeoutError as e:
+                        raise QueryTimeoutError(
+                            total_timeout_ms, _elapsed_ms(start), CLIENT
+                        ) from e
+                else:
+                    responses = await pipe.execute(raise_on_error=False)
+                round_trip_ms = (time.perf_counter() - start) * 1000
+
+            for queued_item, response in zip(items, responses):
+                index, graph, query, params, read_only, timeout_ms = queued_item
+                start = time.perf_counter()
+                try:
+                    if is_server_timeout(response):
+                        raise QueryTimeoutError(timeout_ms, round(round_trip_ms, 3), SERVER)
+                    if isinstance(response, Exception):
+                        if read_only and is_missing_graph(response):
+                            self.graph_list.mark_missing(graph_name)
+                        raise response
+                    result = QueryResult(graph)
+                    await result.parse(response)
+                    # Batches are never rewritten; the default budgets apply
+                    # on the client and execute_query fetches the rest
+                    page = plan_page(graph_name, query, params, read_only)
+                    data, _ = _query_result_to_dict(result, page=page)
+                    self.plan_cache.record(data["statistics"]["cached_execution"])
+                    if read_only:
+                        _set_continuation(data, graph_name, query, params, page)
+                    else:
+                        self.graph_list.record_write(graph_name)
+                        self._record_write(graph_name, query, data["statistics"])
+                    results[index] = {
+                        "success": True,
+                        "data": data,
+                        "timings": {
+                            "run_time_ms": data["statistics"]["run_time_ms"],
+                            "parse_ms": _elapsed_ms(start),
+                        },
+                    }
+                except Exception as e:
+                    if not read_only:
+                        self._record_failed_write(graph_name)
+                    results[index] = {"success": False, "error": str(e)}
+            return round_trip_ms
+
+        try:
+            outcomes = await asyncio.gather(
+                *(run(graph_name, items) for graph_name, items in queued.items()),
+                return_exceptions=True,
+            )
+        except asyncio.CancelledError:
+            outcomes = [asyncio.CancelledError()]
+        errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        if errors:
+            # Writes left without a parsed reply may still have committed
+            for items in queued.values():
+                for index, graph, _, _, read_only, _ in items:
+                    if not read_only and results[index] is None:
+                        self._record_failed_write(graph.name)
+            logger.error(f"Error executing query batch: {errors[0]}")
+            raise errors[0]
+
+        for item, result in zip(queries, results):
+            result["graph_name"] = item.get("graph_name") if isinstance(item, dict) else None
+        return {
+            "results": results,
+            "count": len(results),
+            "succeeded": sum(1 for result in results if result["success"]),
+            "failed": sum(1 for result in results if not result["success"]),
+            "round_trip_ms": round(max(outcomes, default=0.0), 3),
+        }
+
+    async def open_cursor(
+        self,
+        graph_name: str,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: Optional[int] = None,
+        vectors: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Open a server-side cursor over a read-only query and fetch its first page.
+
+        The cursor keeps the query, parameters and position, so each page
+        only asks FalkorDB for the rows it returns. Single-node matches are
+        paged by node id (keyset), which stays fast however deep the walk
+        goes; other queries ending in RETURN use SKIP/LIMIT, and the rest are
+        re-run with the rows before the position discarded.
+
+        Args:
+            graph_name: Name of the graph to query
+            query: Read-only Cypher query
+            params: Optional query parameters
+            page_size: Rows per page (None uses the config default)
+            vectors: Vector projection of the page's rows (None uses
+                FALKORDB_VECTOR_POLICY)
+
+        Returns:
+            First page, as returned by :meth:`fetch_cursor`
+
+        Raises:
+            ReadOnlyViolationError: If the query writes
+            ValueError: If page_size is not positive or the vector policy is
+                unknown
+            Exception: If query execution fails
+        """
+        try:
+            resolve_read_only(query, True)
+            page_size = config.cursor_page_size if page_size is None else page_size
+            if page_size <= 0:
+                raise ValueError("page_size must be positive")
+            vectors = resolve_vectors(vectors)
+            cursor = self.cursors.open(graph_name, query, params, page_size)
+            return await self._fetch_page(cursor, page_size, vectors)
+        except Exception as e:
+            sanitized_graph = graph_name.replace("\n", "").replace("\r", "")
+            logger.error(f"Error opening cursor on graph '{sanitized_graph}': {e}")
+            raise
+
+    async def fetch_cursor(
+        self, cursor_id: str, page_size: Optional[int] = None, vectors: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch the next page of an open cursor.
+
+        A cursor closes itself once its last page has been fetched.
+
+        Args:
+            cursor_id: Id returned by :meth:`open_cursor`
+            page_size: Rows for this page (None keeps the cursor's page size)
+            vectors: Vector projection of the page's rows (None uses
+                FALKORDB_VECTOR_POLICY)
+
+        Returns:
+            Dictionary with result_set, headers, statistics and timings, plus
+            ``cursor_id``, ``strategy``, ``position`` (rows returned so far),
+            ``has_more`` and ``expires_in`` seconds
+
+        Raises:
+            ValueError: If the cursor is unknown or expired, page_size is not
+                positive, or the vector policy is unknown
+            Exception: If query execution fails
+        """
+        try:
+            cursor = self.cursors.get(cursor_id)
+            page_size = cursor.page_size if page_size is None else page_size
+            if page_size <= 0:
+                raise ValueError("page_size must be positive")
+            return await self._fetch_page(cursor, page_size, resolve_vectors(vectors))
+        except Exception as e:
+            logger.error(f"Error fetching cursor: {e}")
+            raise
+
+    def close_cursor(self, cursor_id: str) -> bool:
+        """
+        Close a cursor before its last page.
+
+        Args:
+            cursor_id: Id returned by :meth:`open_cursor`
+
+        Returns:
+            True if the cursor was open
+        """
+        return self.cursors.close(cursor_id)
+
+    async def _fetch_page(self, cursor: Cursor, page_size: int, vectors: str) -> Dict[str, Any]:
+        """Run one page of a cursor's query and advance its position."""
+        async with cursor.lock:
+            # One row past the page tells whether more follow
+            page = Page(max_rows=page_size, max_bytes=config.result_max_bytes, vectors=vectors)
+            if cursor.strategy == KEYSET:
+                sent_query = keyset_query(cursor.query, cursor.key_variable, page_size + 1)
+                sent_params = {**cursor.params, KEY_PARAM: cursor.last_key}
+            elif cursor.strategy == SKIP_LIMIT:
+                sent_query = paged_query(cursor.query, cursor.position, page_size + 1)
+                sent_params = cursor.params
+            else:
+                sent_query, sent_params = cursor.query, cursor.params
+                page.offset = cursor.position
+            result, network_ms = await self._run(
+                cursor.graph_name, sent_query, sent_params, True, resolve_timeout(None)
+            )
+            keys: List[Any] = []
+            if cursor.strategy == KEYSET and result.result_set:
+                # Split off the _cursor_key column added by keyset_query
+                keys = [row[-1] for row in result.result_set]
+                result.result_set = [row[:-1] for row in result.result_set]
+                result.header = result.header[:-1]
+            data, _ = _timed_result_to_dict(result, {}, network_ms, page)
+            self.plan_cache.record(data["statistics"]["cached_execution"])
+
+            returned = len(data["result_set"])
+            cursor.position += returned
+            if returned and keys:
+                cursor.last_key = keys[returned - 1]
+            has_more = data.pop("truncated")
+            del data["continuation"]
+            if not has_more:
+                self.cursors.close(cursor.id)
+            cursor.last_used = time.monotonic()
+            return {
+                **data,
+                "cursor_id": cursor.id,
+                "strategy": cursor.strategy,
+                "position": cursor.position,
+                "has_more": has_more,
+                "expires_in": self.cursors.expires_in(cursor) if has_more else 0.0,
+            }
+
+    async def list_graphs(self) -> List[str]:
+        """
+        List all available graphs in FalkorDB.
+
+        The reply is cached for FALKORDB_GRAPH_LIST_TTL seconds, or until a
+        write through this service creates a graph (or, with
+        FALKORDB_GRAPH_LIST_NOTIFICATIONS, a keyspace notification arrives).
+
+        Returns:
+            List of graph names
+
+        Raises:
+            Exception: If listing fails
+        """
+        try:
+            cached = self.graph_list.get()
+            if cached is not None:
+                return cached
+            generation = self.graph_list.generation
+            graphs = await self._read(None, lambda client: client.list_graphs())
+            self.graph_list.put(graphs, generation)
+            self._graphs.retain(graphs)
+            for replica in self.replicas.replicas:
+                replica.graphs.retain(graphs)
+            return graphs
+        except Exception as e:
+            logger.error(f"Error listing FalkorDB graphs: {e}")
+            raise
+
+    @staticmethod
+    async def _pipeline(graph: AsyncGraph, queries: List[str]) -> List[QueryResult]:
+        """
+        Send read-only queries in one pipelined round trip on the graph's client.
+
+        Raises:
+            Exception: The first query error, if any query failed
+        """
+        pipe = graph.client.connection.pipeline(transaction=False)
+        for query in queries:
+            pipe.execute_command(RO_QUERY_CMD, graph.name, query, "--compact")
+        responses = await pipe.execute(raise_on_error=False) if queries else []
+        results = []
+        for response in responses:
+            if isinstance(response, Exception):
+                raise response
+            result = QueryResult(graph)
+            await result.parse(response)
+            results.append(result)
+        return results
+
+    async def get_graph_metadata(self, graph_name: str) -> Dict[str, Any]:
+        """
+        Get metadata about a specific graph.
+
+        Labels, relationship types, property keys and indexes are fetched in
+        one pipelined round trip and the per-label and per-type counts in a
+        second, both on a replica when one is available. The result is cached
+        until FALKORDB_SCHEMA_CACHE_TTL expires or a write through this
+        service changes the schema or counts.
+
+        Args:
+            graph_name: Name of the graph
+
+        Returns:
+            Dictionary containing graph metadata with:
+                - name: Graph name
+                - labels: List of node label strings
+                - relationship_types: List of relationship type strings
+                - property_keys: List of property key strings
+                - indexes: Rows of ``CALL db.indexes()`` keyed by column
+                - node_counts: Node count per label
+                - relationship_counts: Relationship count per type
+                - cache_hit: Whether the metadata came from the schema cache
+
+        Raises:
+            Exception: If metadata retrieval fails
+        """
+        try:
+            cached = self.schema.get(graph_name)
+            if cached is not None:
+                return {**cached, "cache_hit": True}
+            metadata = await self._fetch_metadata(graph_name)
+            return {**metadata, "cache_hit": False}
+        except Exception as e:
+            sanitized = graph_name.replace("\n", "").replace("\r", "")
+            logger.error(f"Error getting metadata for graph '{sanitized}': {e}")
+            raise
+
+    async def _fetch_metadata(self, graph_name: str) -> Dict[str, Any]:
+        """Query a graph's metadata, cache it and re-seed its tracked counts."""
+        generation = self.schema.generation(graph_name)
+        count_generation = self.counts.generation(graph_name)
+
+        async def fetch(graph: AsyncGraph) -> Dict[str, Any]:
+            schema_results = await self._pipeline(graph, list(SCHEMA_PROCEDURES))
+            count_results = await self._pipeline(graph, count_queries(
+                first_column(schema_results[0]), first_column(schema_results[1])
+            ))
+            return build_metadata(graph_name, schema_results, count_results, _serialize_row)
+
+        metadata = await self._read(graph_name, fetch)
+        self.schema.put(graph_name, metadata, generation)
+        self.counts.seed(
+            graph_name,
+            metadata["node_counts"],
+            metadata["relationship_counts"],
+            count_generation,
+        )
+        return metadata
+
+    async def get_graph_stats(self, graph_name: str) -> Dict[str, Any]:
+        """
+        Get node counts per label and relationship counts per type.
+
+        The first call for a graph counts once (through
+        :meth:`get_graph_metadata`'s queries); after that the counts are
+        kept current from the statistics of writes through this service and
+        served without querying FalkorDB. A background task re-counts graphs
+        every FALKORDB_STATS_RECONCILE_INTERVAL seconds, and sooner when a
+        write could not be attributed to a single label or type.
+
+        Args:
+            graph_name: Name of the graph
+
+        Returns:
+            Dictionary with ``node_counts``, ``relationship_counts``,
+            ``drifted``, ``writes_applied``, ``reconciliations``,
+            ``corrections`` and ``age_s``
+
+        Raises:
+            Exception: If the initial count fails
+        """
+        try:
+            if not self.counts.is_seeded(graph_name):
+                await self._fetch_metadata(graph_name)
+            return self.counts.snapshot(graph_name)
+        except Exception as e:
+            sanitized = graph_name.replace("\n", "").replace("\r", "")
+            logger.error(f"Error getting counts for graph '{sanitized}': {e}")
+            raise
+
+    async def infer_schema(
+        self, graph_name: str, sample_size: Optional[int] = None, refresh: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Infer property types per label and relationship type from a sample.
+
+        Each label and type is probed at random points spread across the id
+        range, all probes going out in one pipelined round trip, and a
+        reservoir keeps at most ``sample_size`` of the rows read. The cost
+        is therefore bounded by the number of labels and types, not by the
+        size of the graph. Results are cached; once
+        FALKORDB_SCHEMA_CACHE_TTL expires (or with ``refresh``, or after a
+        write) the profiles are rebuilt from a new sample.
+
+        Args:
+            graph_name: Name of the graph
+            sample_size: Entities kept per label or type (None uses the
+                config default)
+            refresh: Sample again even if the cached profiles are fresh
+
+        Returns:
+            Dictionary with per-label ``nodes`` and per-type ``relationships``
+            profiles (count, sampled entities, rows read, and per property
+            the observed types, null rate and distinct-value estimate)
+
+        Raises:
+            ValueError: If sample_size is not positive
+            Exception: If sampling fails
+        """
+        try:
+            sample_size = config.schema_sample_size if sample_size is None else sample_size
+            if sample_size <= 0:
+                raise ValueError("sample_size must be positive")
+            entry, resample = self.inference.lookup(graph_name, refresh)
+            if resample:
+                await self._sample_schema(graph_name, entry, sample_size)
+                self.inference.store(graph_name, entry)
+            return {
+                "name": graph_name,
+                **entry.to_dict(),
+                "sample_size": sample_size,
+                "cache_hit": not resample,
+            }
+        except Exception as e:
+            sanitized = graph_name.replace("\n", "").replace("\r", "")
+            logger.error(f"Error inferring schema for graph '{sanitized}': {e}")
+            raise
+
+    async def _sample_schema(
+        self, graph_name: str, entry: InferredSchema, sample_size: int
+    ) -> None:
+        """Sample every label and relationship type and rebuild ``entry``'s profiles."""
+        metadata = await self.get_graph_metadata(graph_name)
+        node_counts = metadata["node_counts"]
+        relationship_counts = metadata["relationship_counts"]
+        entry.counts = {
+            **{(NODE, name): count for name, count in node_counts.items()},
+            **{(RELATIONSHIP, name): count for name, count in relationship_counts.items()},
+        }
+        # Ids are allocated densely and reused after deletes, so the graph's
+        # entity totals bound the id ranges closely. Per-label counts would
+        # overshoot: a node with several labels is counted once per label.
+        bounds = {NODE: metadata["node_count"], RELATIONSHIP: metadata["relationship_count"]}
+
+        rng = random.Random()
+        probes: List[Tuple[str, Dict[str, Any]]] = []
+        spans = []
+        for (kind, name), count in entry.counts.items():
+            if not count:
+                continue
+            starts, limit = plan_probes(
+                count, bounds[kind], sample_size, config.schema_sample_probes, rng
+            )
+            query = probe_query(kind, name, limit)
+            probes.extend((query, {"start": start}) for start in starts)
+            spans.append((kind, name, len(starts)))
+
+        async def fetch(graph: AsyncGraph) -> List[QueryResult]:
+            return await self._pipeline(
+                graph, [graph._build_params_header(params) + query for query, params in probes]
+            )
+
+        results = await self._read(graph_name, fetch) if probes else []
+        # Profiles are rebuilt from the fresh sample, so each stays bounded by
+        # sample_size however often it is refreshed
+        entry.profiles = {}
+        offset = 0
+        for kind, name, probe_count in spans:
+            rows, read = unique_rows(results[offset:offset + probe_count])
+            offset += probe_count
+            profile = entry.profiles[(kind, name)] = EntityProfile(kind, name, rows_read=read)
+            for _, properties in reservoir(rows, sample_size, rng):
+                profile.add(_serialize_row(properties or {}), config.vector_min_dims)
+
+    async def close(self) -> None:
+        """Close connection to FalkorDB."""
+        for task in (
+            self._reaper,
+            self._health_checker,
+            self._reconciler,
+            self._keyspace_watcher,
+            self._prober,
+        ):
+            if task is not None:
+                task.cancel()
+        self._reaper = self._health_checker = None
+        self._reconciler = self._keyspace_watcher = self._prober = None
+        for replica in self.replicas.replicas:
+            await replica.connection_pool.disconnect()
+        self.replicas.replicas = []
+        self._graphs.clear()
+        self.results.clear()
+        self.schema.clear()
+        self.inference.clear()
+        self.counts.clear()
+        self.graph_list.clear()
+        self.cursors.clear()
+        if self._client:
+            await self._client.connection.aclose()
+            self._client = None
+        if self._connection_pool is not None:
+            await self._connection_pool.disconnect()
+            self._connection_pool = None
+            logger.info("✓ FalkorDB asyncio connection closed")
+
+
+# Global async service instance
+_async_service: Optional[AsyncFalkorDBService] = None
+_async_service_lock = asyncio.Lock()
+
+
+async def get_async_service() -> AsyncFalkorDBService:
+    """Get or create the global async FalkorDB service instance."""
+    global _async_service
+    if _async_service is None:
+        async with _async_service_lock:
+            if _async_service is None:
+                service = AsyncFalkorDBService()
+                await service.initialize()
+                _async_service = service
+    return _async_service
@@ -0,0 +1,513 @@
+"""In-process caches shared by the sync and async FalkorDB services."""
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+class GraphHandleCache:
+    """Bounded LRU of ``Graph`` handles keyed by graph name.
+
+    Reusing a handle keeps its client-side schema (label, relation and
+    property names) warm, so repeated queries against the same graph skip
+    both the object creation and the schema refresh round trips that a fresh
+    ``select_graph`` handle pays for.
+    """
+
+    def __init__(self, max_size: int):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of graph handles to keep
+        """
+        self.max_size = max(1, max_size)
+        self._handles: "OrderedDict[str, Any]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, graph_name: str, factory: Callable[[str], Any]) -> Any:
+        """
+        Return the cached handle for ``graph_name``, creating it on a miss.
+
+        Args:
+            graph_name: Name of the graph
+            factory: Callable that creates a handle (e.g. ``client.select_graph``)
+
+        Returns:
+            Graph handle
+        """
+        handle = self._handles.get(graph_name)
+        if handle is not None:
+            self._hits += 1
+            self._handles.move_to_end(graph_name)
+            return handle
+
+        self._misses += 1
+        handle = factory(graph_name)
+        self._handles[graph_name] = handle
+        if len(self._handles) > self.max_size:
+            self._handles.popitem(last=False)
+        return handle
+
+    def evict(self, graph_name: str) -> Optional[Any]:
+        """Drop the handle for a deleted graph, returning it if present."""
+        return self._handles.pop(graph_name, None)
+
+    def retain(self, graph_names: Iterable[str]) -> None:
+        """Drop handles for graphs missing from ``graph_names`` (a GRAPH.LIST reply)."""
+        existing = set(graph_names)
+        for graph_name in [name for name in self._handles if name not in existing]:
+            del self._handles[graph_name]
+
+    def clear(self) -> None:
+        """Drop every cached handle."""
+        self._handles.clear()
+
+    def __contains__(self, graph_name: str) -> bool:
+        return graph_name in self._handles
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report cache usage.
+
+        Returns:
+            Dictionary with size, capacity, hits and misses
+        """
+        return {
+            "size": len(self._handles),
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+
+class ResultCache:
+    """TTL + LRU cache of query results, bounded by total size in bytes.
+
+    Entries are keyed by (graph, normalized query, params) and indexed per
+    graph, so a write to a graph drops every cached result for that graph.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Upper bound on the summed size of cached results
+                (0 disables caching)
+            ttl: Seconds a cached result stays valid
+        """
+        self.max_bytes = max(0, max_bytes)
+        self.ttl = ttl
+        # key -> (expires_at, size, graph_name, value)
+        self._entries: "OrderedDict[Tuple[Any, ...], Tuple[float, int, str, Any]]" = (
+            OrderedDict()
+        )
+        self._keys_by_graph: Dict[str, Set[Tuple[Any, ...]]] = {}
+        # Bumped on every invalidation so reads that overlapped a write
+        # cannot re-insert a stale result
+        self._generations: Dict[str, int] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.max_bytes > 0 and self.ttl > 0
+
+    @staticmethod
+    def make_key(
+        graph_name: str, query: str, params: Optional[Dict[str, Any]], *extra: Any
+    ) -> Tuple[Any, ...]:
+        """
+        Build a cache key from a graph, a query and its parameters.
+
+        Whitespace in the query is collapsed so formatting differences share
+        an entry; parameters are encoded with sorted keys.
+
+        Args:
+            graph_name: Name of the graph
+            query: Cypher query text
+            params: Query parameters
+            *extra: Additional options that change the cached value
+
+        Returns:
+            Hashable cache key
+        """
+        normalized = " ".join(query.split())
+        encoded_params = json.dumps(params or {}, sort_keys=True, default=str)
+        return (graph_name, normalized, encoded_params, *extra)
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[Any]:
+        """Return a live cached value, or None on a miss or expiry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        if entry[0] <= time.monotonic():
+            self._remove(key)
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry[3]
+
+    def generation(self, graph_name: str) -> int:
+        """Current invalidation generation of a graph (read before querying)."""
+        return self._generations.get(graph_name, 0)
+
+    def put(
+        self,
+        key: Tuple[Any, ...],
+        value: Any,
+        size: Optional[int] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Cache a value under ``key``, evicting least recently used entries.
+
+        Args:
+            key: Key from :meth:`make_key` (its first element is the graph name)
+            value: JSON-compatible result to cache
+            size: Size of the value in bytes (measured as JSON when omitted)
+            generation: Graph generation observed before the query ran; the
+                value is dropped if the graph was written to since
+        """
+        if not self.enabled:
+            return
+        if generation is not None and generation != self.generation(key[0]):
+            return
+        if size is None:
+            size = len(json.dumps(value, default=str))
+        if size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        while self._bytes + size > self.max_bytes and self._entries:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+        graph_name = key[0]
+        self._entries[key] = (time.monotonic() + self.ttl, size, graph_name, value)
+        self._keys_by_graph.setdefault(graph_name, set()).add(key)
+        self._bytes += size
+
+    def invalidate_graph(self, graph_name: str) -> int:
+        """
+        Drop every cached result for a graph after a write.
+
+        Returns:
+            Number of entries dropped
+        """
+        self._generations[graph_name] = self.generation(graph_name) + 1
+        keys = self._keys_by_graph.get(graph_name)
+        if not keys:
+            return 0
+        count = len(keys)
+        for key in list(keys):
+            self._remove(key)
+        self._invalidations += count
+        return count
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        self._entries.clear()
+        self._keys_by_graph.clear()
+        self._bytes = 0
+
+    def _remove(self, key: Tuple[Any, ...]) -> None:
+        _, size, graph_name, _ = self._entries.pop(key)
+        self._bytes -= size
+        keys = self._keys_by_graph.get(graph_name)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_graph[graph_name]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report cache effectiveness.
+
+        Returns:
+            Dictionary with hit ratio, counters and current size
+        """
+        lookups = self._hits + self._misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            "evictions": self._evictions,
+            "invalidations": self._invalidations,
+        }
+
+
+class PlanCacheStats:
+    """Tracks how often FalkorDB reused a cached execution plan.
+
+    FalkorDB reports ``Cached execution`` with every query result; the ratio
+    shows whether literal parameterization is paying off.
+    """
+
+    def __init__(self):
+        """Initialize the counters."""
+        self._queries = 0
+        self._hits = 0
+        self._parameterized = 0
+        self._literals_lifted = 0
+
+    def record(self, cached_execution: Any, literals_lifted: int = 0) -> None:
+        """
+        Count one executed query.
+
+        Args:
+            cached_execution: The result's ``cached_execution`` statistic
+                (ignored when FalkorDB did not report one)
+            literals_lifted: Number of literals moved into parameters
+        """
+        if literals_lifted:
+            self._parameterized += 1
+            self._literals_lifted += literals_lifted
+        if not isinstance(cached_execution, (bool, int, float)):
+            return
+        self._queries += 1
+        if cached_execution:
+            self._hits += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report plan cache effectiveness.
+
+        Returns:
+            Dictionary with query count, plan cache hits and hit ratio
+        """
+        return {
+            "queries": self._queries,
+            "hits": self._hits,
+            "hit_ratio": round(self._hits / self._queries, 4) if self._queries else 0.0,
+            "parameterized_queries": self._parameterized,
+            "literals_lifted": self._literals_lifted,
+        }
+
+
+class SchemaCache:
+    """Per-graph cache of graph metadata.
+
+    Entries expire after ``ttl`` seconds, which bounds how stale metadata
+    can get when other clients write to the graph, and are dropped at once
+    when a write through this server changes the schema or entity counts.
+    """
+
+    def __init__(self, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays valid (0 disables caching)
+        """
+        self.ttl = ttl
+        # graph name -> (expires_at, metadata)
+        self._entries: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # Bumped on every invalidation, as in ResultCache
+        self._generations: Dict[str, int] = {}
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, graph_name: str) -> Optional[Dict[str, Any]]:
+        """Return live cached metadata, or None on a miss or expiry."""
+        entry = self._entries.get(graph_name)
+        if entry is None or entry[0] <= time.monotonic():
+            self._entries.pop(graph_name, None)
+            self._misses += 1
+            return None
+        self._hits += 1
+        return entry[1]
+
+    def generation(self, graph_name: str) -> int:
+        """Current invalidation generation of a graph (read before querying)."""
+        return self._generations.get(graph_name, 0)
+
+    def put(self, graph_name: str, metadata: Dict[str, Any], generation: int) -> None:
+        """
+        Cache metadata unless the graph changed while it was being fetched.
+
+        Args:
+            graph_name: Name of the graph
+            metadata: Metadata to cache
+            generation: Graph generation observed before fetching
+        """
+        if self.ttl <= 0 or generation != self.generation(graph_name):
+            return
+        self._entries[graph_name] = (time.monotonic() + self.ttl, metadata)
+
+    def invalidate(self, graph_name: str) -> None:
+        """Drop a graph's metadata after a write changed it."""
+        self._generations[graph_name] = self.generation(graph_name) + 1
+        if self._entries.pop(graph_name, None) is not None:
+            self._invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all cached metadata."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report cache effectiveness.
+
+        Returns:
+            Dictionary with entry count, hits, misses and invalidations
+        """
+        return {
+            "entries": len(self._entries),
+            "ttl": self.ttl,
+            "hits": self._hits,
+            "misses": self._misses,
+            "invalidations": self._invalidations,
+        }
+
+
+class GraphNotFoundError(LookupError):
+    """A read targeted a graph that is known not to exist."""
+
+    def __init__(self, graph_name: str):
+        self.graph_name = graph_name
+        super().__init__(f"Graph '{graph_name}' does not exist")
+
+
+def is_missing_graph(error: BaseException) -> bool:
+    """Whether an error is FalkorDB rejecting a read on a graph key that does not exist."""
+    return "empty key" in str(error).lower()
+
+
+class GraphListCache:
+    """Short-lived cache of ``GRAPH.LIST`` plus a negative cache of missing graphs.
+
+    A fresh list answers both ``list_graphs`` and whether a graph exists, so
+    reads against unknown graph names fail without a round trip. Names seen
+    missing while no list is cached (FalkorDB reported an empty key) are
+    remembered for the same TTL. Writes through this server that create a
+    graph, and keyspace notifications when enabled, invalidate the list.
+    """
+
+    def __init__(self, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds the list and missing names stay valid (0 disables)
+        """
+        self.ttl = ttl
+        self._graphs: Optional[Set[str]] = None
+        self._listed: List[str] = []
+        self._expires_at = 0.0
+        # graph name -> time the negative entry expires
+        self._missing: Dict[str, float] = {}
+        # Bumped on every invalidation, as in SchemaCache
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._rejected = 0
+
+    def _fresh(self) -> bool:
+        return self._graphs is not None and self._expires_at > time.monotonic()
+
+    def get(self) -> Optional[List[str]]:
+        """Return the cached graph names, or None on a miss or expiry."""
+        if not self._fresh():
+            self._misses += 1
+            return None
+        self._hits += 1
+        return list(self._listed)
+
+    @property
+    def generation(self) -> int:
+        """Current invalidation generation (read before listing)."""
+        return self._generation
+
+    def put(self, graphs: List[str], generation: int) -> None:
+        """
+        Cache a ``GRAPH.LIST`` reply unless a graph was created or deleted meanwhile.
+
+        Args:
+            graphs: Graph names
+            generation: Generation observed before listing
+        """
+        if self.ttl <= 0 or generation != self._generation:
+            return
+        self._listed = list(graphs)
+        self._graphs = set(graphs)
+        self._expires_at = time.monotonic() + self.ttl
+        self._missing.clear()
+
+    def missing(self, graph_name: str) -> bool:
+        """Whether a graph is known not to exist, so a read on it can fail fast."""
+        if self._fresh():
+            absent = graph_name not in self._graphs
+        else:
+            expires_at = self._missing.get(graph_name)
+            absent = expires_at is not None and expires_at > time.monotonic()
+            if expires_at is not None and not absent:
+                del self._missing[graph_name]
+        if absent:
+            self._rejected += 1
+        return absent
+
+    def mark_missing(self, graph_name: str) -> None:
+        """Remember that FalkorDB reported a graph as missing."""
+        if self.ttl > 0:
+            self._missing[graph_name] = time.monotonic() + self.ttl
+
+    def record_write(self, graph_name: str) -> None:
+        """Note a successful write, which creates the graph if it did not exist."""
+        self._missing.pop(graph_name, None)
+        # With no list cached, one may be in flight from before the write
+        if self._graphs is None or graph_name not in self._graphs:
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop the cached list after a graph was created or deleted."""
+        self._generation += 1
+        if self._graphs is not None:
+            self._invalidations += 1
+        self._graphs = None
+        self._listed = []
+        self._missing.clear()
+
+    def clear(self) -> None:
+        """Drop the cached list and missing names."""
+        self._graphs = None
+        self._listed = []
+        self._missing.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report cache effectiveness.
+
+        Returns:
+            Dictionary with hits, misses, invalidations, the number of
+            missing names remembered and reads rejected without a round trip
+        """
+        return {
+            "ttl": self.ttl,
+            "cached": self._fresh(),
+            "hits": self._hits,
+            "misses": self._misses,
+            "invalidations": self._invalidations,
+            "missing": len(self._missing),
+            "rejected": self._rejected,
+        }
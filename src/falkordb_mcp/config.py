@@ -1,8 +1,8 @@
 """Configuration management for FalkorDB MCP server."""
 
 import os
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 
 from dotenv import load_dotenv
 
@@ -10,6 +10,21 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _parse_endpoints(value: str, default_port: int) -> List[Tuple[str, int]]:
+    """Parse a comma-separated ``host[:port]`` list into (host, port) tuples."""
+    endpoints = []
+    for entry in value.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        host, sep, port = entry.rpartition(":")
+        if sep:
+            endpoints.append((host, int(port)))
+        else:
+            endpoints.append((entry, default_port))
+    return endpoints
+
+
 @dataclass
 class FalkorDBConfig:
     """FalkorDB connection configuration."""
@@ -18,15 +33,109 @@ class FalkorDBConfig:
     port: int
     username: Optional[str]
     password: Optional[str]
+    pool_min_size: int = 1
+    pool_max_size: int = 16
+    pool_max_per_graph: int = 0
+    pool_idle_timeout: float = 300.0
+    pool_acquire_timeout: float = 10.0
+    graph_cache_size: int = 64
+    replicas: List[Tuple[str, int]] = field(default_factory=list)
+    replica_strategy: str = "round_robin"
+    replica_health_interval: float = 5.0
+    replica_max_latency_ms: float = 250.0
+    batch_max_size: int = 100
+    result_cache_max_bytes: int = 32 * 1024 * 1024
+    result_cache_ttl: float = 10.0
+    schema_cache_ttl: float = 60.0
+    schema_sample_size: int = 200
+    schema_sample_probes: int = 8
+    stats_reconcile_interval: float = 300.0
+    graph_list_ttl: float = 5.0
+    graph_list_notifications: bool = False
+    health_interval: float = 2.0
+    health_window: int = 300
+    parameterize_literals: bool = False
+    json_encoder: str = "auto"
+    json_pretty: bool = False
+    vector_policy: str = "keep"
+    vector_min_dims: int = 64
+    vector_preview_size: int = 8
+    result_max_rows: int = 0
+    result_max_bytes: int = 16 * 1024 * 1024
+    cursor_page_size: int = 1000
+    cursor_ttl: float = 300.0
+    cursor_max_open: int = 256
+    stream_chunk_rows: int = 500
+    query_timeout_ms: int = 0
+    query_timeout_grace_ms: int = 500
+    admission_max_per_graph: int = 32
+    admission_max_per_client: int = 16
+    admission_queue_size: int = 256
+    admission_queue_timeout: float = 10.0
 
     @classmethod
     def from_env(cls) -> "FalkorDBConfig":
         """Create configuration from environment variables."""
+        port = int(os.getenv("FALKORDB_PORT", "6379"))
         return cls(
             host=os.getenv("FALKORDB_HOST", "localhost"),
-            port=int(os.getenv("FALKORDB_PORT", "6379")),
+            port=port,
             username=os.getenv("FALKORDB_USERNAME") or None,
             password=os.getenv("FALKORDB_PASSWORD") or None,
+            pool_min_size=int(os.getenv("FALKORDB_POOL_MIN_SIZE", "1")),
+            pool_max_size=int(os.getenv("FALKORDB_POOL_MAX_SIZE", "16")),
+            pool_max_per_graph=int(os.getenv("FALKORDB_POOL_MAX_PER_GRAPH", "0")),
+            pool_idle_timeout=float(os.getenv("FALKORDB_POOL_IDLE_TIMEOUT", "300")),
+            pool_acquire_timeout=float(os.getenv("FALKORDB_POOL_ACQUIRE_TIMEOUT", "10")),
+            graph_cache_size=int(os.getenv("FALKORDB_GRAPH_CACHE_SIZE", "64")),
+            replicas=_parse_endpoints(os.getenv("FALKORDB_REPLICAS", ""), port),
+            replica_strategy=os.getenv("FALKORDB_REPLICA_STRATEGY", "round_robin"),
+            replica_health_interval=float(
+                os.getenv("FALKORDB_REPLICA_HEALTH_INTERVAL", "5")
+            ),
+            replica_max_latency_ms=float(
+                os.getenv("FALKORDB_REPLICA_MAX_LATENCY_MS", "250")
+            ),
+            batch_max_size=int(os.getenv("FALKORDB_BATCH_MAX_SIZE", "100")),
+            result_cache_max_bytes=int(
+                os.getenv("FALKORDB_RESULT_CACHE_MAX_BYTES", str(32 * 1024 * 1024))
+            ),
+            result_cache_ttl=float(os.getenv("FALKORDB_RESULT_CACHE_TTL", "10")),
+            schema_cache_ttl=float(os.getenv("FALKORDB_SCHEMA_CACHE_TTL", "60")),
+            schema_sample_size=int(os.getenv("FALKORDB_SCHEMA_SAMPLE_SIZE", "200")),
+            schema_sample_probes=int(os.getenv("FALKORDB_SCHEMA_SAMPLE_PROBES", "8")),
+            stats_reconcile_interval=float(
+                os.getenv("FALKORDB_STATS_RECONCILE_INTERVAL", "300")
+            ),
+            graph_list_ttl=float(os.getenv("FALKORDB_GRAPH_LIST_TTL", "5")),
+            graph_list_notifications=os.getenv(
+                "FALKORDB_GRAPH_LIST_NOTIFICATIONS", "false"
+            ).lower() in ("1", "true", "yes"),
+            health_interval=float(os.getenv("FALKORDB_HEALTH_INTERVAL", "2")),
+            health_window=int(os.getenv("FALKORDB_HEALTH_WINDOW", "300")),
+            parameterize_literals=os.getenv(
+                "FALKORDB_PARAMETERIZE_LITERALS", "false"
+            ).lower() in ("1", "true", "yes"),
+            json_encoder=os.getenv("FALKORDB_JSON_ENCODER", "auto"),
+            json_pretty=os.getenv("FALKORDB_JSON_PRETTY", "false").lower()
+            in ("1", "true", "yes"),
+            vector_policy=os.getenv("FALKORDB_VECTOR_POLICY", "keep"),
+            vector_min_dims=int(os.getenv("FALKORDB_VECTOR_MIN_DIMS", "64")),
+            vector_preview_size=int(os.getenv("FALKORDB_VECTOR_PREVIEW_SIZE", "8")),
+            result_max_rows=int(os.getenv("FALKORDB_RESULT_MAX_ROWS", "0")),
+            result_max_bytes=int(
+                os.getenv("FALKORDB_RESULT_MAX_BYTES", str(16 * 1024 * 1024))
+            ),
+            cursor_page_size=int(os.getenv("FALKORDB_CURSOR_PAGE_SIZE", "1000")),
+            cursor_ttl=float(os.getenv("FALKORDB_CURSOR_TTL", "300")),
+            cursor_max_open=int(os.getenv("FALKORDB_CURSOR_MAX_OPEN", "256")),
+            stream_chunk_rows=int(os.getenv("FALKORDB_STREAM_CHUNK_ROWS", "500")),
+            query_timeout_ms=int(os.getenv("FALKORDB_QUERY_TIMEOUT_MS", "0")),
+            query_timeout_grace_ms=int(os.getenv("FALKORDB_QUERY_TIMEOUT_GRACE_MS", "500")),
+            admission_max_per_graph=int(os.getenv("FALKORDB_ADMISSION_MAX_PER_GRAPH", "32")),
+            admission_max_per_client=int(os.getenv("FALKORDB_ADMISSION_MAX_PER_CLIENT", "16")),
+            admission_queue_size=int(os.getenv("FALKORDB_ADMISSION_QUEUE_SIZE", "256")),
+            admission_queue_timeout=float(os.getenv("FALKORDB_ADMISSION_QUEUE_TIMEOUT", "10")),
         )
 
 
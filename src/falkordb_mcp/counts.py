@@ -0,0 +1,194 @@
+"""Per-label and per-type entity counts kept current from write statistics."""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Set
+
+from .cypher import ambiguous_changes, pattern_names
+
+# Write statistics that change which labels a node carries; their effect on
+# per-label counts cannot be told from the statistics alone
+LABEL_STATISTICS = ("labels_added", "labels_removed")
+
+
+@dataclass
+class GraphCounts:
+    """Tracked counts of one graph."""
+
+    node_counts: Dict[str, int] = field(default_factory=dict)
+    relationship_counts: Dict[str, int] = field(default_factory=dict)
+    reconciled_at: float = field(default_factory=time.monotonic)
+    reconciliations: int = 0
+    writes_applied: int = 0
+    # Set when a write could not be attributed to a single label or type
+    drifted: bool = False
+    # Sum of absolute differences found by reconciliations
+    corrections: int = 0
+
+
+def _attribute(counts: Dict[str, int], names: Set[str], delta: int) -> bool:
+    """Add ``delta`` to the only name in ``names``; False if that is ambiguous."""
+    if not delta:
+        return True
+    if len(names) != 1:
+        return False
+    name = next(iter(names))
+    counts[name] = max(0, counts.get(name, 0) + delta)
+    return True
+
+
+class CountTracker:
+    """Node and relationship counts per label and type, without count queries.
+
+    Counts are seeded from one set of count queries and then adjusted by
+    the ``nodes_*`` and ``relationships_*`` statistics of every write sent
+    through this server. A write whose entities cannot be attributed to a
+    single label or type (including unlabeled nodes it creates and deletes
+    of nodes with several labels, or that adds or removes labels) marks the
+    graph drifted, and the next reconciliation re-counts it; so does age, which
+    bounds the error from writes by other clients.
+    """
+
+    def __init__(self):
+        """Initialize an empty tracker."""
+        self._graphs: Dict[str, GraphCounts] = {}
+        # Bumped by every applied write, so seeds fetched across a write
+        # are known to be behind
+        self._generations: Dict[str, int] = {}
+
+    def generation(self, graph_name: str) -> int:
+        """Current write generation of a graph (read before counting)."""
+        return self._generations.get(graph_name, 0)
+
+    def is_seeded(self, graph_name: str) -> bool:
+        """Whether a graph's counts are being tracked."""
+        return graph_name in self._graphs
+
+    def seed(
+        self,
+        graph_name: str,
+        node_counts: Dict[str, int],
+        relationship_counts: Dict[str, int],
+        generation: int,
+    ) -> None:
+        """
+        Reset a graph's counts to freshly counted values.
+
+        Args:
+            graph_name: Name of the graph
+            node_counts: Node count per label
+            relationship_counts: Relationship count per type
+            generation: Write generation observed before counting; if a
+                write landed since, the counts stay marked drifted
+        """
+        previous = self._graphs.get(graph_name)
+        counts = GraphCounts(dict(node_counts), dict(relationship_counts))
+        if previous is not None:
+            counts.reconciliations = previous.reconciliations + 1
+            counts.writes_applied = previous.writes_applied
+            counts.corrections = previous.corrections + sum(
+                abs(fresh.get(name, 0) - tracked.get(name, 0))
+                for fresh, tracked in (
+                    (counts.node_counts, previous.node_counts),
+                    (counts.relationship_counts, previous.relationship_counts),
+                )
+                for name in set(fresh) | set(tracked)
+            )
+        counts.drifted = generation != self.generation(graph_name)
+        self._graphs[graph_name] = counts
+
+    def apply(self, graph_name: str, query: str, statistics: Dict[str, Any]) -> None:
+        """
+        Adjust a graph's counts by a write's statistics.
+
+        Args:
+            graph_name: Name of the graph written to
+            query: Query text, scanned for the labels and types it names
+            statistics: Write statistics of the query
+        """
+        node_delta = int(statistics.get("nodes_created") or 0) - int(
+            statistics.get("nodes_deleted") or 0
+        )
+        relationship_delta = int(statistics.get("relationships_created") or 0) - int(
+            statistics.get("relationships_deleted") or 0
+        )
+        relabeled = any(statistics.get(name) for name in LABEL_STATISTICS)
+        if not (node_delta or relationship_delta or relabeled):
+            return
+        self._generations[graph_name] = self.generation(graph_name) + 1
+        counts = self._graphs.get(graph_name)
+        if counts is None:
+            return
+        labels, types = pattern_names(query)
+        ambiguous_nodes, ambiguous_relationships = ambiguous_changes(query)
+        if ambiguous_nodes:
+            labels = set()
+        if ambiguous_relationships:
+            types = set()
+        counts.writes_applied += 1
+        attributed = _attribute(counts.node_counts, labels, node_delta) and _attribute(
+            counts.relationship_counts, types, relationship_delta
+        )
+        if relabeled or not attributed:
+            counts.drifted = True
+
+    def mark_drifted(self, graph_name: str) -> None:
+        """
+        Mark a graph drifted after a write whose statistics are unknown.
+
+        Used when a write failed or timed out on the client: FalkorDB may
+        still have committed it, so seeds in flight are discarded and the
+        next reconciliation re-counts the graph.
+
+        Args:
+            graph_name: Name of the graph written to
+        """
+        self._generations[graph_name] = self.generation(graph_name) + 1
+        counts = self._graphs.get(graph_name)
+        if counts is not None:
+            counts.drifted = True
+
+    def due(self, max_age: float) -> List[str]:
+        """Graphs that drifted or were last reconciled ``max_age`` seconds ago."""
+        now = time.monotonic()
+        return [
+            name
+            for name, counts in self._graphs.items()
+            if counts.drifted or now - counts.reconciled_at >= max_age
+        ]
+
+    def forget(self, graph_name: str) -> None:
+        """Stop tracking a graph, e.g. after it was deleted."""
+        self._graphs.pop(graph_name, None)
+        self._generations.pop(graph_name, None)
+
+    def clear(self) -> None:
+        """Stop tracking every graph."""
+        self._graphs.clear()
+        self._generations.clear()
+
+    def snapshot(self, graph_name: str) -> Dict[str, Any]:
+        """
+        Report a graph's tracked counts.
+
+        Args:
+            graph_name: Name of a seeded graph
+
+        Returns:
+            Dictionary with counts per label and type, whether they drifted
+            since the last reconciliation, and reconciliation counters
+
+        Raises:
+            KeyError: If the graph is not tracked
+        """
+        counts = self._graphs[graph_name]
+        return {
+            "name": graph_name,
+            "node_counts": dict(counts.node_counts),
+            "relationship_counts": dict(counts.relationship_counts),
+            "drifted": counts.drifted,
+            "writes_applied": counts.writes_applied,
+            "reconciliations": counts.reconciliations,
+            "corrections": counts.corrections,
+            "age_s": round(time.monotonic() - counts.reconciled_at, 3),
+        }
@@ -0,0 +1,244 @@
+"""Server-side cursors for walking large read-only results page by page."""
+
+import asyncio
+import re
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from .cypher import mask_literals, strip_comments, strip_literals
+from .paging import pageable
+
+KEYSET = "keyset"
+SKIP_LIMIT = "skip_limit"
+CLIENT = "client"
+
+# Parameter and column added to keyset queries
+KEY_PARAM = "_cursor_after"
+KEY_COLUMN = "_cursor_key"
+
+_RETURN = re.compile(r"(?<![.:$\w])RETURN\b", re.IGNORECASE)
+_MATCH = re.compile(r"(?<![.:$\w])MATCH\b", re.IGNORECASE)
+# Clauses that can repeat a node across rows or reorder them, which keyset
+# pagination on the node id cannot follow
+_UNSAFE_CLAUSE = re.compile(
+    r"(?<![.:$\w])(?:WITH|UNWIND|CALL|OPTIONAL|UNION|ORDER|DISTINCT|SKIP|LIMIT)\b",
+    re.IGNORECASE,
+)
+_AGGREGATE = re.compile(
+    r"(?<![.:$\w])(?:count|collect|sum|avg|min|max|stDev|stDevP"
+    r"|percentileCont|percentileDisc)\s*\(",
+    re.IGNORECASE,
+)
+# A relationship in a pattern: "-[", "--", "->" or "<-"
+_RELATIONSHIP = re.compile(r"-\[|--|->|<-")
+_NODE_VARIABLE = re.compile(r"\(\s*([A-Za-z_]\w*)")
+_ANONYMOUS_NODE = re.compile(r"\(\s*[:){]")
+
+
+def keyset_variable(query: str) -> Optional[str]:
+    """
+    Find the node variable a query can be paged on by id.
+
+    Keyset pagination applies to single-node MATCH queries such as
+    ``MATCH (n:Person) WHERE n.age > 30 RETURN n.name``: every row then holds
+    a distinct node, so ``id(n) > last`` resumes exactly after the previous
+    page. Anything that can repeat or reorder nodes (relationships, several
+    node variables, WITH, UNWIND, ORDER BY, DISTINCT, aggregation) is not
+    eligible.
+
+    Args:
+        query: Cypher query text
+
+    Returns:
+        The node variable, or None if the query needs another strategy
+    """
+    scrubbed = strip_literals(query)
+    returns = list(_RETURN.finditer(scrubbed))
+    if len(returns) != 1 or not _MATCH.search(scrubbed):
+        return None
+    head, tail = scrubbed[:returns[0].start()], scrubbed[returns[0].end():]
+    if _UNSAFE_CLAUSE.search(scrubbed) or _AGGREGATE.search(tail):
+        return None
+    if _RELATIONSHIP.search(head) or _ANONYMOUS_NODE.search(head):
+        return None
+    variables = set(_NODE_VARIABLE.findall(head))
+    return variables.pop() if len(variables) == 1 else None
+
+
+def keyset_query(query: str, variable: str, limit: int) -> str:
+    """
+    Rewrite a query to return the rows after ``$_cursor_after`` in id order.
+
+    The node id is returned as an extra ``_cursor_key`` column that the
+    cursor strips again. The query text does not depend on the position, so
+    every page reuses one FalkorDB execution plan.
+
+    Args:
+        query: Query accepted by :func:`keyset_variable`
+        variable: Node variable to page on
+        limit: Rows to return
+
+    Returns:
+        Rewritten query
+    """
+    # Comments are dropped so a trailing "//" cannot swallow the added column
+    query = strip_comments(query).strip().rstrip(";")
+    match = list(_RETURN.finditer(mask_literals(query)))[-1]
+    head, tail = query[:match.start()].rstrip(), query[match.end():].strip()
+    return (
+        f"{head}\nWITH * WHERE id({variable}) > ${KEY_PARAM}\n"
+        f"RETURN {tail}, id({variable}) AS {KEY_COLUMN}\n"
+        f"ORDER BY {KEY_COLUMN} LIMIT {limit}"
+    )
+
+
+def choose_strategy(query: str) -> str:
+    """
+    Pick how a cursor pages a query.
+
+    Returns:
+        "keyset" for single-node matches, "skip_limit" for other queries
+        ending in a plain RETURN, and "client" (the query is re-run and the
+        rows before the position are discarded) for the rest
+    """
+    if keyset_variable(query):
+        return KEYSET
+    if pageable(query):
+        return SKIP_LIMIT
+    return CLIENT
+
+
+@dataclass
+class Cursor:
+    """Query, position and paging strategy of one open cursor."""
+
+    id: str
+    graph_name: str
+    query: str
+    params: Dict[str, Any]
+    page_size: int
+    strategy: str
+    key_variable: Optional[str] = None
+    # Rows returned so far, and the id of the last node for keyset cursors
+    position: int = 0
+    last_key: int = -1
+    last_used: float = field(default_factory=time.monotonic)
+    # Pages of one cursor are fetched one at a time
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+
+class CursorRegistry:
+    """Open cursors, expired after ``ttl`` idle seconds.
+
+    At most ``max_open`` cursors are kept; opening another closes the one
+    idle the longest. Expiry is checked lazily whenever the registry is
+    used, so no background task is needed.
+    """
+
+    def __init__(self, ttl: float, max_open: int):
+        """
+        Initialize the registry.
+
+        Args:
+            ttl: Seconds a cursor may stay idle
+            max_open: Maximum number of open cursors
+        """
+        self.ttl = ttl
+        self.max_open = max(1, max_open)
+        self._cursors: "OrderedDict[str, Cursor]" = OrderedDict()
+        self._opened = 0
+        self._expired = 0
+        self._evicted = 0
+
+    def _expire(self) -> None:
+        deadline = time.monotonic() - self.ttl
+        # Ordered by last use, so expired cursors are at the front
+        while self._cursors:
+            cursor = next(iter(self._cursors.values()))
+            if cursor.last_used > deadline:
+                break
+            self._cursors.popitem(last=False)
+            self._expired += 1
+
+    def open(
+        self, graph_name: str, query: str, params: Optional[Dict[str, Any]], page_size: int
+    ) -> Cursor:
+        """
+        Register a cursor for a query.
+
+        Args:
+            graph_name: Name of the graph
+            query: Read-only Cypher query
+            params: Query parameters
+            page_size: Default rows per page
+
+        Returns:
+            New cursor positioned before the first row
+        """
+        self._expire()
+        strategy = choose_strategy(query)
+        cursor = Cursor(
+            id=secrets.token_urlsafe(12),
+            graph_name=graph_name,
+            query=query,
+            params=dict(params or {}),
+            page_size=page_size,
+            strategy=strategy,
+            key_variable=keyset_variable(query) if strategy == KEYSET else None,
+        )
+        self._cursors[cursor.id] = cursor
+        self._opened += 1
+        if len(self._cursors) > self.max_open:
+            self._cursors.popitem(last=False)
+            self._evicted += 1
+        return cursor
+
+    def get(self, cursor_id: str) -> Cursor:
+        """
+        Look up a cursor and mark it used.
+
+        Raises:
+            ValueError: If the cursor is unknown, closed or expired
+        """
+        self._expire()
+        cursor = self._cursors.get(cursor_id)
+        if cursor is None:
+            raise ValueError(f"Unknown or expired cursor '{cursor_id}'")
+        cursor.last_used = time.monotonic()
+        self._cursors.move_to_end(cursor_id)
+        return cursor
+
+    def close(self, cursor_id: str) -> bool:
+        """Close a cursor, returning whether it was open."""
+        return self._cursors.pop(cursor_id, None) is not None
+
+    def expires_in(self, cursor: Cursor) -> float:
+        """Seconds until an idle cursor expires."""
+        return round(max(0.0, cursor.last_used + self.ttl - time.monotonic()), 3)
+
+    def clear(self) -> None:
+        """Close every cursor."""
+        self._cursors.clear()
+
+    def __len__(self) -> int:
+        return len(self._cursors)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report cursor usage.
+
+        Returns:
+            Dictionary with open, opened, expired and evicted counts
+        """
+        self._expire()
+        return {
+            "open": len(self._cursors),
+            "max_open": self.max_open,
+            "ttl": self.ttl,
+            "opened": self._opened,
+            "expired": self._expired,
+            "evicted": self._evicted,
+        }
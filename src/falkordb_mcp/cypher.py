@@ -0,0 +1,369 @@
+"""Lightweight Cypher analysis used to route and rewrite queries."""
+
+import re
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# String literals, backtick-quoted identifiers and comments. They are blanked
+# out before scanning so keywords inside them are not mistaken for clauses.
+_LITERAL_OR_COMMENT = re.compile(
+    r"'(?:[^'\\]|\\.)*'"
+    r'|"(?:[^"\\]|\\.)*"'
+    r"|`[^`]*`"
+    r"|//[^\n]*"
+    r"|/\*.*?\*/",
+    re.DOTALL,
+)
+
+# Clause keywords that modify the graph. Words preceded by '.', ':' or '$'
+# (property keys, labels, parameters) or followed by ':' (map keys) are
+# identifiers, not clauses.
+_WRITE_CLAUSE = re.compile(
+    r"(?<![.:$\w])(?:CREATE|MERGE|SET|DELETE|REMOVE|DROP)\b(?!\s*:)",
+    re.IGNORECASE,
+)
+
+_CALL = re.compile(r"(?<![.:$\w])CALL\s+([\w.]+)", re.IGNORECASE)
+
+# Procedures that never modify the graph. Any other CALL is treated as a write.
+READ_ONLY_PROCEDURES = frozenset(
+    {
+        "db.labels",
+        "db.relationshiptypes",
+        "db.propertykeys",
+        "db.indexes",
+        "db.constraints",
+        "db.meta.stats",
+        "db.idx.fulltext.querynodes",
+        "db.idx.fulltext.queryrelationships",
+        "db.idx.vector.querynodes",
+        "db.idx.vector.queryrelationships",
+        "dbms.procedures",
+        "algo.bfs",
+        "algo.pagerank",
+        "algo.spath",
+        "algo.sspaths",
+        "algo.wcc",
+        "algo.betweenness",
+        "algo.labelpropagation",
+    }
+)
+
+
+# Tokens scanned by parameterize_literals. Only the "string" and "number"
+# groups are lifted; every other alternative is matched so it is left as is:
+# quoted identifiers, comments, $parameters, variable-length ranges such as
+# [*1..3] and LIMIT/SKIP counts, none of which may be parameters.
+_LIFTABLE = re.compile(
+    r"(?P<string>'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\")"
+    r"|`[^`]*`"
+    r"|//[^\n]*"
+    r"|/\*.*?\*/"
+    r"|\$\w+"
+    r"|\*\s*\d*\s*(?:\.\.\s*\d*)?(?=\s*[\]{])"
+    r"|\b(?:LIMIT|SKIP)\s+\d+"
+    r"|(?<![\w.$])(?P<number>\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)(?![\w.])"
+    r"|[A-Za-z_]\w*",
+    re.DOTALL | re.IGNORECASE,
+)
+
+# Schema statements take literal options (e.g. vector index dimensions)
+_SCHEMA_STATEMENT = re.compile(r"(?<![.:$\w])(?:INDEX|CONSTRAINT)\b", re.IGNORECASE)
+
+# Pattern parts naming labels and relationship types. Map literals are
+# removed first so ``{key: value}`` pairs are not read as labels.
+_MAP_LITERAL = re.compile(r"\{[^{}]*\}")
+_NAME = r"(?:[A-Za-z_]\w*|`[^`]*`)"
+_RELATIONSHIP_PATTERN = re.compile(r"-\s*\[([^\[\]]*)\]")
+_NODE_PATTERN = re.compile(
+    r"\(\s*(?:[A-Za-z_]\w*\s*)?((?::\s*" + _NAME + r"\s*)+)\)"
+)
+_PATTERN_NAME = re.compile(r"[:|]\s*(" + _NAME + r")")
+
+# Node patterns with or without labels, for finding the unlabeled ones; the
+# lookbehind skips function calls such as ``count(n)``
+_ANY_NODE_PATTERN = re.compile(
+    r"(?<![\w.$])\(\s*([A-Za-z_]\w*)?\s*((?::\s*" + _NAME + r"\s*)*)\)"
+)
+# Clauses that end the pattern or expression list of the clause before them
+_CLAUSE = re.compile(
+    r"(?<![.:$\w])(?P<clause>OPTIONAL\s+MATCH|MATCH|CREATE|MERGE|DETACH\s+DELETE|DELETE"
+    r"|WITH|UNWIND|RETURN|WHERE|SET|REMOVE|ON|CALL|FOREACH|UNION|ORDER|SKIP|LIMIT)\b",
+    re.IGNORECASE,
+)
+_VARIABLE = re.compile(r"(?<![\w.$:])[A-Za-z_]\w*")
+
+_STRING_ESCAPES = {
+    "\\": "\\", "'": "'", '"': '"', "n": "\n", "t": "\t",
+    "r": "\r", "b": "\b", "f": "\f",
+}
+_STRING_ESCAPE = re.compile(r"\\(u[0-9a-fA-F]{4}|.)", re.DOTALL)
+
+LITERAL_PARAM_PREFIX = "_lit"
+
+
+class ReadOnlyViolationError(ValueError):
+    """Raised when a query marked read-only contains write clauses."""
+
+
+def strip_literals(query: str) -> str:
+    """Blank out string literals, quoted identifiers and comments in a query."""
+    return _LITERAL_OR_COMMENT.sub(" '' ", query)
+
+
+def strip_comments(query: str) -> str:
+    """Remove comments from a query, leaving literals untouched."""
+    return _LITERAL_OR_COMMENT.sub(
+        lambda match: match.group() if match.group()[0] in "'\"`" else " ", query
+    )
+
+
+def mask_literals(query: str) -> str:
+    """Like :func:`strip_literals`, but keeps every offset of the query valid."""
+    return _LITERAL_OR_COMMENT.sub(lambda match: " " * len(match.group()), query)
+
+
+def is_read_only(query: str) -> bool:
+    """
+    Classify a Cypher query as read-only with a keyword scan.
+
+    The scan is conservative: anything that might write (a write clause or a
+    procedure not known to be read-only) classifies the query as a write.
+
+    Args:
+        query: Cypher query text
+
+    Returns:
+        True if the query cannot modify the graph
+    """
+    scrubbed = strip_literals(query)
+    if _WRITE_CLAUSE.search(scrubbed):
+        return False
+    return all(
+        procedure.lower() in READ_ONLY_PROCEDURES
+        for procedure in _CALL.findall(scrubbed)
+    )
+
+
+def resolve_read_only(query: str, read_only: Optional[bool] = None) -> bool:
+    """
+    Decide whether a query should run through GRAPH.RO_QUERY.
+
+    Args:
+        query: Cypher query text
+        read_only: Caller hint. None classifies the query automatically,
+            True forces the read-only path and False forces the write path.
+
+    Returns:
+        True if the query should be sent with ``ro_query``
+
+    Raises:
+        ReadOnlyViolationError: If ``read_only`` is True but the query writes
+    """
+    if read_only is None:
+        return is_read_only(query)
+    if read_only and not is_read_only(query):
+        raise ReadOnlyViolationError(
+            "Query contains write clauses but was marked read_only"
+        )
+    return read_only
+
+
+def _scrub_patterns(query: str) -> str:
+    """Blank out strings and comments and remove map literals, keeping backtick names."""
+    scrubbed = _LITERAL_OR_COMMENT.sub(
+        lambda match: match.group() if match.group()[0] == "`" else " '' ", query
+    )
+    previous = None
+    while previous != scrubbed:
+        previous, scrubbed = scrubbed, _MAP_LITERAL.sub(" ", scrubbed)
+    return scrubbed
+
+
+def pattern_names(query: str) -> Tuple[Set[str], Set[str]]:
+    """
+    Labels and relationship types named in a query's patterns.
+
+    Used to attribute write statistics to labels and types. Like
+    :func:`is_read_only` this is a scan, not a parse: callers should only
+    trust it when it names exactly one label or type, and the write is not
+    flagged by :func:`ambiguous_changes`.
+
+    Args:
+        query: Cypher query text
+
+    Returns:
+        Tuple of node labels and relationship types, unquoted
+    """
+    scrubbed = _scrub_patterns(query)
+
+    def unquote(name: str) -> str:
+        return name[1:-1] if name.startswith("`") else name
+
+    types = {
+        unquote(name)
+        for body in _RELATIONSHIP_PATTERN.findall(scrubbed)
+        for name in _PATTERN_NAME.findall(body)
+    }
+    scrubbed = _RELATIONSHIP_PATTERN.sub("-", scrubbed)
+    labels = {
+        unquote(name)
+        for body in _NODE_PATTERN.findall(scrubbed)
+        for name in _PATTERN_NAME.findall(body)
+    }
+    return labels, types
+
+
+def ambiguous_changes(query: str) -> Tuple[bool, bool]:
+    """
+    Whether a write may change nodes or relationships its patterns do not name.
+
+    Node changes are ambiguous when the query creates or merges a node
+    without a label (an unlabeled pattern whose variable is not bound
+    earlier), or deletes a variable that does not carry exactly one label,
+    counting labels tested in WHERE. Relationship changes are ambiguous
+    after DETACH DELETE, which removes relationships of any type.
+
+    Args:
+        query: Cypher query text
+
+    Returns:
+        Tuple of whether node and relationship changes are ambiguous
+    """
+    scrubbed = _scrub_patterns(query)
+    if _SCHEMA_STATEMENT.search(scrubbed):
+        return False, False
+    clauses = list(_CLAUSE.finditer(scrubbed))
+    nodes = relationships = False
+    for index, clause in enumerate(clauses):
+        keyword = " ".join(clause.group("clause").upper().split())
+        end = clauses[index + 1].start() if index + 1 < len(clauses) else len(scrubbed)
+        start = clause.end()
+        if keyword in ("CREATE", "MERGE"):
+            # Relationship bodies are blanked so their variables are not read as nodes
+            body = _RELATIONSHIP_PATTERN.sub(
+                lambda match: "-[" + " " * len(match.group(1)) + "]", scrubbed[start:end]
+            )
+            for pattern in _ANY_NODE_PATTERN.finditer(body):
+                variable, labels = pattern.group(1), pattern.group(2)
+                if labels:
+                    continue
+                before = scrubbed[:start + pattern.start()]
+                bound = variable and re.search(
+                    r"(?<![\w.$:])" + variable + r"(?!\w)", before
+                )
+                if not bound:
+                    nodes = True
+        elif keyword.endswith("DELETE"):
+            relationships = relationships or keyword == "DETACH DELETE"
+            for variable in set(_VARIABLE.findall(scrubbed[start:end])):
+                if re.search(r"\[\s*" + variable + r"(?!\w)", scrubbed):
+                    continue
+                labels = {
+                    name
+                    for declared in re.findall(
+                        r"(?<![\w.$])" + variable + r"\s*((?::\s*" + _NAME + r"\s*)+)",
+                        scrubbed,
+                    )
+                    for name in _PATTERN_NAME.findall(declared)
+                }
+                if len(labels) != 1:
+                    nodes = True
+    return nodes, relationships
+
+
+def _unescape(body: str) -> str:
+    """Decode the escape sequences of a Cypher string literal body."""
+    def replace(match: "re.Match[str]") -> str:
+        escape = match.group(1)
+        if len(escape) == 5:
+            return chr(int(escape[1:], 16))
+        return _STRING_ESCAPES.get(escape, "\\" + escape)
+
+    return _STRING_ESCAPE.sub(replace, body)
+
+
+def parameterize_literals(
+    query: str, params: Optional[Dict[str, Any]] = None
+) -> Tuple[str, Dict[str, Any], Dict[str, str]]:
+    """
+    Lift string and number literals out of a query into parameters.
+
+    FalkorDB caches execution plans by query text, so queries that differ
+    only in inline literals each compile a new plan. After the rewrite they
+    share one. Every occurrence gets its own parameter, so the rewritten text
+    depends only on the query's shape, never on the literal values.
+
+    Schema statements (INDEX, CONSTRAINT) are returned unchanged.
+
+    Args:
+        query: Cypher query text
+        params: Parameters supplied by the caller (kept as given)
+
+    Returns:
+        Tuple of the rewritten query, the merged parameters, and a mapping of
+        each generated parameter name to the literal text it replaced
+    """
+    merged = dict(params or {})
+    literals: Dict[str, str] = {}
+    if _SCHEMA_STATEMENT.search(strip_literals(query)):
+        return query, merged, literals
+
+    counter = 0
+
+    def lift(match: "re.Match[str]") -> str:
+        nonlocal counter
+        string, number = match.group("string"), match.group("number")
+        if string is None and number is None:
+            return match.group(0)
+
+        name = f"{LITERAL_PARAM_PREFIX}{counter}"
+        while name in merged or f"${name}" in query:
+            counter += 1
+            name = f"{LITERAL_PARAM_PREFIX}{counter}"
+        counter += 1
+
+        if string is not None:
+            merged[name] = _unescape(string[1:-1])
+        elif "." in number or "e" in number.lower():
+            merged[name] = float(number)
+        else:
+            merged[name] = int(number)
+        literals[name] = match.group(0)
+        return f"${name}"
+
+    return _LIFTABLE.sub(lift, query), merged, literals
+
+
+def restore_literals(headers: List[Any], literals: Dict[str, str]) -> List[Any]:
+    """
+    Put lifted literals back into column headers.
+
+    Unaliased projections (e.g. ``RETURN n.age + 1``) are named after their
+    expression, so after :func:`parameterize_literals` they would read
+    ``n.age + $_lit0``. This restores the names the caller wrote.
+
+    Args:
+        headers: Result headers, either names or ``[type, name]`` pairs
+        literals: Mapping returned by :func:`parameterize_literals`
+
+    Returns:
+        Headers with generated parameter references replaced
+    """
+    if not literals:
+        return headers
+
+    pattern = re.compile(
+        r"\$(" + "|".join(re.escape(name) for name in literals) + r")\b"
+    )
+
+    def restore(name: Any) -> Any:
+        if not isinstance(name, str):
+            return name
+        return pattern.sub(lambda match: literals[match.group(1)], name)
+
+    return [
+        [*header[:-1], restore(header[-1])]
+        if isinstance(header, (list, tuple)) and header
+        else restore(header)
+        for header in headers
+    ]
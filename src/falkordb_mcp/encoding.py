@@ -0,0 +1,72 @@
+"""JSON encoding of tool and resource responses."""
+
+import json
+import logging
+from typing import Any, Optional
+
+from .config import config
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+STDLIB = "stdlib"
+ORJSON = "orjson"
+AUTO = "auto"
+BACKENDS = (AUTO, STDLIB, ORJSON)
+
+
+def resolve_backend(name: str) -> str:
+    """
+    Pick the encoder backend for a configured name.
+
+    Args:
+        name: "auto" (orjson when installed), "stdlib" or "orjson"
+
+    Returns:
+        "stdlib" or "orjson"
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown JSON encoder '{name}', expected one of {BACKENDS}")
+    if name == STDLIB:
+        return STDLIB
+    if orjson is None:
+        if name == ORJSON:
+            logger.warning("orjson is not installed, falling back to the stdlib encoder")
+        return STDLIB
+    return ORJSON
+
+
+backend = resolve_backend(config.json_encoder)
+
+
+def dumps(payload: Any, pretty: Optional[bool] = None) -> str:
+    """
+    Encode a response as JSON.
+
+    Compact output is the default: MCP clients are programs, and indentation
+    roughly doubles the size of large result sets.
+
+    Args:
+        payload: JSON-compatible response
+        pretty: Indent the output (None uses FALKORDB_JSON_PRETTY)
+
+    Returns:
+        JSON string
+    """
+    if pretty is None:
+        pretty = config.json_pretty
+    if backend == ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(payload, option=option).decode()
+    if pretty:
+        return json.dumps(payload, indent=2)
+    return json.dumps(payload, separators=(",", ":"))
@@ -0,0 +1,186 @@
+"""Alternative layouts for execute_query results."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+ROWS = "rows"
+COLUMNAR = "columnar"
+FORMATS = (ROWS, COLUMNAR)
+
+# Exact key sets of serialized entities (see service._serialize_value), so
+# user maps that merely contain a "type" key are left alone
+_NODE_KEYS = frozenset({"type", "id", "labels", "properties"})
+_EDGE_KEYS = frozenset({"type", "id", "relation", "src_node", "dest_node", "properties"})
+
+# A string column is only encoded when its runs or distinct values number
+# at most this fraction of its rows
+ENCODING_THRESHOLD = 0.5
+
+
+def _column_name(header: Any) -> Any:
+    """Column name from a header, which is a name or a ``[type, name]`` pair."""
+    if isinstance(header, (list, tuple)) and header:
+        return header[-1]
+    return header
+
+
+def _encode_column(name: Any, values: List[Any]) -> Dict[str, Any]:
+    """
+    Pick the smallest layout for one column.
+
+    Columns holding only strings (and nulls) are run-length encoded when
+    equal values arrive in runs (e.g. ``ORDER BY`` a label) and
+    dictionary-encoded when they repeat a few distinct values in any order.
+    Other columns are returned as plain arrays.
+    """
+    plain = {"name": name, "values": values}
+    if not values or not all(value is None or isinstance(value, str) for value in values):
+        return plain
+
+    run_values: List[Any] = []
+    run_lengths: List[int] = []
+    for value in values:
+        if run_values and run_values[-1] == value:
+            run_lengths[-1] += 1
+        else:
+            run_values.append(value)
+            run_lengths.append(1)
+
+    dictionary = list(dict.fromkeys(values))
+    budget = len(values) * ENCODING_THRESHOLD
+
+    # Run-length output has two entries per run; dictionary output keeps one
+    # small integer per row, so it pays off when few strings are distinct
+    if 2 * len(run_values) <= min(budget, len(dictionary) + len(values)):
+        return {"name": name, "encoding": "rle", "values": run_values, "runs": run_lengths}
+    if len(dictionary) <= budget:
+        positions = {value: index for index, value in enumerate(dictionary)}
+        return {
+            "name": name,
+            "encoding": "dictionary",
+            "dictionary": dictionary,
+            "indices": [positions[value] for value in values],
+        }
+    return plain
+
+
+def _is_entity(value: Any, kind: str, keys: frozenset) -> bool:
+    return value.get("type") == kind and value.keys() == keys
+
+
+def normalize_entities(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Emit every distinct node and edge once and refer to it by id in rows.
+
+    Path-style and neighborhood queries return the same entities in many
+    rows; each occurrence is replaced with ``{"type": "node", "id": ...}``
+    (or ``"edge"``) and its labels, relation and properties are moved to
+    ``nodes``/``edges`` tables keyed by id.
+
+    Args:
+        data: Result with serialized ``result_set`` rows
+
+    Returns:
+        The result with referencing rows and ``nodes`` and ``edges`` tables
+    """
+    nodes: Dict[str, Any] = {}
+    edges: Dict[str, Any] = {}
+
+    def reference(value: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Reference replacing a serialized node or edge, or None for other maps."""
+        if _is_entity(value, "node", _NODE_KEYS):
+            nodes.setdefault(str(value["id"]), {
+                "labels": value["labels"],
+                "properties": value["properties"],
+            })
+            return {"type": "node", "id": value["id"]}
+        if _is_entity(value, "edge", _EDGE_KEYS):
+            edges.setdefault(str(value["id"]), {
+                "relation": value["relation"],
+                "src_node": value["src_node"],
+                "dest_node": value["dest_node"],
+                "properties": value["properties"],
+            })
+            return {"type": "edge", "id": value["id"]}
+        return None
+
+    # Walked with an explicit stack, as in service._serialize_value, so deeply
+    # nested values cannot hit the recursion limit. Children are pushed in
+    # reverse so entities are tabled in the order they first appear.
+    # (value, container receiving the result, key or index in it)
+    holder: List[Any] = [None]
+    stack: List[Tuple[Any, Any, Any]] = [(data["result_set"], holder, 0)]
+    while stack:
+        item, target, key = stack.pop()
+        if isinstance(item, list):
+            copy: Any = list(item)
+            children: Any = enumerate(item)
+        elif isinstance(item, dict):
+            replacement = reference(item)
+            if replacement is not None:
+                target[key] = replacement
+                continue
+            copy = dict(item)
+            children = item.items()
+        else:
+            continue
+        target[key] = copy
+        for child_key, child in reversed(list(children)):
+            if isinstance(child, (list, dict)):
+                stack.append((child, copy, child_key))
+
+    rows = holder[0]
+    return {**data, "result_set": rows, "nodes": nodes, "edges": edges}
+
+
+def to_columnar(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a row-oriented execute_query result into one array per column.
+
+    Args:
+        data: Result with ``result_set`` rows and ``headers``
+
+    Returns:
+        The result with ``result_set`` and ``headers`` replaced by
+        ``columns`` (each with a name and its values, possibly run-length or
+        dictionary encoded) and ``row_count``
+    """
+    rows = data["result_set"]
+    names = [_column_name(header) for header in data.get("headers") or []]
+    width = max([len(names)] + [len(row) for row in rows])
+    names += [None] * (width - len(names))
+
+    columns = [
+        _encode_column(name, [row[index] if index < len(row) else None for row in rows])
+        for index, name in enumerate(names)
+    ]
+    shaped = {key: value for key, value in data.items() if key not in ("result_set", "headers")}
+    return {"format": COLUMNAR, "columns": columns, "row_count": len(rows), **shaped}
+
+
+def shape_result(
+    data: Dict[str, Any], format: str = ROWS, normalize: bool = False
+) -> Dict[str, Any]:
+    """
+    Lay out an execute_query result in the requested format.
+
+    Embedding vectors are projected earlier, by the service, so the result
+    budgets measure rows as they are sent.
+
+    Args:
+        data: Row-oriented result from the service
+        format: "rows" (unchanged) or "columnar"
+        normalize: Move nodes and edges into tables referenced by id
+
+    Returns:
+        Result in the requested layout
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unknown result format '{format}', expected one of {FORMATS}")
+    if normalize:
+        data = normalize_entities(data)
+    if format == COLUMNAR:
+        return to_columnar(data)
+    return data
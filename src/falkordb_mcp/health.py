@@ -0,0 +1,180 @@
+"""Background health probing of the FalkorDB primary."""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Reported before the first probe completes
+UNKNOWN = "unknown"
+CONNECTED = "connected"
+DISCONNECTED = "disconnected"
+
+# Name FalkorDB registers its module under in MODULE LIST
+MODULE_NAME = "graph"
+
+
+def percentile(values: Sequence[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of sorted ``values``, or None when empty."""
+    if not values:
+        return None
+    rank = min(len(values), max(1, math.ceil(fraction * len(values)))) - 1
+    return values[rank]
+
+
+def module_version(modules: Sequence[Dict[str, Any]]) -> Optional[str]:
+    """
+    FalkorDB version from a ``MODULE LIST`` reply.
+
+    Modules report versions as one integer, e.g. ``41206`` for ``4.12.6``.
+    """
+    for module in modules:
+        if module.get("name") == MODULE_NAME:
+            version = int(module.get("ver", 0))
+            return f"{version // 10000}.{version // 100 % 100}.{version % 100}"
+    return None
+
+
+def replication(info: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Replication role and lag from an ``INFO`` reply.
+
+    Returns:
+        For a primary, its replicas with their link state, lag in seconds
+        and how many bytes of the replication stream they are behind; for a
+        replica, its link state and seconds since it heard from the primary
+    """
+    role = info.get("role")
+    if role == "slave":
+        return {
+            "role": "replica",
+            "link_status": info.get("master_link_status"),
+            "lag_s": info.get("master_last_io_seconds_ago"),
+            "sync_in_progress": bool(info.get("master_sync_in_progress")),
+        }
+    offset = info.get("master_repl_offset", 0)
+    replicas: List[Dict[str, Any]] = []
+    for index in range(int(info.get("connected_slaves", 0))):
+        replica = info.get(f"slave{index}")
+        if not isinstance(replica, dict):
+            continue
+        replicas.append({
+            "address": f"{replica.get('ip')}:{replica.get('port')}",
+            "state": replica.get("state"),
+            "lag_s": replica.get("lag"),
+            "offset_lag": max(0, offset - int(replica.get("offset", 0))),
+        })
+    return {"role": "primary" if role == "master" else role, "replicas": replicas}
+
+
+class HealthProber:
+    """Periodically measures FalkorDB and keeps the latest readings.
+
+    Every probe pings the primary and reads ``INFO`` and ``MODULE LIST``.
+    Ping round-trip times are kept for the last ``window`` probes so
+    percentiles reflect recent latency, and :meth:`status` answers from
+    these readings without contacting the database.
+    """
+
+    def __init__(self, interval: float, window: int):
+        """
+        Initialize the prober.
+
+        Args:
+            interval: Seconds between probes
+            window: Number of recent ping round-trip times kept
+        """
+        self.interval = interval
+        self._rtts: Deque[float] = deque(maxlen=max(1, window))
+        self._status = UNKNOWN
+        self._probed_at: Optional[float] = None
+        self._server: Dict[str, Any] = {}
+        self._probes = 0
+        self._failures = 0
+        self._consecutive_failures = 0
+        self._last_error: Optional[str] = None
+
+    async def probe(self, connection: Any) -> None:
+        """
+        Take one set of readings; never raises.
+
+        Args:
+            connection: Redis client of the FalkorDB primary
+        """
+        timeout = max(1.0, self.interval)
+        self._probes += 1
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(connection.ping(), timeout)
+        except Exception as e:
+            self._record_failure(e if str(e) else TimeoutError("ping timed out"))
+            return
+        self._rtts.append(round((time.perf_counter() - start) * 1000, 3))
+        self._status = CONNECTED
+        self._consecutive_failures = 0
+        self._probed_at = time.monotonic()
+
+        try:
+            info = await asyncio.wait_for(connection.info(), timeout)
+            modules = await asyncio.wait_for(connection.module_list(), timeout)
+        except Exception as e:
+            # Keep the previous readings; the server still answered the ping
+            self._last_error = str(e)
+            logger.warning(f"Error reading FalkorDB server info: {e}")
+            return
+        self._server = {
+            "version": module_version(modules),
+            "redis_version": info.get("redis_version"),
+            "uptime_s": info.get("uptime_in_seconds"),
+            "used_memory": info.get("used_memory"),
+            "used_memory_peak": info.get("used_memory_peak"),
+            "connected_clients": info.get("connected_clients"),
+            "blocked_clients": info.get("blocked_clients"),
+            "replication": replication(info),
+        }
+        self._last_error = None
+
+    def _record_failure(self, error: BaseException) -> None:
+        self._status = DISCONNECTED
+        self._failures += 1
+        self._consecutive_failures += 1
+        self._last_error = str(error)
+        self._probed_at = time.monotonic()
+        if self._consecutive_failures == 1:
+            logger.warning(f"FalkorDB health probe failed: {error}")
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Report the latest readings.
+
+        Returns:
+            Dictionary with the connection status, ping round-trip
+            percentiles in milliseconds, server version, memory, clients and
+            replication readings, failure counters and the readings' age
+        """
+        rtts = sorted(self._rtts)
+        return {
+            "status": self._status,
+            "age_s": (
+                None if self._probed_at is None
+                else round(time.monotonic() - self._probed_at, 3)
+            ),
+            "ping_ms": {
+                "samples": len(rtts),
+                "last": self._rtts[-1] if self._rtts else None,
+                "p50": percentile(rtts, 0.5),
+                "p90": percentile(rtts, 0.9),
+                "p99": percentile(rtts, 0.99),
+                "max": rtts[-1] if rtts else None,
+            },
+            **self._server,
+            "interval_s": self.interval,
+            "probes": self._probes,
+            "failures": self._failures,
+            "consecutive_failures": self._consecutive_failures,
+            "last_error": self._last_error,
+        }
@@ -0,0 +1,332 @@
+"""Sampled property-type schema inference per label and relationship type."""
+
+import hashlib
+import json
+import math
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .metadata import _quote
+from .vectors import is_vector
+
+NODE = "node"
+RELATIONSHIP = "relationship"
+
+
+class HyperLogLog:
+    """HyperLogLog distinct-value sketch with ``2 ** precision`` registers.
+
+    Precision 10 uses 1 KiB per sketch for a standard error of about 3%.
+    Adding a value seen before leaves the sketch unchanged, so refreshed
+    samples are simply added to the sketch built from earlier ones.
+    """
+
+    def __init__(self, precision: int = 10):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            precision: Number of index bits (4 to 16)
+        """
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    @staticmethod
+    def _hash(value: Any) -> int:
+        encoded = json.dumps(value, sort_keys=True, default=str).encode()
+        return int.from_bytes(hashlib.blake2b(encoded, digest_size=8).digest(), "big")
+
+    def add(self, value: Any) -> None:
+        """Add a JSON-compatible value to the sketch."""
+        hashed = self._hash(value)
+        bits = 64 - self.precision
+        index = hashed >> bits
+        rest = hashed & ((1 << bits) - 1)
+        # Position of the leftmost 1-bit in the remaining bits
+        rank = bits - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def count(self) -> int:
+        """Estimated number of distinct values added."""
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * size and zeros:
+            # Linear counting is more accurate for small cardinalities
+            estimate = size * math.log(size / zeros)
+        return int(round(estimate))
+
+
+def value_type(value: Any, vector_min_dims: int) -> str:
+    """Name of a serialized property value's type."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "integer"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "vector" if is_vector(value, vector_min_dims) else "list"
+    if isinstance(value, dict):
+        return "point" if set(value) == {"latitude", "longitude"} else "map"
+    return type(value).__name__
+
+
+@dataclass
+class PropertyProfile:
+    """Observed types and distinct values of one property."""
+
+    present: int = 0
+    types: Counter = field(default_factory=Counter)
+    distinct: HyperLogLog = field(default_factory=HyperLogLog)
+
+
+@dataclass
+class EntityProfile:
+    """Sampled properties of one label or relationship type."""
+
+    kind: str
+    name: str
+    sampled: int = 0
+    rows_read: int = 0
+    properties: Dict[str, PropertyProfile] = field(default_factory=dict)
+
+    def add(self, properties: Dict[str, Any], vector_min_dims: int) -> None:
+        """Record one sampled entity's properties."""
+        self.sampled += 1
+        for key, value in properties.items():
+            profile = self.properties.setdefault(key, PropertyProfile())
+            kind = value_type(value, vector_min_dims)
+            if kind == "null":
+                continue
+            profile.present += 1
+            profile.types[kind] += 1
+            profile.distinct.add(value)
+
+    def to_dict(self, count: Optional[int]) -> Dict[str, Any]:
+        """
+        Summarize the profile.
+
+        Args:
+            count: Total entities with this label or type, if known
+
+        Returns:
+            Dictionary with sample size and, per property, observed type
+            counts, null rate and a distinct-value estimate over the sample
+        """
+        properties = {}
+        for key, profile in sorted(self.properties.items()):
+            properties[key] = {
+                "types": dict(profile.types.most_common()),
+                "null_rate": round(1 - profile.present / self.sampled, 4),
+                # The sketch can overshoot slightly; never report more
+                # distinct values than were observed
+                "distinct_estimate": min(profile.distinct.count(), profile.present),
+            }
+        return {
+            "count": count,
+            "sampled": self.sampled,
+            "rows_read": self.rows_read,
+            "properties": properties,
+        }
+
+
+def probe_query(kind: str, name: str, limit: int) -> str:
+    """
+    Query returning up to ``limit`` entities with id ``>= $start``.
+
+    FalkorDB turns the id filter into a seek on the label or relation
+    matrix, so each probe reads about ``limit`` rows wherever it starts.
+    """
+    if kind == NODE:
+        return (
+            f"MATCH (e:{_quote(name)}) WHERE id(e) >= $start "
+            f"RETURN id(e), properties(e) LIMIT {limit}"
+        )
+    return (
+        f"MATCH ()-[e:{_quote(name)}]->() WHERE id(e) >= $start "
+        f"RETURN id(e), properties(e) LIMIT {limit}"
+    )
+
+
+def plan_probes(
+    count: int, id_bound: int, sample_size: int, probes: int, rng: random.Random
+) -> Tuple[List[int], int]:
+    """
+    Choose where to probe a label or type and how many rows each probe reads.
+
+    Small populations are read in full with one probe. Otherwise the id
+    range is cut into ``probes`` equal strata and each is probed from a
+    random point, so the sample spans old and new entities alike.
+
+    Args:
+        count: Entities with the label or type
+        id_bound: Upper bound of the id range (the graph's entity count)
+        sample_size: Entities wanted in the sample
+        probes: Number of probes for large populations
+        rng: Random source
+
+    Returns:
+        Tuple of probe start ids and the row limit per probe
+    """
+    if count <= sample_size:
+        return [0], max(1, count)
+    if probes <= 1:
+        return [0], sample_size
+    stride = max(1, id_bound // probes)
+    starts = [index * stride + rng.randrange(stride) for index in range(probes)]
+    # Read twice what is kept so the reservoir has rows to choose from
+    return starts, max(1, math.ceil(2 * sample_size / probes))
+
+
+def reservoir(rows: Iterable[Any], size: int, rng: random.Random) -> List[Any]:
+    """Uniform sample of at most ``size`` rows in one pass (Algorithm R)."""
+    sample: List[Any] = []
+    for seen, row in enumerate(rows):
+        if seen < size:
+            sample.append(row)
+        else:
+            slot = rng.randrange(seen + 1)
+            if slot < size:
+                sample[slot] = row
+    return sample
+
+
+def unique_rows(results: Sequence[Any]) -> Tuple[List[Any], int]:
+    """
+    Merge probe results, dropping entities seen by more than one probe.
+
+    Returns:
+        Tuple of the distinct ``[id, properties]`` rows and the rows read
+    """
+    seen = set()
+    rows = []
+    read = 0
+    for result in results:
+        for row in result.result_set or []:
+            read += 1
+            if row[0] not in seen:
+                seen.add(row[0])
+                rows.append(row)
+    return rows, read
+
+
+@dataclass
+class InferredSchema:
+    """Cached inference result of one graph."""
+
+    profiles: Dict[Tuple[str, str], EntityProfile] = field(default_factory=dict)
+    # Entity counts per (kind, name) from the last refresh's metadata
+    counts: Dict[Tuple[str, str], int] = field(default_factory=dict)
+    refreshed_at: float = field(default_factory=time.monotonic)
+    refreshes: int = 0
+    stale: bool = False
+    # Set by writes that kept labels and indexes; the next call refreshes
+    changed: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Summarize every profile.
+
+        Returns:
+            Dictionary with ``nodes`` per label and ``relationships`` per
+            type, plus the number of refreshes and the age in seconds
+        """
+        sections: Dict[str, Dict[str, Any]] = {NODE: {}, RELATIONSHIP: {}}
+        for (kind, name), profile in sorted(self.profiles.items()):
+            sections[kind][name] = profile.to_dict(self.counts.get((kind, name)))
+        return {
+            "nodes": sections[NODE],
+            "relationships": sections[RELATIONSHIP],
+            "refreshes": self.refreshes,
+            "age_s": round(time.monotonic() - self.refreshed_at, 3),
+        }
+
+
+class InferenceCache:
+    """Per-graph inferred schemas, refreshed incrementally.
+
+    After ``ttl`` seconds an entry is refreshed by sampling again and
+    rebuilding its profiles from the new rows, so each profile stays
+    bounded by the sample size. A write that adds or removes labels or
+    indexes marks the entry stale, and the next call replaces it with a
+    new entry; any other write only makes the next call refresh it.
+    """
+
+    def __init__(self, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an inferred schema is served before a refresh
+        """
+        self.ttl = ttl
+        self._entries: Dict[str, InferredSchema] = {}
+        self._hits = 0
+        self._refreshes = 0
+        self._rebuilds = 0
+
+    def lookup(self, graph_name: str, refresh: bool = False) -> Tuple[InferredSchema, bool]:
+        """
+        Get the entry for a graph and whether it must be sampled again.
+
+        Returns:
+            Tuple of the entry (new when missing or stale) and True when the
+            caller should sample again and rebuild its profiles
+        """
+        entry = self._entries.get(graph_name)
+        if entry is None or entry.stale:
+            self._rebuilds += 1
+            return InferredSchema(), True
+        if refresh or entry.changed or time.monotonic() - entry.refreshed_at >= self.ttl:
+            self._refreshes += 1
+            return entry, True
+        self._hits += 1
+        return entry, False
+
+    def store(self, graph_name: str, entry: InferredSchema) -> None:
+        """Save a sampled entry."""
+        entry.refreshed_at = time.monotonic()
+        entry.refreshes += 1
+        entry.changed = False
+        self._entries[graph_name] = entry
+
+    def mark_stale(self, graph_name: str) -> None:
+        """Force the next call for a graph to rebuild from scratch."""
+        entry = self._entries.get(graph_name)
+        if entry is not None:
+            entry.stale = True
+
+    def mark_changed(self, graph_name: str) -> None:
+        """Make the next call for a graph rebuild its profiles from a new sample."""
+        entry = self._entries.get(graph_name)
+        if entry is not None:
+            entry.changed = True
+
+    def clear(self) -> None:
+        """Drop every inferred schema."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report cache usage.
+
+        Returns:
+            Dictionary with entry count, hits, refreshes and rebuilds
+        """
+        return {
+            "entries": len(self._entries),
+            "ttl": self.ttl,
+            "hits": self._hits,
+            "refreshes": self._refreshes,
+            "rebuilds": self._rebuilds,
+        }
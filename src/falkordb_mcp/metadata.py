@@ -0,0 +1,128 @@
+"""Graph metadata queries, sent as pipelines so a graph is described in few round trips."""
+
+from typing import Any, Dict, List, Sequence
+
+# Procedures describing a graph's schema, in the order their results are read
+SCHEMA_PROCEDURES = (
+    "CALL db.labels()",
+    "CALL db.relationshipTypes()",
+    "CALL db.propertyKeys()",
+    "CALL db.indexes()",
+)
+
+# Statistics of writes that can change a graph's labels, relationship types,
+# property keys, indexes or entity counts
+SCHEMA_STATISTICS = (
+    "nodes_created",
+    "nodes_deleted",
+    "relationships_created",
+    "relationships_deleted",
+    "properties_set",
+    "labels_added",
+    "labels_removed",
+    "indices_created",
+    "indices_deleted",
+)
+
+
+def changes_schema(statistics: Dict[str, Any]) -> bool:
+    """Whether write statistics show a change that stale cached metadata."""
+    return any(statistics.get(name) for name in SCHEMA_STATISTICS)
+
+
+# Statistics of writes that change which labels or indexes exist, after
+# which inferred property profiles are rebuilt rather than refreshed
+STRUCTURE_STATISTICS = (
+    "labels_added",
+    "labels_removed",
+    "indices_created",
+    "indices_deleted",
+)
+
+
+def changes_structure(statistics: Dict[str, Any]) -> bool:
+    """Whether write statistics show labels or indexes were added or removed."""
+    return any(statistics.get(name) for name in STRUCTURE_STATISTICS)
+
+
+def _quote(name: str) -> str:
+    """Backtick-quote a label or relationship type for use in a pattern."""
+    return "`" + name.replace("`", "``") + "`"
+
+
+# Whole-graph counts, sent after the per-label and per-type counts. A node
+# with several labels is counted once here but once per label above.
+TOTAL_COUNT_QUERIES = (
+    "MATCH (n) RETURN count(n)",
+    "MATCH ()-[r]->() RETURN count(r)",
+)
+
+
+def count_queries(labels: Sequence[str], relationship_types: Sequence[str]) -> List[str]:
+    """
+    Count queries for every label and relationship type, then the totals.
+
+    FalkorDB answers single-label, single-type and whole-graph counts from
+    its label and relation matrices, so these do not scan the graph.
+
+    Args:
+        labels: Node labels, counted first
+        relationship_types: Relationship types, counted after the labels
+
+    Returns:
+        One query per label, one per relationship type, then the total node
+        and relationship counts
+    """
+    return [f"MATCH (n:{_quote(label)}) RETURN count(n)" for label in labels] + [
+        f"MATCH ()-[r:{_quote(rel_type)}]->() RETURN count(r)"
+        for rel_type in relationship_types
+    ] + list(TOTAL_COUNT_QUERIES)
+
+
+def first_column(result: Any) -> List[Any]:
+    """Values of a result's first column, such as the names from ``db.labels()``."""
+    return [row[0] for row in result.result_set or []]
+
+
+def _index_rows(result: Any, serialize: Any) -> List[Dict[str, Any]]:
+    """Rows of ``CALL db.indexes()`` as dictionaries keyed by column name."""
+    names = [column[1] for column in result.header or []]
+    return [dict(zip(names, serialize(row))) for row in result.result_set or []]
+
+
+def build_metadata(
+    graph_name: str,
+    schema_results: Sequence[Any],
+    count_results: Sequence[Any],
+    serialize: Any,
+) -> Dict[str, Any]:
+    """
+    Assemble the metadata dictionary from pipelined query results.
+
+    Args:
+        graph_name: Name of the graph
+        schema_results: Results of :data:`SCHEMA_PROCEDURES`, in order
+        count_results: Results of :func:`count_queries`, in order
+        serialize: Row serializer turning FalkorDB values into JSON types
+
+    Returns:
+        Dictionary with labels, relationship types, property keys, indexes,
+        node/relationship counts per label and type, and the graph's total
+        node and relationship counts
+    """
+    labels_result, types_result, keys_result, indexes_result = schema_results
+    labels = first_column(labels_result)
+    relationship_types = first_column(types_result)
+    counts = [(first_column(result) or [0])[0] for result in count_results]
+    typed = len(labels) + len(relationship_types)
+    return {
+        "name": graph_name,
+        "labels": labels,
+        "relationship_types": relationship_types,
+        "property_keys": first_column(keys_result),
+        "indexes": _index_rows(indexes_result, serialize),
+        "node_counts": dict(zip(labels, counts[:len(labels)])),
+        "relationship_counts": dict(zip(relationship_types, counts[len(labels):typed])),
+        "node_count": counts[typed],
+        "relationship_count": counts[typed + 1],
+    }
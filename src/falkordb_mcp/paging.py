@@ -0,0 +1,218 @@
+"""Result budgets and continuation tokens for execute_query."""
+
+import base64
+import binascii
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from .config import config
+from .cypher import strip_comments, strip_literals
+from .vectors import KEEP, POLICIES
+
+# Clauses after which SKIP/LIMIT cannot simply be appended
+_UNION = re.compile(r"(?<![.:$\w])UNION\b", re.IGNORECASE)
+_RETURN = re.compile(r"(?<![.:$\w])RETURN\b", re.IGNORECASE)
+_SKIP_OR_LIMIT = re.compile(r"(?<![.:$\w])(?:SKIP|LIMIT)\b", re.IGNORECASE)
+
+TOKEN_VERSION = 1
+
+
+class InvalidContinuationError(ValueError):
+    """Raised when a continuation token is malformed or belongs to another query."""
+
+
+@dataclass
+class Page:
+    """Which slice of a result to return and how much of it fits."""
+
+    offset: int = 0
+    max_rows: int = 0
+    max_bytes: int = 0
+    # True when SKIP/LIMIT were added to the query, so FalkorDB only sent
+    # this page; otherwise ``offset`` rows are skipped on the client
+    server_side: bool = False
+    # Vector projection applied to rows before they are measured
+    vectors: str = KEEP
+
+
+def pageable(query: str) -> bool:
+    """
+    Whether SKIP/LIMIT can be appended to a read query.
+
+    That holds when the query ends in a RETURN clause without its own SKIP or
+    LIMIT and is not a UNION.
+
+    Args:
+        query: Cypher query text
+
+    Returns:
+        True if :func:`paged_query` may rewrite the query
+    """
+    scrubbed = strip_literals(query)
+    returns = list(_RETURN.finditer(scrubbed))
+    if not returns or _UNION.search(scrubbed):
+        return False
+    return not _SKIP_OR_LIMIT.search(scrubbed, returns[-1].end())
+
+
+def paged_query(query: str, offset: int, limit: int) -> str:
+    """
+    Append SKIP/LIMIT to a pageable query.
+
+    Comments are dropped first, as in :func:`~falkordb_mcp.cursors.keyset_query`,
+    so a trailing ``//`` comment cannot swallow the clauses and a ``;``
+    followed by a comment is still removed.
+
+    Args:
+        query: Query accepted by :func:`pageable`
+        offset: Rows to skip
+        limit: Rows to return
+
+    Returns:
+        Rewritten query
+    """
+    clauses = f"SKIP {offset} LIMIT {limit}" if offset else f"LIMIT {limit}"
+    return f"{strip_comments(query).strip().rstrip(';').rstrip()}\n{clauses}"
+
+
+def _fingerprint(graph_name: str, query: str, params: Optional[Dict[str, Any]]) -> str:
+    """Short digest tying a token to one graph, query and parameter set."""
+    normalized = " ".join(query.split())
+    encoded = json.dumps([graph_name, normalized, params or {}], sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()[:16]
+
+
+def encode_token(
+    graph_name: str, query: str, params: Optional[Dict[str, Any]], offset: int
+) -> str:
+    """
+    Build the continuation token for the rows after ``offset``.
+
+    Args:
+        graph_name: Name of the graph
+        query: Query as sent by the caller
+        params: Parameters as sent by the caller
+        offset: Rows returned so far
+
+    Returns:
+        Opaque URL-safe token
+    """
+    payload = {
+        "v": TOKEN_VERSION,
+        "fp": _fingerprint(graph_name, query, params),
+        "offset": offset,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_token(
+    token: str, graph_name: str, query: str, params: Optional[Dict[str, Any]]
+) -> int:
+    """
+    Read the offset from a continuation token.
+
+    Args:
+        token: Token from a previous truncated response
+        graph_name: Name of the graph of the current call
+        query: Query of the current call
+        params: Parameters of the current call
+
+    Returns:
+        Number of rows to skip
+
+    Raises:
+        InvalidContinuationError: If the token is malformed or was issued
+            for a different graph, query or parameters
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+        offset = int(payload["offset"])
+        fingerprint = payload["fp"]
+        version = payload["v"]
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise InvalidContinuationError(f"Malformed continuation token: {e}") from None
+
+    if version != TOKEN_VERSION or offset < 0:
+        raise InvalidContinuationError("Unsupported continuation token")
+    if fingerprint != _fingerprint(graph_name, query, params):
+        raise InvalidContinuationError(
+            "Continuation token was issued for a different graph, query or parameters"
+        )
+    return offset
+
+
+def resolve_vectors(vectors: Optional[str]) -> str:
+    """
+    Resolve a per-call vector policy against FALKORDB_VECTOR_POLICY.
+
+    Raises:
+        ValueError: If the policy is unknown
+    """
+    vectors = vectors or config.vector_policy
+    if vectors not in POLICIES:
+        raise ValueError(f"Unknown vector policy '{vectors}', expected one of {POLICIES}")
+    return vectors
+
+
+def plan_page(
+    graph_name: str,
+    query: str,
+    params: Optional[Dict[str, Any]],
+    read_only: bool,
+    max_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    continuation: Optional[str] = None,
+    vectors: Optional[str] = None,
+) -> Page:
+    """
+    Work out the page a call returns.
+
+    Args:
+        graph_name: Name of the graph
+        query: Query as sent by the caller
+        params: Parameters as sent by the caller
+        read_only: Whether the query runs on the read-only path
+        max_rows: Row budget (None uses FALKORDB_RESULT_MAX_ROWS, 0 is unlimited)
+        max_bytes: Encoded size budget (None uses FALKORDB_RESULT_MAX_BYTES,
+            0 is unlimited)
+        continuation: Token from the previous page, if any
+        vectors: Vector projection of the returned rows (None uses
+            FALKORDB_VECTOR_POLICY), so the size budget counts rows as sent
+
+    Returns:
+        Page to fetch. Writes get no row or size budget: they already ran,
+        so rows cut off could never be fetched.
+
+    Raises:
+        InvalidContinuationError: If the token is invalid or the query writes
+        ValueError: If a budget is negative or the vector policy is unknown
+    """
+    if max_rows is None:
+        max_rows = config.result_max_rows
+    if max_bytes is None:
+        max_bytes = config.result_max_bytes
+    if max_rows < 0 or max_bytes < 0:
+        raise ValueError("max_rows and max_bytes must not be negative")
+    vectors = resolve_vectors(vectors)
+
+    offset = 0
+    if continuation:
+        if not read_only:
+            # Re-running a write to fetch its next page would repeat the write
+            raise InvalidContinuationError("Continuation tokens only apply to read-only queries")
+        offset = decode_token(continuation, graph_name, query, params)
+    if not read_only:
+        return Page(vectors=vectors)
+
+    return Page(
+        offset=offset,
+        max_rows=max_rows,
+        max_bytes=max_bytes,
+        server_side=read_only and max_rows > 0 and pageable(query),
+        vectors=vectors,
+    )
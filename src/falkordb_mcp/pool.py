@@ -0,0 +1,247 @@
+"""Bounded connection pool with per-graph fair queuing for the async service."""
+
+import asyncio
+import logging
+import time
+import weakref
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from redis.asyncio import BlockingConnectionPool
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+logger = logging.getLogger(__name__)
+
+# Queue key for server-level commands that do not target a graph (GRAPH.LIST, PING)
+SERVER_KEY = ""
+
+
+class PoolTimeoutError(TimeoutError):
+    """Raised when no connection becomes available within the acquire timeout."""
+
+
+class IdleConnectionPool(BlockingConnectionPool):
+    """Redis blocking pool that can disconnect connections left idle too long.
+
+    Idle connections stay in the pool as unconnected objects and reconnect
+    lazily the next time they are handed out, the same way redis-py treats
+    connections after ``ConnectionPool.disconnect(inuse_connections=False)``.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._released_at: "weakref.WeakKeyDictionary[Any, float]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def get_connection(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Take a connection, waiting up to the pool timeout for one to free up.
+
+        Raises:
+            PoolTimeoutError: If every connection stayed in use; redis-py
+                reports this as a ConnectionError, which would otherwise be
+                mistaken for the server being unreachable
+        """
+        try:
+            return await super().get_connection(*args, **kwargs)
+        except RedisConnectionError as e:
+            if isinstance(e.__cause__, asyncio.TimeoutError):
+                raise PoolTimeoutError("No connection available") from e
+            raise
+
+    async def release(self, connection: Any) -> None:
+        """Return a connection to the pool and remember when it went idle."""
+        self._released_at[connection] = time.monotonic()
+        await super().release(connection)
+
+    def open_connections(self) -> int:
+        """Number of pooled connections that currently hold a socket."""
+        idle = sum(1 for conn in self._available_connections if conn.is_connected)
+        return idle + len(self._in_use_connections)
+
+    async def disconnect_idle(self, idle_timeout: float, keep: int) -> int:
+        """
+        Disconnect connections idle for longer than ``idle_timeout`` seconds.
+
+        Args:
+            idle_timeout: Seconds a connection may sit unused before closing
+            keep: Minimum number of open connections to leave in place
+
+        Returns:
+            Number of connections disconnected
+        """
+        now = time.monotonic()
+        open_count = self.open_connections()
+        closed = 0
+        # Released connections are appended, so the front holds the oldest
+        for conn in list(self._available_connections):
+            if open_count <= keep:
+                break
+            if not conn.is_connected:
+                continue
+            if now - self._released_at.get(conn, now) >= idle_timeout:
+                await conn.disconnect()
+                open_count -= 1
+                closed += 1
+        if closed:
+            logger.debug(f"Disconnected {closed} idle FalkorDB connection(s)")
+        return closed
+
+
+class FairConnectionPool:
+    """Admits at most ``max_size`` concurrent database calls, fairly per graph.
+
+    Each graph has its own FIFO of waiters. When a connection frees up it is
+    handed to the next graph in round-robin order, so a burst against one hot
+    graph queues behind itself instead of starving other graphs. A graph may
+    never hold more than ``max_per_graph`` connections at once.
+    """
+
+    def __init__(self, max_size: int, max_per_graph: int, acquire_timeout: float):
+        """
+        Initialize the pool.
+
+        Args:
+            max_size: Maximum concurrent connections across all graphs
+            max_per_graph: Maximum concurrent connections for a single graph
+                (0 means three quarters of ``max_size``)
+            acquire_timeout: Seconds to wait for a connection before failing
+        """
+        self.max_size = max(1, max_size)
+        self.max_per_graph = min(
+            self.max_size, max_per_graph or max(1, (self.max_size * 3) // 4)
+        )
+        self.acquire_timeout = acquire_timeout
+        self._in_use = 0
+        self._in_use_by_graph: Dict[str, int] = {}
+        # Insertion order doubles as the round-robin order across graphs
+        self._waiters: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+        self._acquired_total = 0
+        self._timeouts_total = 0
+        self._wait_seconds_total = 0.0
+
+    @property
+    def waiting(self) -> int:
+        """Number of callers queued for a connection."""
+        return sum(len(queue) for queue in self._waiters.values())
+
+    def _has_capacity(self, key: str) -> bool:
+        return (
+            self._in_use < self.max_size
+            and self._in_use_by_graph.get(key, 0) < self.max_per_graph
+        )
+
+    def _grant(self, key: str) -> None:
+        self._in_use += 1
+        self._in_use_by_graph[key] = self._in_use_by_graph.get(key, 0) + 1
+        self._acquired_total += 1
+
+    def _dispatch(self) -> None:
+        """Hand free connections to waiting graphs in round-robin order."""
+        while self._in_use < self.max_size and self._waiters:
+            for key in list(self._waiters):
+                if self._in_use_by_graph.get(key, 0) < self.max_per_graph:
+                    break
+            else:
+                # Every waiting graph is at its per-graph cap
+                return
+
+            queue = self._waiters.pop(key)
+            waiter = queue.popleft()
+            if queue:
+                # Move the graph to the back of the rotation
+                self._waiters[key] = queue
+            if not waiter.done():
+                self._grant(key)
+                waiter.set_result(None)
+
+    async def acquire(self, graph_name: Optional[str] = None) -> None:
+        """
+        Wait for a connection slot for ``graph_name``.
+
+        Args:
+            graph_name: Graph the call targets (None for server-level commands)
+
+        Raises:
+            PoolTimeoutError: If no slot frees up within ``acquire_timeout``
+        """
+        key = graph_name or SERVER_KEY
+        if not self._waiters and self._has_capacity(key):
+            self._grant(key)
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(key, deque()).append(waiter)
+        # Other graphs' waiters may be parked at their cap while this one fits
+        self._dispatch()
+        start = time.monotonic()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.acquire_timeout)
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # Granted while we were giving up: hand the slot back
+                self.release(graph_name)
+            else:
+                waiter.cancel()
+                queue = self._waiters.get(key)
+                if queue is not None and waiter in queue:
+                    queue.remove(waiter)
+                    if not queue:
+                        del self._waiters[key]
+            if isinstance(e, asyncio.TimeoutError):
+                self._timeouts_total += 1
+                raise PoolTimeoutError(
+                    f"No FalkorDB connection available within {self.acquire_timeout}s "
+                    f"({self._in_use}/{self.max_size} in use)"
+                ) from None
+            raise
+        finally:
+            self._wait_seconds_total += time.monotonic() - start
+
+    def release(self, graph_name: Optional[str] = None) -> None:
+        """Return a connection slot taken by :meth:`acquire`."""
+        key = graph_name or SERVER_KEY
+        self._in_use -= 1
+        remaining = self._in_use_by_graph.get(key, 1) - 1
+        if remaining:
+            self._in_use_by_graph[key] = remaining
+        else:
+            self._in_use_by_graph.pop(key, None)
+        self._dispatch()
+
+    @asynccontextmanager
+    async def lease(self, graph_name: Optional[str] = None) -> AsyncIterator[None]:
+        """Hold a connection slot for the duration of the ``async with`` block."""
+        await self.acquire(graph_name)
+        try:
+            yield
+        finally:
+            self.release(graph_name)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report pool utilization.
+
+        Returns:
+            Dictionary with sizes, current usage, queue depth and counters
+        """
+        return {
+            "max_size": self.max_size,
+            "max_per_graph": self.max_per_graph,
+            "in_use": self._in_use,
+            "utilization": round(self._in_use / self.max_size, 3),
+            "waiting": self.waiting,
+            "in_use_by_graph": {
+                key or "<server>": count for key, count in self._in_use_by_graph.items()
+            },
+            "waiting_by_graph": {
+                key or "<server>": len(queue) for key, queue in self._waiters.items()
+            },
+            "acquired_total": self._acquired_total,
+            "timeouts_total": self._timeouts_total,
+            "avg_wait_ms": round(
+                self._wait_seconds_total * 1000 / max(1, self._acquired_total), 3
+            ),
+        }
@@ -0,0 +1,173 @@
+"""Read-replica routing and load balancing for the async service."""
+
+import asyncio
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from falkordb.asyncio import FalkorDB
+from falkordb.asyncio.graph import AsyncGraph
+
+from .cache import GraphHandleCache
+from .pool import IdleConnectionPool
+
+logger = logging.getLogger(__name__)
+
+ROUND_ROBIN = "round_robin"
+LEAST_OUTSTANDING = "least_outstanding"
+STRATEGIES = (ROUND_ROBIN, LEAST_OUTSTANDING)
+
+
+class Replica:
+    """One read replica: its client, graph handles and health state."""
+
+    def __init__(self, host: str, port: int, connection_pool: IdleConnectionPool,
+                 graph_cache_size: int):
+        """
+        Initialize the replica.
+
+        Args:
+            host: Replica hostname
+            port: Replica port
+            connection_pool: Connection pool for this replica
+            graph_cache_size: Maximum number of graph handles to keep
+        """
+        self.host = host
+        self.port = port
+        self.connection_pool = connection_pool
+        self.client = FalkorDB(connection_pool=connection_pool)
+        self.graphs = GraphHandleCache(graph_cache_size)
+        self.healthy = True
+        self.outstanding = 0
+        self.requests_total = 0
+        self.failures_total = 0
+        self.last_rtt_ms: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    @property
+    def address(self) -> str:
+        """Replica address as host:port."""
+        return f"{self.host}:{self.port}"
+
+    def select_graph(self, graph_name: str) -> AsyncGraph:
+        """Get a cached graph handle bound to this replica."""
+        return self.graphs.get(graph_name, self.client.select_graph)
+
+    def stats(self) -> Dict[str, Any]:
+        """Report this replica's health and load."""
+        return {
+            "address": self.address,
+            "healthy": self.healthy,
+            "outstanding": self.outstanding,
+            "requests_total": self.requests_total,
+            "failures_total": self.failures_total,
+            "last_rtt_ms": self.last_rtt_ms,
+            "last_error": self.last_error,
+        }
+
+
+class ReplicaRouter:
+    """Spreads read-only calls across healthy replicas.
+
+    Replicas that fail a health check, or answer it slower than
+    ``max_latency_ms``, are taken out of rotation until a later check passes.
+    When no replica is healthy, :meth:`choose` returns None and the caller
+    falls back to the primary.
+    """
+
+    def __init__(self, replicas: List[Replica], strategy: str = ROUND_ROBIN,
+                 max_latency_ms: float = 250.0):
+        """
+        Initialize the router.
+
+        Args:
+            replicas: Replica endpoints to balance across
+            strategy: "round_robin" or "least_outstanding"
+            max_latency_ms: Health-check RTT above which a replica is pulled
+
+        Raises:
+            ValueError: If the strategy is unknown
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(
+                f"Unknown replica strategy '{strategy}', expected one of {STRATEGIES}"
+            )
+        self.replicas = replicas
+        self.strategy = strategy
+        self.max_latency_ms = max_latency_ms
+        self._rotation = itertools.count()
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def choose(self) -> Optional[Replica]:
+        """Pick the replica for the next read, or None to use the primary."""
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        # Rotate the starting point so ties are broken round-robin too
+        start = next(self._rotation) % len(healthy)
+        ordered = healthy[start:] + healthy[:start]
+        if self.strategy == LEAST_OUTSTANDING:
+            return min(ordered, key=lambda replica: replica.outstanding)
+        return ordered[0]
+
+    @asynccontextmanager
+    async def track(self, replica: Replica) -> AsyncIterator[Replica]:
+        """Count a call as outstanding on ``replica`` while it runs."""
+        replica.outstanding += 1
+        replica.requests_total += 1
+        try:
+            yield replica
+        finally:
+            replica.outstanding -= 1
+
+    def mark_down(self, replica: Replica, error: Exception) -> None:
+        """Take a replica out of rotation after a connection failure."""
+        replica.failures_total += 1
+        replica.last_error = str(error)
+        if replica.healthy:
+            logger.warning(f"Replica {replica.address} taken out of rotation: {error}")
+        replica.healthy = False
+
+    async def check(self, replica: Replica) -> None:
+        """Ping one replica and update its place in the rotation."""
+        timeout = self.max_latency_ms / 1000 * 4
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(replica.client.connection.ping(), timeout)
+        except Exception as e:
+            self.mark_down(replica, e if str(e) else TimeoutError("health check timed out"))
+            return
+
+        replica.last_rtt_ms = round((time.perf_counter() - start) * 1000, 3)
+        if replica.last_rtt_ms > self.max_latency_ms:
+            self.mark_down(
+                replica,
+                TimeoutError(f"health check took {replica.last_rtt_ms} ms"),
+            )
+            return
+
+        if not replica.healthy:
+            logger.info(f"Replica {replica.address} back in rotation")
+        replica.healthy = True
+        replica.last_error = None
+
+    async def check_all(self) -> None:
+        """Health-check every replica concurrently."""
+        await asyncio.gather(*(self.check(replica) for replica in self.replicas))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report replica routing state.
+
+        Returns:
+            Dictionary with the strategy and per-replica health and load
+        """
+        return {
+            "strategy": self.strategy,
+            "healthy": sum(1 for replica in self.replicas if replica.healthy),
+            "replicas": [replica.stats() for replica in self.replicas],
+        }
@@ -6,15 +6,21 @@ A Model Context Protocol server for FalkorDB graph database using FastMCP.
 Provides tools and resources for querying and managing FalkorDB graphs.
 """
 
-import json
 import logging
+import time
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
+from . import __version__
+from .admission import ANONYMOUS, AdmissionRejectedError
+from .async_service import get_async_service
+from .cache import GraphNotFoundError
 from .config import config
-from .service import get_service
+from .encoding import dumps
+from .formats import ROWS, shape_result
+from .timeouts import QueryTimeoutError
 
 # Configure logging
 logging.basicConfig(
@@ -26,10 +32,106 @@ logger = logging.getLogger(__name__)
 # Initialize MCP server
 mcp = FastMCP("FalkorDB")
 
+# Stand-in for metadata.json_encode_ms, replaced once encoding has been timed
+_JSON_ENCODE_PLACEHOLDER = "__json_encode_ms__"
+
+
+def _progress_token(ctx: Optional[Context]) -> Any:
+    """
+    Progress token of the current request, if the client sent one.
+
+    Progress notifications are only delivered for requests carrying a token,
+    so streaming falls back to a single response without one.
+    """
+    if ctx is None:
+        return None
+    try:
+        meta = ctx.request_context.meta
+    except (AttributeError, LookupError, RuntimeError, ValueError):
+        return None
+    # A raw ``_meta`` dict on newer FastMCP releases, a pydantic model before
+    if isinstance(meta, dict):
+        return meta.get("progressToken")
+    return getattr(meta, "progressToken", None)
+
+
+def _client_key(ctx: Optional[Context]) -> str:
+    """
+    Identity admission control limits a call under.
+
+    The client id when the client sends one, else the MCP session id. Calls
+    made without a request context share one anonymous client.
+    """
+    if ctx is None:
+        return ANONYMOUS
+    try:
+        return ctx.client_id or ctx.session_id
+    except (AttributeError, LookupError, RuntimeError, ValueError):
+        return ANONYMOUS
+
+
+def _error_details(error: Exception) -> Dict[str, Any]:
+    """
+    Structured fields for errors a client can act on.
+
+    Returns:
+        ``errorType`` plus details for timeouts and admission rejections,
+        ``not_found`` for graphs known not to exist, or an empty
+        dictionary for other errors
+    """
+    if isinstance(error, QueryTimeoutError):
+        return {"errorType": "timeout", "timeout": error.to_dict()}
+    if isinstance(error, AdmissionRejectedError):
+        return {
+            "errorType": "overloaded",
+            "retryAfter": error.retry_after,
+            "admission": error.to_dict(),
+        }
+    if isinstance(error, GraphNotFoundError):
+        return {"errorType": "not_found"}
+    return {}
+
+
+def _dumps_timed(payload: Dict[str, Any], pretty: Optional[bool] = None) -> str:
+    """
+    Encode a tool response and report the encoding time in its metadata.
+
+    The placeholder is the last string in the document (``metadata`` comes
+    after ``data``), so it is found with a single reverse search instead of
+    encoding the result twice.
+
+    Args:
+        payload: Response with a trailing ``metadata`` dictionary
+        pretty: Indent the output (None uses the configured default)
+
+    Returns:
+        JSON string with ``metadata.json_encode_ms`` filled in
+    """
+    payload["metadata"]["json_encode_ms"] = _JSON_ENCODE_PLACEHOLDER
+    start = time.perf_counter()
+    encoded = dumps(payload, pretty)
+    elapsed_ms = round((time.perf_counter() - start) * 1000, 3)
+    head, _, tail = encoded.rpartition(f'"{_JSON_ENCODE_PLACEHOLDER}"')
+    return f"{head}{elapsed_ms}{tail}"
+
 
 @mcp.tool()
-def execute_query(
-    graph_name: str, query: str, params: Optional[Dict[str, Any]] = None
+async def execute_query(
+    graph_name: str,
+    query: str,
+    params: Optional[Dict[str, Any]] = None,
+    read_only: Optional[bool] = None,
+    parameterize: Optional[bool] = None,
+    format: str = ROWS,
+    normalize: bool = False,
+    vectors: Optional[str] = None,
+    max_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    continuation: Optional[str] = None,
+    stream: bool = False,
+    timeout_ms: Optional[int] = None,
+    pretty: Optional[bool] = None,
+    ctx: Optional[Context] = None,
 ) -> str:
     """
     Execute a Cypher query against a FalkorDB graph.
@@ -40,15 +142,72 @@ def execute_query(
         graph_name: Name of the graph to query
         query: Cypher query to execute (e.g., "MATCH (n:Person) RETURN n LIMIT 10")
         params: Optional query parameters as key-value pairs
+        read_only: Optional hint. True runs the query on the read-only path and
+            rejects writes, False forces the write path. When omitted the
+            query is classified automatically.
+        parameterize: Lift inline string and number literals into parameters
+            so variants of the query share one FalkorDB execution plan.
+            Defaults to the server setting.
+        format: "rows" for a list of row lists, or "columnar" for one array
+            per column (repetitive string columns are run-length or
+            dictionary encoded), which is much smaller for wide results
+        normalize: Emit each distinct node and edge once in "nodes"/"edges"
+            tables and refer to them by id in rows; use for path and
+            neighborhood queries that repeat the same entities
+        vectors: How to return embedding vectors (lists of 64+ floats):
+            "keep", "drop", "truncate" to a short preview, or "base64_f32" /
+            "base64_f16" packed blobs. Defaults to the server setting.
+        max_rows: Most rows to return (0 for no limit). Defaults to the
+            server setting.
+        max_bytes: Most bytes of row data to return (0 for no limit).
+            Defaults to the server setting.
+        continuation: When a result has "truncated": true, pass its
+            "continuation" token back with the same graph_name, query and
+            params to fetch the next page
+        stream: Send rows in chunks as progress notifications once the
+            query has finished, for large exports. The response then
+            holds headers, statistics and counts but no rows. Needs a
+            progress token on the request; ignored otherwise.
+        timeout_ms: Abort the query after this many milliseconds (0 for no
+            limit). Defaults to the server setting. A timed-out query fails
+            with "errorType": "timeout".
+        pretty: Indent the JSON response for human readers (default compact)
 
     Returns:
-        JSON string with query results and metadata
+        JSON string with query results and metadata. When the server is
+        overloaded the call fails with "errorType": "overloaded" and a
+        "retryAfter" hint in seconds.
     """
     try:
-        service = get_service()
-        result = service.execute_query(graph_name, query, params)
-
-        return json.dumps(
+        service = await get_async_service()
+        async with service.admission.admit(graph_name, _client_key(ctx)):
+            if stream and _progress_token(ctx) is not None:
+                async def send_chunk(chunk: Dict[str, Any], offset: int, total: int) -> None:
+                    shaped = shape_result(chunk, format, normalize)
+                    message = dumps({"offset": offset, **shaped}, False)
+                    await ctx.report_progress(offset + len(chunk["result_set"]), total, message)
+
+                result = await service.stream_query(
+                    graph_name, query, send_chunk, params, read_only=read_only,
+                    timeout_ms=timeout_ms, parameterize=parameterize, vectors=vectors,
+                )
+                result["streamed"] = True
+            else:
+                result = await service.execute_query(
+                    graph_name,
+                    query,
+                    params,
+                    read_only=read_only,
+                    parameterize=parameterize,
+                    max_rows=max_rows,
+                    max_bytes=max_bytes,
+                    continuation=continuation,
+                    timeout_ms=timeout_ms,
+                    vectors=vectors,
+                )
+                result = shape_result(result, format, normalize)
+
+        return _dumps_timed(
             {
                 "success": True,
                 "data": result,
@@ -58,125 +217,447 @@ def execute_query(
                     "timestamp": datetime.utcnow().isoformat(),
                 },
             },
-            indent=2,
+            pretty,
         )
     except Exception as e:
-        return json.dumps(
+        return dumps(
             {
                 "success": False,
                 "error": str(e),
+                **_error_details(e),
                 "graphName": graph_name,
                 "query": query,
             },
-            indent=2,
+            pretty,
         )
 
 
 @mcp.tool()
-def list_graphs() -> str:
+async def execute_batch(
+    queries: List[Dict[str, Any]],
+    pretty: Optional[bool] = None,
+    ctx: Optional[Context] = None,
+) -> str:
+    """
+    Execute several Cypher queries in a single round trip.
+
+    Use this instead of many execute_query calls when running a set of
+    independent checks, such as the COUNT queries used to validate a graph.
+
+    Args:
+        queries: List of items, each with "graph_name", "query" and optional
+            "params", "read_only" and "timeout_ms" keys
+        pretty: Indent the JSON response for human readers (default compact)
+
+    Returns:
+        JSON string with per-item results, errors and timings
+    """
+    try:
+        service = await get_async_service()
+        # A batch counts against its graph when it targets only one
+        graph_names = {item.get("graph_name") for item in queries if isinstance(item, dict)}
+        graph_name = graph_names.pop() if len(graph_names) == 1 else None
+        async with service.admission.admit(graph_name, _client_key(ctx)):
+            batch = await service.execute_batch(queries)
+
+        return dumps(
+            {
+                "success": True,
+                **batch,
+                "timestamp": datetime.utcnow().isoformat(),
+            },
+            pretty,
+        )
+    except Exception as e:
+        return dumps(
+            {
+                "success": False,
+                "error": str(e),
+                **_error_details(e),
+            },
+            pretty,
+        )
+
+
+@mcp.tool()
+async def open_cursor(
+    graph_name: str,
+    query: str,
+    params: Optional[Dict[str, Any]] = None,
+    page_size: Optional[int] = None,
+    format: str = ROWS,
+    normalize: bool = False,
+    vectors: Optional[str] = None,
+    pretty: Optional[bool] = None,
+    ctx: Optional[Context] = None,
+) -> str:
+    """
+    Open a cursor over a read-only query and return its first page.
+
+    Use this instead of execute_query to walk results too large for one
+    response, such as every node of a label. Fetch further pages with
+    fetch_cursor while "has_more" is true.
+
+    Args:
+        graph_name: Name of the graph to query
+        query: Read-only Cypher query, without its own SKIP/LIMIT
+        params: Optional query parameters as key-value pairs
+        page_size: Rows per page. Defaults to the server setting.
+        format: "rows" or "columnar", as for execute_query
+        normalize: Emit nodes and edges in tables, as for execute_query
+        vectors: Embedding vector projection, as for execute_query
+        pretty: Indent the JSON response for human readers (default compact)
+
+    Returns:
+        JSON string with the first page and its "cursor_id"
+    """
+    try:
+        service = await get_async_service()
+        async with service.admission.admit(graph_name, _client_key(ctx)):
+            page = await service.open_cursor(graph_name, query, params, page_size, vectors)
+
+        return dumps(
+            {
+                "success": True,
+                "data": shape_result(page, format, normalize),
+                "timestamp": datetime.utcnow().isoformat(),
+            },
+            pretty,
+        )
+    except Exception as e:
+        return dumps(
+            {
+                "success": False,
+                "error": str(e),
+                **_error_details(e),
+                "graphName": graph_name,
+                "query": query,
+            },
+            pretty,
+        )
+
+
+@mcp.tool()
+async def fetch_cursor(
+    cursor_id: str,
+    page_size: Optional[int] = None,
+    format: str = ROWS,
+    normalize: bool = False,
+    vectors: Optional[str] = None,
+    pretty: Optional[bool] = None,
+    ctx: Optional[Context] = None,
+) -> str:
+    """
+    Fetch the next page of a cursor opened with open_cursor.
+
+    The cursor closes itself after the last page ("has_more": false). Idle
+    cursors expire after "expires_in" seconds.
+
+    Args:
+        cursor_id: Id returned by open_cursor
+        page_size: Rows for this page. Defaults to the cursor's page size.
+        format: "rows" or "columnar", as for execute_query
+        normalize: Emit nodes and edges in tables, as for execute_query
+        vectors: Embedding vector projection, as for execute_query
+        pretty: Indent the JSON response for human readers (default compact)
+
+    Returns:
+        JSON string with the page, its position and whether more rows follow
+    """
+    try:
+        service = await get_async_service()
+        graph_name = service.cursors.get(cursor_id).graph_name
+        async with service.admission.admit(graph_name, _client_key(ctx)):
+            page = await service.fetch_cursor(cursor_id, page_size, vectors)
+
+        return dumps(
+            {
+                "success": True,
+                "data": shape_result(page, format, normalize),
+                "timestamp": datetime.utcnow().isoformat(),
+            },
+            pretty,
+        )
+    except Exception as e:
+        return dumps(
+            {
+                "success": False,
+                "error": str(e),
+                **_error_details(e),
+                "cursor_id": cursor_id,
+            },
+            pretty,
+        )
+
+
+@mcp.tool()
+async def close_cursor(cursor_id: str, pretty: Optional[bool] = None) -> str:
+    """
+    Close a cursor that is no longer needed before its last page.
+
+    Args:
+        cursor_id: Id returned by open_cursor
+        pretty: Indent the JSON response for human readers (default compact)
+
+    Returns:
+        JSON string reporting whether the cursor was still open
+    """
+    try:
+        service = await get_async_service()
+        closed = service.close_cursor(cursor_id)
+
+        return dumps(
+            {
+                "success": True,
+                "cursor_id": cursor_id,
+                "closed": closed,
+            },
+            pretty,
+        )
+    except Exception as e:
+        return dumps(
+            {
+                "success": False,
+                "error": str(e),
+                "cursor_id": cursor_id,
+            },
+            pretty,
+        )
+
+
+@mcp.tool()
+async def list_graphs(pretty: Optional[bool] = None) -> str:
     """
     List all available graphs in the FalkorDB instance.
 
+    Args:
+        pretty: Indent the JSON response for human readers (default compact)
+
     Returns:
         JSON string with list of graph names and count
     """
     try:
-        service = get_service()
-        graphs = service.list_graphs()
+        service = await get_async_service()
+        graphs = await service.list_graphs()
 
-        return json.dumps(
+        return dumps(
             {
                 "success": True,
                 "graphs": graphs,
                 "count": len(graphs),
                 "timestamp": datetime.utcnow().isoformat(),
             },
-            indent=2,
+            pretty,
         )
     except Exception as e:
-        return json.dumps(
+        return dumps(
             {
                 "success": False,
                 "error": str(e),
             },
-            indent=2,
+            pretty,
         )
 
 
 @mcp.tool()
-def get_graph_metadata(graph_name: str) -> str:
+async def get_graph_metadata(
+    graph_name: str, pretty: Optional[bool] = None, ctx: Optional[Context] = None
+) -> str:
     """
-    Get metadata and labels for a specific FalkorDB graph.
+    Get the schema of a FalkorDB graph in one call.
+
+    Use this before writing queries instead of probing with execute_query:
+    it lists labels, relationship types, property keys and indexes, and
+    counts nodes per label and relationships per type.
 
     Args:
         graph_name: Name of the graph
+        pretty: Indent the JSON response for human readers (default compact)
 
     Returns:
         JSON string with graph metadata
     """
     try:
-        service = get_service()
-        metadata = service.get_graph_metadata(graph_name)
+        service = await get_async_service()
+        async with service.admission.admit(graph_name, _client_key(ctx)):
+            metadata = await service.get_graph_metadata(graph_name)
 
-        return json.dumps(
+        return dumps(
             {
                 "success": True,
                 "metadata": metadata,
                 "timestamp": datetime.utcnow().isoformat(),
             },
-            indent=2,
+            pretty,
+        )
+    except Exception as e:
+        return dumps(
+            {
+                "success": False,
+                "error": str(e),
+                **_error_details(e),
+                "graphName": graph_name,
+            },
+            pretty,
+        )
+
+
+@mcp.tool()
+async def infer_schema(
+    graph_name: str,
+    sample_size: Optional[int] = None,
+    refresh: bool = False,
+    pretty: Optional[bool] = None,
+    ctx: Optional[Context] = None,
+) -> str:
+    """
+    Infer property types per label and relationship type from a sample.
+
+    FalkorDB is schemaless, so get_graph_metadata only lists property keys.
+    This samples each label and relationship type and reports, per property,
+    which value types were seen, how often it is null and roughly how many
+    distinct values it takes. Results are cached and refined on later calls.
+
+    Args:
+        graph_name: Name of the graph
+        sample_size: Entities sampled per label or type (default from config)
+        refresh: Sample again even if the cached result is fresh
+        pretty: Indent the JSON response for human readers (default compact)
+
+    Returns:
+        JSON string with per-label and per-type property profiles
+    """
+    try:
+        service = await get_async_service()
+        async with service.admission.admit(graph_name, _client_key(ctx)):
+            schema = await service.infer_schema(graph_name, sample_size, refresh)
+
+        return dumps(
+            {
+                "success": True,
+                "schema": schema,
+                "timestamp": datetime.utcnow().isoformat(),
+            },
+            pretty,
         )
     except Exception as e:
-        return json.dumps(
+        return dumps(
             {
                 "success": False,
                 "error": str(e),
+                **_error_details(e),
                 "graphName": graph_name,
             },
-            indent=2,
+            pretty,
         )
 
 
 @mcp.resource("falkordb://graphs")
-def get_available_graphs() -> str:
+async def get_available_graphs() -> str:
     """
     Resource providing list of all available graphs in FalkorDB.
 
     Returns:
         JSON string with graphs, count, and server information
     """
-    service = get_service()
-    graphs = service.list_graphs()
+    service = await get_async_service()
+    graphs = await service.list_graphs()
 
-    return json.dumps(
+    return dumps(
         {
             "graphs": graphs,
             "count": len(graphs),
             "host": config.host,
             "port": config.port,
             "timestamp": datetime.utcnow().isoformat(),
-        },
-        indent=2,
+        }
     )
 
 
+@mcp.resource("falkordb://graph/{name}/stats")
+async def get_graph_stats(name: str) -> str:
+    """
+    Resource providing node and relationship counts per label and type.
+
+    Counts are kept current from the statistics of writes through this
+    server, so reading this resource does not query FalkorDB once the graph
+    has been counted.
+
+    Returns:
+        JSON string with counts per label and type and reconciliation state
+    """
+    try:
+        service = await get_async_service()
+        stats = {"success": True, **await service.get_graph_stats(name)}
+    except Exception as e:
+        stats = {"success": False, "error": str(e), "graphName": name}
+
+    return dumps({**stats, "timestamp": datetime.utcnow().isoformat()})
+
+
 @mcp.resource("falkordb://status")
-def get_server_status() -> str:
+async def get_server_status() -> str:
     """
     Resource providing FalkorDB connection status and server information.
 
+    Health readings come from a background prober refreshed every
+    FALKORDB_HEALTH_INTERVAL seconds, so reading this resource does not
+    contact FalkorDB.
+
     Returns:
-        JSON string with server status
+        JSON string with server status, FalkorDB health (ping latency
+        percentiles, version, memory, clients and replication lag),
+        admission queue and rejection counts, connection pool utilization,
+        open cursors and read-replica health
     """
-    return json.dumps(
+    try:
+        service = await get_async_service()
+        health = service.health.status()
+        status = {
+            "status": health["status"],
+            "health": health,
+            "admission": service.admission.stats(),
+            "pool": service.pool_stats(),
+            "cursors": service.cursors.stats(),
+        }
+        if service.replicas:
+            status["replicas"] = service.replicas.stats()
+    except Exception as e:
+        status = {"status": "disconnected", "error": str(e)}
+
+    return dumps(
         {
-            "status": "connected",
+            **status,
             "host": config.host,
             "port": config.port,
-            "version": "1.0.0",
+            "version": __version__,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+    )
+
+
+@mcp.resource("falkordb://cache")
+async def get_cache_stats() -> str:
+    """
+    Resource providing query result cache and coalescing statistics.
+
+    Returns:
+        JSON string with hit ratio, entry count, size and invalidations,
+        plus single-flight coalescing, schema, inference and graph list
+        cache and FalkorDB plan cache counters
+    """
+    service = await get_async_service()
+
+    return dumps(
+        {
+            "results": service.results.stats(),
+            "coalescing": service.inflight.stats(),
+            "schema": service.schema.stats(),
+            "graph_list": service.graph_list.stats(),
+            "inference": service.inference.stats(),
+            "plan_cache": service.plan_cache.stats(),
             "timestamp": datetime.utcnow().isoformat(),
-        },
-        indent=2,
+        }
     )
 
 
@@ -1,50 +1,419 @@
 """FalkorDB service layer for database operations."""
 
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
-from falkordb import FalkorDB
-from falkordb.node import Node
+from falkordb import FalkorDB, Graph
 from falkordb.edge import Edge
-
+from falkordb.node import Node
+from falkordb.query_result import QueryResult
+
+from .cache import (
+    GraphHandleCache,
+    GraphListCache,
+    GraphNotFoundError,
+    PlanCacheStats,
+    ResultCache,
+    SchemaCache,
+    is_missing_graph,
+)
 from .config import config
+from .cypher import parameterize_literals, resolve_read_only, restore_literals
+from .encoding import dumps
+from .metadata import (
+    SCHEMA_PROCEDURES,
+    build_metadata,
+    changes_schema,
+    count_queries,
+    first_column,
+)
+from .paging import Page, encode_token, paged_query, plan_page
+from .timeouts import SERVER, QueryTimeoutError, is_server_timeout, resolve_timeout
+from .vectors import KEEP, project_vectors
 
 logger = logging.getLogger(__name__)
 
+QUERY_CMD = "GRAPH.QUERY"
+RO_QUERY_CMD = "GRAPH.RO_QUERY"
+
+
+# Values returned as they are; checked with ``type(value) in`` rather than an
+# isinstance chain because nearly every cell is one of these
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _is_primitive_only(values: Any) -> bool:
+    """Whether every item of an iterable is a primitive."""
+    # map(type, ...) and the superset test both run in C
+    return _PRIMITIVE_TYPES.issuperset(map(type, values))
+
+
+def _serialize_node(value: Any, stack: Optional[List[Tuple[Any, Any, Any]]]) -> Dict[str, Any]:
+    return {
+        "type": "node",
+        "id": value.id,
+        "labels": list(value.labels),
+        # Property values are plain data, so the dict is shared, not copied
+        "properties": value.properties,
+    }
+
+
+def _serialize_edge(value: Any, stack: Optional[List[Tuple[Any, Any, Any]]]) -> Dict[str, Any]:
+    return {
+        "type": "edge",
+        "id": value.id,
+        "relation": value.relation,
+        "src_node": value.src_node,
+        "dest_node": value.dest_node,
+        # Property values are plain data, so the dict is shared, not copied
+        "properties": value.properties,
+    }
+
+
+def _serialize_sequence(value: Any, stack: List[Tuple[Any, Any, Any]]) -> List[Any]:
+    if _is_primitive_only(value):
+        # Lists are shared as they are; tuples still become lists
+        return value if type(value) is list else list(value)
+    serialized = list(value)
+    primitives = _PRIMITIVE_TYPES
+    entities = _ENTITY_SERIALIZERS
+    for index, item in enumerate(serialized):
+        item_type = type(item)
+        if item_type in primitives:
+            continue
+        if item_type in entities:
+            serialized[index] = entities[item_type](item, None)
+        else:
+            stack.append((item, serialized, index))
+    return serialized
+
+
+def _serialize_mapping(value: Any, stack: List[Tuple[Any, Any, Any]]) -> Dict[Any, Any]:
+    if type(value) is dict and _is_primitive_only(value.values()):
+        return value
+    serialized = dict(value)
+    primitives = _PRIMITIVE_TYPES
+    entities = _ENTITY_SERIALIZERS
+    for key, item in value.items():
+        item_type = type(item)
+        if item_type in primitives:
+            continue
+        if item_type in entities:
+            serialized[key] = entities[item_type](item, None)
+        else:
+            stack.append((item, serialized, key))
+    return serialized
+
+
+# Container and graph types, looked up by exact type first. Subclasses (and
+# test doubles) are resolved once with isinstance and remembered.
+_SERIALIZERS: Dict[type, Any] = {
+    Node: _serialize_node,
+    Edge: _serialize_edge,
+    list: _serialize_sequence,
+    tuple: _serialize_sequence,
+    dict: _serialize_mapping,
+}
+_SERIALIZER_BASES = tuple(_SERIALIZERS.items())
+_ENTITY_SERIALIZERS = {Node: _serialize_node, Edge: _serialize_edge}
+_MISSING = object()
+
+
+def _find_serializer(value_type: type, value: Any) -> Any:
+    """Resolve (and remember) the serializer for a type not in the table."""
+    for base, serializer in _SERIALIZER_BASES:
+        if isinstance(value, base):
+            break
+    else:
+        serializer = None
+    _SERIALIZERS[value_type] = serializer
+    return serializer
+
 
 def _serialize_value(value: Any) -> Any:
     """Serialize FalkorDB objects to JSON-compatible types.
 
+    Nested lists and maps are walked with an explicit stack instead of
+    recursion, so arbitrarily deep values cannot hit the recursion limit.
+    Containers holding only primitives are returned without copying.
+
     Args:
         value: Value to serialize (may be Node, Edge, or primitive)
 
     Returns:
         JSON-serializable value
     """
-    if isinstance(value, Node):
-        return {
-            "type": "node",
-            "id": value.id,
-            "labels": list(value.labels),
-            "properties": dict(value.properties)
-        }
-    elif isinstance(value, Edge):
-        return {
-            "type": "edge",
-            "id": value.id,
-            "relation": value.relation,
-            "src_node": value.src_node,
-            "dest_node": value.dest_node,
-            "properties": dict(value.properties)
-        }
-    elif isinstance(value, (list, tuple)):
-        return [_serialize_value(v) for v in value]
-    elif isinstance(value, dict):
-        return {k: _serialize_value(v) for k, v in value.items()}
-    else:
-        # Primitive types (int, str, float, bool, None)
+    value_type = type(value)
+    if value_type in _PRIMITIVE_TYPES:
+        return value
+    serializers = _SERIALIZERS
+    serializer = serializers.get(value_type, _MISSING)
+    if serializer is _MISSING:
+        serializer = _find_serializer(value_type, value)
+    if serializer is None:
         return value
 
+    # Nested values still to serialize: (value, container receiving the
+    # result, key or index in it)
+    stack: List[Tuple[Any, Any, Any]] = []
+    serialized = serializer(value, stack)
+    while stack:
+        item, target, key = stack.pop()
+        item_type = type(item)
+        serializer = serializers.get(item_type, _MISSING)
+        if serializer is _MISSING:
+            serializer = _find_serializer(item_type, item)
+        # Types without a serializer (primitives and other scalars) pass through
+        target[key] = serializer(item, stack) if serializer else item
+    return serialized
+
+
+def _serialize_row(row: Any) -> Any:
+    """Serialize one result row, skipping the walk for primitive-only rows."""
+    if type(row) is not list:
+        return _serialize_value(row)
+    if _is_primitive_only(row):
+        return row
+    primitives = _PRIMITIVE_TYPES
+    entities = _ENTITY_SERIALIZERS
+    serialized = []
+    for cell in row:
+        cell_type = type(cell)
+        if cell_type in primitives:
+            serialized.append(cell)
+        elif cell_type in entities:
+            # Nodes and edges never need the stack walk
+            serialized.append(entities[cell_type](cell, None))
+        else:
+            serialized.append(_serialize_value(cell))
+    return serialized
+
+
+# Statistics that are non-zero only when a query modified the graph
+WRITE_STATISTICS = (
+    "nodes_created",
+    "nodes_deleted",
+    "relationships_created",
+    "relationships_deleted",
+    "properties_set",
+    "properties_removed",
+    "labels_added",
+    "labels_removed",
+    "indices_created",
+    "indices_deleted",
+)
+
+
+def _elapsed_ms(start: float) -> float:
+    """Milliseconds since ``start`` (a ``time.perf_counter()`` reading)."""
+    return round((time.perf_counter() - start) * 1000, 3)
+
+
+def _query_statistics(result: Any) -> Dict[str, Any]:
+    """Collect the full statistics block FalkorDB reports with a result.
+
+    Counters are returned as integers, ``run_time_ms`` is FalkorDB's internal
+    execution time and ``cached_execution`` tells whether the execution plan
+    came from FalkorDB's plan cache. Statistics the client does not expose
+    are reported as None.
+    """
+    statistics: Dict[str, Any] = {}
+    for name in WRITE_STATISTICS:
+        value = getattr(result, name, 0)
+        statistics[name] = int(value) if isinstance(value, (int, float)) else 0
+
+    run_time_ms = getattr(result, "run_time_ms", None)
+    statistics["run_time_ms"] = (
+        float(run_time_ms) if isinstance(run_time_ms, (int, float)) else None
+    )
+    cached_execution = getattr(result, "cached_execution", None)
+    statistics["cached_execution"] = (
+        bool(cached_execution) if isinstance(cached_execution, (int, float)) else None
+    )
+    return statistics
+
+
+def _has_writes(statistics: Dict[str, Any]) -> bool:
+    """Whether query statistics show that the graph was modified."""
+    return any(statistics.get(name) for name in WRITE_STATISTICS)
+
+
+def _prepare_query(
+    query: str,
+    params: Optional[Dict[str, Any]],
+    parameterize: Optional[bool],
+    page: Optional[Page] = None,
+) -> Tuple[str, Dict[str, Any], Dict[str, str]]:
+    """Apply literal parameterization if enabled (per call or in config).
+
+    Pages fetched server side get SKIP/LIMIT appended after parameterization,
+    with one extra row to tell whether more follow.
+
+    Returns:
+        Tuple of the query and parameters to send, and the lifted literals
+    """
+    if parameterize is None:
+        parameterize = config.parameterize_literals
+    if parameterize:
+        query, params, literals = parameterize_literals(query, params)
+    else:
+        params, literals = params or {}, {}
+    if page is not None and page.server_side:
+        query = paged_query(query, page.offset, page.max_rows + 1)
+    return query, params, literals
+
+
+def _serialize_rows(
+    rows: List[Any], page: Optional[Page]
+) -> Tuple[List[Any], bool, Optional[int]]:
+    """
+    Serialize rows until the page's row or size budget runs out.
+
+    Rows are projected by the page's vector policy first, and the size of
+    each row is the compact JSON encoding of that projection, so dropped or
+    packed embeddings do not count against the budget. The first row is
+    always kept, so a single oversized row cannot stall paging.
+
+    Returns:
+        Tuple of the serialized rows, whether rows were left out, and the
+        encoded size of the rows in bytes when a size budget measured them
+    """
+    if page is not None and not page.server_side and page.offset:
+        rows = rows[page.offset:]
+    if page is None:
+        return [_serialize_row(row) for row in rows], False, None
+
+    def serialize(row: Any) -> List[Any]:
+        data = _serialize_row(row)
+        if page.vectors == KEEP:
+            return data
+        projected = project_vectors(
+            {"result_set": [data]},
+            page.vectors,
+            config.vector_min_dims,
+            config.vector_preview_size,
+        )
+        return projected["result_set"][0]
+
+    if not (page.max_rows or page.max_bytes):
+        return [serialize(row) for row in rows], False, None
+
+    serialized: List[Any] = []
+    size = 0
+    for row in rows:
+        if page.max_rows and len(serialized) >= page.max_rows:
+            return serialized, True, size if page.max_bytes else None
+        data = serialize(row)
+        if page.max_bytes:
+            # +1 for the separating comma
+            row_size = len(dumps(data, pretty=False)) + 1
+            if size + row_size > page.max_bytes and serialized:
+                return serialized, True, size
+            size += row_size
+        serialized.append(data)
+    return serialized, False, size if page.max_bytes else None
+
+
+def _query_result_to_dict(
+    result: Any,
+    literals: Optional[Dict[str, str]] = None,
+    page: Optional[Page] = None,
+) -> Tuple[Dict[str, Any], Optional[int]]:
+    """Convert a FalkorDB QueryResult into a JSON-compatible dictionary.
+
+    Shared by the sync and async services so both return the same shape.
+
+    Args:
+        result: QueryResult returned by ``graph.query``
+        literals: Literals lifted by parameterization, restored in headers
+        page: Slice and budgets of the rows to return (None returns all)
+
+    Returns:
+        Tuple of a dictionary with result_set, headers, statistics, and
+        whether the result was truncated (``continuation`` is filled in by
+        the caller), and the encoded size of its rows when it was measured
+    """
+    # Extract data from QueryResult object for JSON serialization
+    # Serialize Node/Edge objects to dicts
+    data: List[Any] = []
+    truncated = False
+    rows_size: Optional[int] = 0
+    if result.result_set:
+        data, truncated, rows_size = _serialize_rows(result.result_set, page)
+
+    # Include column headers if available
+    headers = []
+    if hasattr(result, 'header') and result.header:
+        headers = restore_literals(result.header, literals or {})
+
+    return {
+        "result_set": data,
+        "headers": headers,
+        "statistics": _query_statistics(result),
+        "truncated": truncated,
+        "continuation": None,
+    }, rows_size
+
+
+def _set_continuation(
+    data: Dict[str, Any],
+    graph_name: str,
+    query: str,
+    params: Optional[Dict[str, Any]],
+    page: Page,
+) -> None:
+    """Issue the token for the next page of a truncated read."""
+    if data["truncated"]:
+        data["continuation"] = encode_token(
+            graph_name, query, params, page.offset + len(data["result_set"])
+        )
+
+
+def _timed_result_to_dict(
+    result: Any, literals: Dict[str, str], network_ms: float, page: Optional[Page] = None
+) -> Tuple[Dict[str, Any], Optional[int]]:
+    """Convert a QueryResult and attach client-side timings.
+
+    Args:
+        result: QueryResult returned by ``graph.query``
+        literals: Literals lifted by parameterization
+        network_ms: Time spent waiting on FalkorDB for the result
+        page: Slice and budgets of the rows to return
+
+    Returns:
+        Tuple from :func:`_query_result_to_dict`, its dictionary with a
+        ``timings`` block
+    """
+    start = time.perf_counter()
+    data, rows_size = _query_result_to_dict(result, literals, page)
+    data["timings"] = {
+        "network_ms": network_ms,
+        "serialize_ms": _elapsed_ms(start),
+        "result_cache_hit": False,
+    }
+    return data, rows_size
+
+
+def _cached_size(data: Dict[str, Any], rows_size: Optional[int]) -> Optional[int]:
+    """
+    Encoded size of a result for the result cache.
+
+    Reuses the size the row budget measured, so only the small envelope
+    around the rows is encoded again; None when the rows were not measured.
+    """
+    if rows_size is None:
+        return None
+    return rows_size + len(dumps({**data, "result_set": []}, pretty=False))
+
+
+def _cached_result(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a cached result whose timings show it was served from cache."""
+    return {
+        **data,
+        "timings": {"network_ms": 0.0, "serialize_ms": 0.0, "result_cache_hit": True},
+    }
+
 
 class FalkorDBService:
     """Service for interacting with FalkorDB graph database."""
@@ -52,6 +421,11 @@ class FalkorDBService:
     def __init__(self):
         """Initialize FalkorDB service."""
         self._client: Optional[FalkorDB] = None
+        self._graphs = GraphHandleCache(config.graph_cache_size)
+        self.results = ResultCache(config.result_cache_max_bytes, config.result_cache_ttl)
+        self.schema = SchemaCache(config.schema_cache_ttl)
+        self.graph_list = GraphListCache(config.graph_list_ttl)
+        self.plan_cache = PlanCacheStats()
         self._initialize()
 
     def _initialize(self) -> None:
@@ -79,51 +453,170 @@ class FalkorDBService:
             raise RuntimeError("FalkorDB client not initialized")
         return self._client
 
+    def select_graph(self, graph_name: str) -> Graph:
+        """
+        Get a graph handle, reusing a cached one when available.
+
+        Args:
+            graph_name: Name of the graph
+
+        Returns:
+            Graph handle bound to the FalkorDB client
+        """
+        return self._graphs.get(graph_name, self.client.select_graph)
+
+    def evict_graph(self, graph_name: str) -> None:
+        """Forget the cached handle of a graph that was deleted."""
+        self._graphs.evict(graph_name)
+        self.graph_list.invalidate()
+
+    def _record_write(self, graph_name: str, statistics: Dict[str, Any]) -> None:
+        """Drop cached results and metadata that a write made stale."""
+        if _has_writes(statistics):
+            self.results.invalidate_graph(graph_name)
+        if changes_schema(statistics):
+            self.schema.invalidate(graph_name)
+
+    def _record_failed_write(self, graph_name: str) -> None:
+        """Drop cached results and metadata a failed write may still have changed."""
+        self.results.invalidate_graph(graph_name)
+        self.schema.invalidate(graph_name)
+        self.graph_list.record_write(graph_name)
+
+    def _run(
+        self,
+        graph: Graph,
+        query: str,
+        params: Dict[str, Any],
+        read_only: bool,
+        timeout_ms: int,
+    ) -> Tuple[Any, float]:
+        """
+        Send a prepared query with its FalkorDB timeout.
+
+        The blocking client has no per-call deadline of its own, so only the
+        server-side TIMEOUT applies here.
+
+        Reads against a graph known not to exist fail without a round trip.
+
+        Returns:
+            Tuple of the QueryResult and the time spent waiting on FalkorDB
+
+        Raises:
+            GraphNotFoundError: If a read targets a graph known not to exist
+            QueryTimeoutError: If FalkorDB aborted the query at its timeout
+        """
+        if read_only and self.graph_list.missing(graph.name):
+            raise GraphNotFoundError(graph.name)
+        send = graph.ro_query if read_only else graph.query
+        start = time.perf_counter()
+        try:
+            if timeout_ms:
+                result = send(query, params, timeout=timeout_ms)
+            else:
+                result = send(query, params)
+        except Exception as e:
+            if not read_only:
+                self._record_failed_write(graph.name)
+            if is_server_timeout(e):
+                raise QueryTimeoutError(timeout_ms, _elapsed_ms(start), SERVER) from e
+            if read_only and is_missing_graph(e):
+                self.graph_list.mark_missing(graph.name)
+            raise
+        if not read_only:
+            self.graph_list.record_write(graph.name)
+        return result, _elapsed_ms(start)
+
     def execute_query(
-        self, graph_name: str, query: str, params: Optional[Dict[str, Any]] = None
+        self,
+        graph_name: str,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        read_only: Optional[bool] = None,
+        parameterize: Optional[bool] = None,
+        max_rows: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        continuation: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        vectors: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Execute a Cypher query against a FalkorDB graph.
 
+        Read-only queries are sent with GRAPH.RO_QUERY so FalkorDB can run them
+        on its concurrent reader threads and on replicas, and their results
+        are cached until the TTL expires or the graph is written to.
+
+        Results are cut off at a row and size budget. A truncated read
+        carries a ``continuation`` token that fetches the rows after it when
+        passed back with the same graph, query and parameters.
+
         Args:
             graph_name: Name of the graph to query
             query: Cypher query to execute
             params: Optional query parameters
+            read_only: None to classify the query automatically, True to force
+                the read-only path (rejecting writes), False to force a write
+            parameterize: Lift inline literals into parameters so query
+                variants share one FalkorDB plan (None uses the config default)
+            max_rows: Row budget (None uses the config default, 0 is unlimited)
+            max_bytes: Encoded size budget in bytes (None uses the config
+                default, 0 is unlimited)
+            continuation: Token from a previous truncated response
+            timeout_ms: Query timeout passed to FalkorDB (None uses the config
+                default, 0 disables it)
+            vectors: Vector projection of the returned rows (None uses
+                the config default), applied before the size budget
 
         Returns:
             Dictionary with query results and metadata
 
         Raises:
+            ReadOnlyViolationError: If read_only is True and the query writes
+            InvalidContinuationError: If the continuation token does not
+                belong to this query
+            QueryTimeoutError: If FalkorDB aborted the query at its timeout
             Exception: If query execution fails
         """
         try:
-            graph = self.client.select_graph(graph_name)
-            result = graph.query(query, params or {})
-
-            # Extract data from QueryResult object for JSON serialization
-            # Serialize Node/Edge objects to dicts
-            data = []
-            if result.result_set:
-                data = [[_serialize_value(cell) for cell in row] for row in result.result_set]
-
-            # Include column headers if available
-            headers = []
-            if hasattr(result, 'header') and result.header:
-                headers = result.header
-
-            return {
-                "result_set": data,
-                "headers": headers,
-                "statistics": {
-                    "nodes_created": getattr(result, 'nodes_created', 0),
-                    "nodes_deleted": getattr(result, 'nodes_deleted', 0),
-                    "relationships_created": getattr(result, 'relationships_created', 0),
-                    "relationships_deleted": getattr(result, 'relationships_deleted', 0),
-                    "properties_set": getattr(result, 'properties_set', 0),
-                    "labels_added": getattr(result, 'labels_added', 0),
-                    "labels_removed": getattr(result, 'labels_removed', 0),
-                }
-            }
+            read_only = resolve_read_only(query, read_only)
+            page = plan_page(
+                graph_name, query, params, read_only, max_rows, max_bytes, continuation, vectors
+            )
+            timeout_ms = resolve_timeout(timeout_ms)
+            graph = self.select_graph(graph_name)
+            if not read_only:
+                sent_query, sent_params, literals = _prepare_query(query, params, parameterize)
+                result, network_ms = self._run(graph, sent_query, sent_params, False, timeout_ms)
+                data, _ = _timed_result_to_dict(result, literals, network_ms, page)
+                self.plan_cache.record(data["statistics"]["cached_execution"], len(literals))
+                self._record_write(graph_name, data["statistics"])
+                return data
+
+            cache_key = self.results.make_key(
+                graph_name,
+                query,
+                params,
+                page.offset,
+                page.max_rows,
+                page.max_bytes,
+                page.vectors,
+            )
+            cached = self.results.get(cache_key) if self.results.enabled else None
+            if cached is not None:
+                return _cached_result(cached)
+            generation = self.results.generation(graph_name)
+            sent_query, sent_params, literals = _prepare_query(
+                query, params, parameterize, page
+            )
+            result, network_ms = self._run(graph, sent_query, sent_params, True, timeout_ms)
+            data, rows_size = _timed_result_to_dict(result, literals, network_ms, page)
+            _set_continuation(data, graph_name, query, params, page)
+            self.plan_cache.record(data["statistics"]["cached_execution"], len(literals))
+            self.results.put(
+                cache_key, data, _cached_size(data, rows_size), generation=generation
+            )
+            return data
         except Exception as e:
             sanitized_graph = graph_name.replace("\n", "").replace("\r", "")
             logger.error(
@@ -135,6 +628,9 @@ class FalkorDBService:
         """
         List all available graphs in FalkorDB.
 
+        The reply is cached for FALKORDB_GRAPH_LIST_TTL seconds, or until a
+        write through this service creates a graph.
+
         Returns:
             List of graph names
 
@@ -142,15 +638,43 @@ class FalkorDBService:
             Exception: If listing fails
         """
         try:
-            return self.client.list_graphs()
+            cached = self.graph_list.get()
+            if cached is not None:
+                return cached
+            generation = self.graph_list.generation
+            graphs = self.client.list_graphs()
+            self.graph_list.put(graphs, generation)
+            self._graphs.retain(graphs)
+            return graphs
         except Exception as e:
             logger.error(f"Error listing FalkorDB graphs: {e}")
             raise
 
+    def _pipeline(self, graph: Graph, queries: List[str]) -> List[QueryResult]:
+        """
+        Send read-only queries in one pipelined round trip.
+
+        Raises:
+            Exception: The first query error, if any query failed
+        """
+        pipe = graph.client.connection.pipeline(transaction=False)
+        for query in queries:
+            pipe.execute_command(RO_QUERY_CMD, graph.name, query, "--compact")
+        responses = pipe.execute(raise_on_error=False) if queries else []
+        for response in responses:
+            if isinstance(response, Exception):
+                raise response
+        return [QueryResult(graph, response) for response in responses]
+
     def get_graph_metadata(self, graph_name: str) -> Dict[str, Any]:
         """
         Get metadata about a specific graph.
 
+        Labels, relationship types, property keys and indexes are fetched in
+        one pipelined round trip and the per-label and per-type counts in a
+        second. The result is cached until FALKORDB_SCHEMA_CACHE_TTL expires
+        or a write through this service changes the schema or counts.
+
         Args:
             graph_name: Name of the graph
 
@@ -158,25 +682,31 @@ class FalkorDBService:
             Dictionary containing graph metadata with:
                 - name: Graph name
                 - labels: List of node label strings
+                - relationship_types: List of relationship type strings
+                - property_keys: List of property key strings
+                - indexes: Rows of ``CALL db.indexes()`` keyed by column
+                - node_counts: Node count per label
+                - relationship_counts: Relationship count per type
+                - cache_hit: Whether the metadata came from the schema cache
 
         Raises:
             Exception: If metadata retrieval fails
         """
         try:
-            graph = self.client.select_graph(graph_name)
-            # Execute a simple query to get graph statistics
-            labels_result = graph.query("CALL db.labels()")
-
-            # Extract data from QueryResult object for JSON serialization
-            # FalkorDB query results must be accessed via .result_set property
-            labels_list = []
-            if labels_result.result_set:
-                labels_list = [row[0] for row in labels_result.result_set]
-
-            return {
-                "name": graph_name,
-                "labels": labels_list,
-            }
+            cached = self.schema.get(graph_name)
+            if cached is not None:
+                return {**cached, "cache_hit": True}
+            generation = self.schema.generation(graph_name)
+
+            graph = self.select_graph(graph_name)
+            schema_results = self._pipeline(graph, list(SCHEMA_PROCEDURES))
+            count_results = self._pipeline(graph, count_queries(
+                first_column(schema_results[0]), first_column(schema_results[1])
+            ))
+
+            metadata = build_metadata(graph_name, schema_results, count_results, _serialize_row)
+            self.schema.put(graph_name, metadata, generation)
+            return {**metadata, "cache_hit": False}
         except Exception as e:
             sanitized = graph_name.replace("\n", "").replace("\r", "")
             logger.error(f"Error getting metadata for graph '{sanitized}': {e}")
@@ -184,6 +714,10 @@ class FalkorDBService:
 
     def close(self) -> None:
         """Close connection to FalkorDB."""
+        self._graphs.clear()
+        self.results.clear()
+        self.schema.clear()
+        self.graph_list.clear()
         if self._client:
             self._client.close()
             self._client = None
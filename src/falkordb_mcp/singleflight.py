@@ -0,0 +1,71 @@
+"""Single-flight coalescing of identical in-flight calls for the async service."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Shares one execution between concurrent callers that ask the same thing.
+
+    The first caller for a key starts the call as a task; callers that arrive
+    while it is still running await the same task instead of starting their
+    own. The task is shielded, so a caller that gives up (e.g. a disconnected
+    MCP client) does not cancel the result the others are waiting for.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self._executions = 0
+        self._coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._calls)
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``call`` once per key, sharing its result with concurrent callers.
+
+        Args:
+            key: Identifies calls whose results are interchangeable
+            call: Coroutine function performing the work
+
+        Returns:
+            Result of the shared call
+
+        Raises:
+            Exception: Whatever the shared call raised, for every caller
+        """
+        task = self._calls.get(key)
+        if task is None:
+            self._executions += 1
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self._coalesced += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception retrieved in case every caller went away
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report how much work coalescing saved.
+
+        Returns:
+            Dictionary with executions, coalesced callers and the saved ratio
+        """
+        requests = self._executions + self._coalesced
+        return {
+            "in_flight": self.in_flight,
+            "executions": self._executions,
+            "coalesced": self._coalesced,
+            "saved_ratio": round(self._coalesced / requests, 4) if requests else 0.0,
+        }
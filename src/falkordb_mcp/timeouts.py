@@ -0,0 +1,76 @@
+"""Per-query timeouts enforced by FalkorDB and backed by a client deadline."""
+
+from typing import Any, Dict, Optional
+
+from redis.exceptions import ResponseError
+
+from .config import config
+
+SERVER = "server"
+CLIENT = "client"
+
+
+class QueryTimeoutError(TimeoutError):
+    """Raised when a query runs past its timeout."""
+
+    def __init__(self, timeout_ms: int, elapsed_ms: float, enforced_by: str):
+        """
+        Initialize the error.
+
+        Args:
+            timeout_ms: Timeout the query ran with
+            elapsed_ms: Time from sending the query until it was given up on
+            enforced_by: "server" if FalkorDB aborted the query, "client" if
+                the client deadline expired first
+        """
+        super().__init__(
+            f"Query exceeded its {timeout_ms} ms timeout "
+            f"({enforced_by} side, {elapsed_ms} ms elapsed)"
+        )
+        self.timeout_ms = timeout_ms
+        self.elapsed_ms = elapsed_ms
+        self.enforced_by = enforced_by
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Structured form for tool error responses."""
+        return {
+            "timeout_ms": self.timeout_ms,
+            "elapsed_ms": self.elapsed_ms,
+            "enforced_by": self.enforced_by,
+        }
+
+
+def resolve_timeout(timeout_ms: Optional[int]) -> int:
+    """
+    Timeout to run a query with.
+
+    Args:
+        timeout_ms: Per-call timeout (None uses FALKORDB_QUERY_TIMEOUT_MS,
+            0 disables it)
+
+    Returns:
+        Timeout in milliseconds, 0 for none
+
+    Raises:
+        ValueError: If the timeout is negative
+    """
+    if timeout_ms is None:
+        timeout_ms = config.query_timeout_ms
+    if timeout_ms < 0:
+        raise ValueError("timeout_ms must not be negative")
+    return int(timeout_ms)
+
+
+def client_deadline(timeout_ms: int) -> float:
+    """
+    Seconds the client waits for a reply before giving up on a query.
+
+    FalkorDB should abort the query first; the grace period covers the
+    network round trip so the server's own timeout error normally wins.
+    """
+    return (timeout_ms + config.query_timeout_grace_ms) / 1000
+
+
+def is_server_timeout(error: BaseException) -> bool:
+    """Whether an error is FalkorDB aborting a query at its TIMEOUT."""
+    return isinstance(error, ResponseError) and "timed out" in str(error).lower()
@@ -0,0 +1,138 @@
+"""Projection of embedding vectors in execute_query results."""
+
+import base64
+import struct
+from typing import Any, Dict, List, Tuple
+
+KEEP = "keep"
+DROP = "drop"
+TRUNCATE = "truncate"
+BASE64_F32 = "base64_f32"
+BASE64_F16 = "base64_f16"
+POLICIES = (KEEP, DROP, TRUNCATE, BASE64_F32, BASE64_F16)
+
+_PACK_FORMATS = {BASE64_F32: ("float32", "f"), BASE64_F16: ("float16", "e")}
+_NUMBER_TYPES = frozenset({float, int})
+_DROPPED = object()
+
+
+def is_vector(value: Any, min_dims: int) -> bool:
+    """
+    Whether a value looks like an embedding.
+
+    Embeddings are recognised by shape, not by property name: a list of at
+    least ``min_dims`` numbers, at least one of which is a float.
+
+    Args:
+        value: Serialized value
+        min_dims: Shortest list treated as a vector
+
+    Returns:
+        True if the value should be projected
+    """
+    if type(value) is not list or len(value) < min_dims:
+        return False
+    types = set(map(type, value))
+    return float in types and types <= _NUMBER_TYPES
+
+
+def _project(vector: List[Any], policy: str, preview_size: int) -> Any:
+    """Apply a policy to one vector."""
+    if policy == DROP:
+        return _DROPPED
+    if policy == TRUNCATE:
+        return {"dims": len(vector), "preview": vector[:preview_size]}
+    dtype, code = _PACK_FORMATS[policy]
+    packed = struct.pack(f"<{len(vector)}{code}", *vector)
+    return {
+        "dtype": dtype,
+        "dims": len(vector),
+        "base64": base64.b64encode(packed).decode("ascii"),
+    }
+
+
+def _place(target: Any, key: Any, value: Any) -> None:
+    """Store a projected value, removing dropped vectors from maps."""
+    if value is not _DROPPED:
+        target[key] = value
+    elif type(target) is dict:
+        del target[key]
+    else:
+        target[key] = None
+
+
+def project_vectors(
+    data: Dict[str, Any], policy: str, min_dims: int = 64, preview_size: int = 8
+) -> Dict[str, Any]:
+    """
+    Drop, truncate or pack every embedding vector in a result.
+
+    Vectors are found anywhere in the rows: node and edge properties, map
+    values and plain cells. Results without vectors are returned as they
+    are; otherwise containers are copied, never modified, because the input
+    may be shared with the result cache.
+
+    Args:
+        data: Result with serialized ``result_set`` rows
+        policy: "keep", "drop" (removed from maps, null elsewhere),
+            "truncate" (dims and the first ``preview_size`` values), or
+            "base64_f32"/"base64_f16" (little-endian packed floats)
+        min_dims: Shortest list treated as a vector
+        preview_size: Number of values kept by "truncate"
+
+    Returns:
+        The result with vectors projected
+
+    Raises:
+        ValueError: If the policy is unknown
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown vector policy '{policy}', expected one of {POLICIES}")
+    if policy == KEEP:
+        return data
+
+    def contains_vector(value: Any) -> bool:
+        # Iterative so arbitrarily nested values cannot hit the recursion limit
+        pending = [value]
+        while pending:
+            item = pending.pop()
+            if type(item) is list:
+                if is_vector(item, min_dims):
+                    return True
+                pending.extend(item)
+            elif type(item) is dict:
+                pending.extend(item.values())
+        return False
+
+    # Rows themselves are never vectors, however many numeric columns they have
+    rows = data["result_set"]
+    if not any(contains_vector(cell) for row in rows for cell in row):
+        return data
+
+    projected_rows = [list(row) for row in rows]
+    # (value, container receiving the result, key or index in it)
+    stack: List[Tuple[Any, Any, Any]] = [
+        (cell, row, index)
+        for row in projected_rows
+        for index, cell in enumerate(row)
+        if type(cell) in (list, dict)
+    ]
+    while stack:
+        item, target, key = stack.pop()
+        if type(item) is list:
+            if is_vector(item, min_dims):
+                _place(target, key, _project(item, policy, preview_size))
+                continue
+            copy: Any = list(item)
+            children = enumerate(item)
+        elif type(item) is dict:
+            copy = dict(item)
+            children = item.items()
+        else:
+            continue
+        target[key] = copy
+        for child_key, child in children:
+            if type(child) in (list, dict):
+                stack.append((child, copy, child_key))
+
+    return {**data, "result_set": projected_rows}
@@ -8,7 +8,7 @@ if src_path not in sys.path:
     sys.path.insert(0, src_path)
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from falkordb.node import Node
 from falkordb.edge import Edge
 
@@ -169,6 +169,8 @@ def mock_falkordb_service(mock_query_result):
         mock_client.list_graphs.return_value = ["graph1", "graph2"]
         mock_client.connection.ping.return_value = True
         mock_graph.query.return_value = mock_query_result
+        # Read-only queries go through ro_query; share results with query
+        mock_graph.ro_query = mock_graph.query
 
         # Reset singleton
         import falkordb_mcp.service as service_module
@@ -180,3 +182,35 @@ def mock_falkordb_service(mock_query_result):
 
         # Cleanup
         service_module._service = None
+
+
+@pytest.fixture
+async def mock_async_falkordb_service(mock_query_result):
+    """Mock AsyncFalkorDBService with mocked asyncio client."""
+    with patch('falkordb_mcp.async_service.FalkorDB') as mock_fdb:
+        mock_client = Mock()
+        mock_graph = Mock()
+
+        mock_fdb.return_value = mock_client
+        mock_client.select_graph.return_value = mock_graph
+        mock_client.list_graphs = AsyncMock(return_value=["graph1", "graph2"])
+        mock_client.connection.ping = AsyncMock(return_value=True)
+        mock_client.connection.info = AsyncMock(return_value={"role": "master"})
+        mock_client.connection.module_list = AsyncMock(return_value=[])
+        mock_client.connection.aclose = AsyncMock()
+        mock_graph.query = AsyncMock(return_value=mock_query_result)
+        # Read-only queries go through ro_query; share results with query
+        mock_graph.ro_query = mock_graph.query
+
+        # Reset singleton
+        import falkordb_mcp.async_service as async_service_module
+        async_service_module._async_service = None
+
+        from falkordb_mcp.async_service import AsyncFalkorDBService
+        service = AsyncFalkorDBService()
+        await service.initialize()
+        yield service
+
+        # Cleanup
+        await service.close()
+        async_service_module._async_service = None
@@ -24,8 +24,13 @@ def create_mock_query_result(rows, headers=None, **stats):
     mock_result.relationships_created = stats.get('relationships_created', 0)
     mock_result.relationships_deleted = stats.get('relationships_deleted', 0)
     mock_result.properties_set = stats.get('properties_set', 0)
+    mock_result.properties_removed = stats.get('properties_removed', 0)
     mock_result.labels_added = stats.get('labels_added', 0)
     mock_result.labels_removed = stats.get('labels_removed', 0)
+    mock_result.indices_created = stats.get('indices_created', 0)
+    mock_result.indices_deleted = stats.get('indices_deleted', 0)
+    mock_result.run_time_ms = stats.get('run_time_ms', 0.0)
+    mock_result.cached_execution = stats.get('cached_execution', False)
 
     return mock_result
 
@@ -37,3 +42,45 @@ MOCK_LABELS_RESULT = create_mock_query_result(
     [["Entity"], ["Episodic"], ["Community"]],
     ["label"]
 )
+
+
+def raw_reply(column, values):
+    """Raw GRAPH.RO_QUERY --compact reply with one string or integer column."""
+    cells = [[[3 if isinstance(value, int) else 2, value]] for value in values]
+    return [[[1, column]], cells, ["Query internal execution time: 0.10 milliseconds"]]
+
+
+def mock_metadata_pipeline(
+    graph, labels, types=(), keys=(), counts=(), is_async=False, extra=(), totals=None
+):
+    """Attach a pipeline to ``graph`` answering get_graph_metadata's two round trips.
+
+    Args:
+        graph: Mock graph handle whose client the service pipelines on
+        labels: Labels returned by db.labels()
+        types: Relationship types returned by db.relationshipTypes()
+        keys: Property keys returned by db.propertyKeys()
+        counts: Counts for each label, then each relationship type
+        is_async: Make ``execute`` awaitable
+        extra: Replies of later pipelines, one list of raw replies each
+        totals: Total node and relationship counts (default: sums of ``counts``)
+
+    Returns:
+        The pipeline mock
+    """
+    from unittest.mock import AsyncMock
+
+    schema = [
+        raw_reply("label", labels),
+        raw_reply("relationshipType", types),
+        raw_reply("propertyKey", keys),
+        raw_reply("label", []),
+    ]
+    if totals is None:
+        totals = (sum(counts[:len(labels)]), sum(counts[len(labels):]))
+    count_replies = [raw_reply("count", [count]) for count in [*counts, *totals]]
+    pipe = Mock()
+    pipe.execute = (AsyncMock if is_async else Mock)(side_effect=[schema, count_replies, *extra])
+    graph.client.connection.pipeline.return_value = pipe
+    graph.name = "test_graph"
+    return pipe
@@ -0,0 +1,143 @@
+"""Test suite for admission control."""
+
+import sys
+from pathlib import Path
+# Add src to path
+src_path = str(Path(__file__).parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from falkordb_mcp.admission import (
+    QUEUE_FULL,
+    QUEUE_TIMEOUT,
+    AdmissionController,
+    AdmissionRejectedError,
+)
+from falkordb_mcp.server import execute_query, get_server_status
+
+
+class TestAdmissionController:
+    """Test suite for AdmissionController."""
+
+    async def test_graph_limit_queues(self):
+        """Test calls past the per-graph limit wait until a slot frees."""
+        admission = AdmissionController(
+            max_per_graph=1, max_per_client=0, max_queue=4, queue_timeout=1
+        )
+        await admission.acquire("g1", "a")
+
+        waiter = asyncio.create_task(admission.acquire("g1", "b"))
+        await asyncio.sleep(0)
+        await admission.acquire("g2", "b")
+        assert admission.stats()["waiting_by_graph"] == {"g1": 1}
+
+        admission.release("g1", "a", 0.01)
+        await waiter
+        stats = admission.stats()
+        assert stats["active_by_graph"] == {"g1": 1, "g2": 1}
+        assert stats["queued_total"] == 1
+
+    async def test_client_limit_does_not_block_others(self):
+        """Test one busy client queues behind itself while other clients run."""
+        admission = AdmissionController(
+            max_per_graph=0, max_per_client=1, max_queue=4, queue_timeout=1
+        )
+        await admission.acquire("g", "busy")
+
+        waiter = asyncio.create_task(admission.acquire("g", "busy"))
+        await asyncio.sleep(0)
+        await admission.acquire("g", "other")
+
+        assert admission.waiting == 1
+        admission.release("g", "busy", 0.01)
+        await waiter
+        assert admission.waiting == 0
+
+    async def test_queue_full_rejects_fast(self):
+        """Test an overflowing queue rejects with a retry-after hint."""
+        admission = AdmissionController(
+            max_per_graph=1, max_per_client=0, max_queue=1, queue_timeout=1
+        )
+        await admission.acquire("g", None)
+        admission.release("g", None, 0.2)
+        await admission.acquire("g", None)
+        waiter = asyncio.create_task(admission.acquire("g", None))
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejectedError) as excinfo:
+            await admission.acquire("g", None)
+
+        assert excinfo.value.reason == QUEUE_FULL
+        assert excinfo.value.retry_after >= 0.2
+        assert admission.stats()["rejected"][QUEUE_FULL] == 1
+        waiter.cancel()
+
+    async def test_queue_timeout(self):
+        """Test a call waiting past the deadline is rejected and leaves the queue."""
+        admission = AdmissionController(
+            max_per_graph=1, max_per_client=0, max_queue=4, queue_timeout=0.01
+        )
+        await admission.acquire("g", None)
+
+        with pytest.raises(AdmissionRejectedError) as excinfo:
+            await admission.acquire("g", None)
+
+        assert excinfo.value.reason == QUEUE_TIMEOUT
+        stats = admission.stats()
+        assert stats["waiting"] == 0
+        assert stats["active"] == 1
+
+
+class TestAdmissionTools:
+    """Test suite for admission control on the MCP tools."""
+
+    async def test_overloaded_response(self, mock_async_falkordb_service):
+        """Test a rejected call reports overload and when to retry."""
+        mock_async_falkordb_service.admission = AdmissionController(1, 0, 0, 1)
+        await mock_async_falkordb_service.admission.acquire("g", None)
+
+        with patch(
+            "falkordb_mcp.server.get_async_service",
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            result = json.loads(await execute_query("g", "MATCH (n) RETURN n"))
+
+        assert result["success"] is False
+        assert result["errorType"] == "overloaded"
+        assert result["retryAfter"] > 0
+        assert result["admission"]["reason"] == QUEUE_FULL
+
+    async def test_client_from_context(self, mock_async_falkordb_service):
+        """Test calls are counted under the request's client id."""
+        ctx = Mock()
+        ctx.client_id = "agent-1"
+        seen = []
+
+        async def record(*args, **kwargs):
+            seen.append(dict(mock_async_falkordb_service.admission._active_by_client))
+            return {"result_set": [], "headers": []}
+
+        mock_async_falkordb_service.execute_query = record
+        with patch(
+            "falkordb_mcp.server.get_async_service",
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            await execute_query("g", "MATCH (n) RETURN n", ctx=ctx)
+
+        assert seen == [{"agent-1": 1}]
+        assert mock_async_falkordb_service.admission.stats()["active"] == 0
+
+    async def test_status_reports_admission(self, mock_async_falkordb_service):
+        """Test the status resource includes queue depth and rejections."""
+        with patch(
+            "falkordb_mcp.server.get_async_service",
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            status = json.loads(await get_server_status())
+
+        assert status["admission"]["waiting"] == 0
+        assert status["admission"]["rejected_total"] == 0
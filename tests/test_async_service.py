@@ -0,0 +1,353 @@
+"""Test suite for AsyncFalkorDBService layer."""
+
+import sys
+from pathlib import Path
+# Add src to path
+src_path = str(Path(__file__).parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from falkordb_mcp.async_service import AsyncFalkorDBService, get_async_service
+
+
+class TestAsyncExecuteQuery:
+    """Test suite for async execute_query method."""
+
+    async def test_execute_query_returns_dict(self, mock_async_falkordb_service):
+        """Test execute_query returns the same shape as the sync service."""
+        result = await mock_async_falkordb_service.execute_query("test_graph", "MATCH (n) RETURN n")
+
+        assert result["result_set"][0] == [1, "Alice", 30]
+        assert result["headers"] == ["id", "name", "age"]
+        assert result["statistics"]["nodes_created"] == 0
+        json.dumps(result)
+
+    async def test_execute_query_full_statistics(self, mock_async_falkordb_service):
+        """Test FalkorDB's execution time and plan cache flag are returned."""
+        from tests.fixtures.mock_data import create_mock_query_result
+
+        result = create_mock_query_result([[1]], ["n"], indices_created=1, cached_execution=True)
+        result.run_time_ms = 0.42
+        mock_graph = mock_async_falkordb_service.client.select_graph("test_graph")
+        mock_graph.query.return_value = result
+
+        data = await mock_async_falkordb_service.execute_query(
+            "test_graph", "CREATE INDEX FOR (n:Entity) ON (n.name)"
+        )
+
+        statistics = data["statistics"]
+        assert statistics["run_time_ms"] == 0.42
+        assert statistics["cached_execution"] is True
+        assert statistics["indices_created"] == 1
+        assert statistics["properties_removed"] == 0
+        assert data["timings"]["network_ms"] >= 0
+
+    async def test_execute_query_with_parameters(self, mock_async_falkordb_service):
+        """Test execute_query passes parameters to the asyncio graph."""
+        params = {"name": "Alice"}
+        await mock_async_falkordb_service.execute_query(
+            "test_graph", "MATCH (n:Person {name: $name}) RETURN n", params
+        )
+
+        mock_graph = mock_async_falkordb_service.client.select_graph("test_graph")
+        mock_graph.query.assert_awaited_with(
+            "MATCH (n:Person {name: $name}) RETURN n", params
+        )
+
+    async def test_execute_query_raises_on_error(self, mock_async_falkordb_service):
+        """Test execute_query re-raises query errors."""
+        mock_graph = mock_async_falkordb_service.client.select_graph("test_graph")
+        mock_graph.query.side_effect = Exception("Query syntax error")
+
+        with pytest.raises(Exception, match="Query syntax error"):
+            await mock_async_falkordb_service.execute_query("test_graph", "INVALID QUERY")
+
+    async def test_concurrent_queries_overlap(self, mock_async_falkordb_service, mock_query_result):
+        """Test in-flight queries overlap on the event loop instead of serializing."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_query(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return mock_query_result
+
+        mock_graph = mock_async_falkordb_service.client.select_graph("test_graph")
+        mock_graph.query.side_effect = slow_query
+
+        service = mock_async_falkordb_service
+        results = await asyncio.gather(
+            *(service.execute_query("test_graph", f"RETURN {i}") for i in range(8))
+        )
+
+        assert len(results) == 8
+        assert peak == 8
+
+
+class TestSingleFlight:
+    """Test suite for coalescing identical in-flight reads."""
+
+    @pytest.fixture
+    def slow_query(self, mock_async_falkordb_service, mock_query_result):
+        """Make the mock graph's queries take long enough to overlap."""
+        async def query(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return mock_query_result
+
+        mock_graph = mock_async_falkordb_service.client.select_graph("test_graph")
+        mock_graph.query.side_effect = query
+        return mock_graph.query
+
+    async def test_identical_reads_share_execution(self, mock_async_falkordb_service, slow_query):
+        """Test concurrent identical reads run once and all get the result."""
+        results = await asyncio.gather(
+            *(mock_async_falkordb_service.execute_query(
+                "test_graph", "MATCH (n:Entity) RETURN count(n)"
+            ) for _ in range(5))
+        )
+
+        assert slow_query.await_count == 1
+        assert all(result == results[0] for result in results)
+        stats = mock_async_falkordb_service.inflight.stats()
+        assert stats["executions"] == 1
+        assert stats["coalesced"] == 4
+        assert stats["in_flight"] == 0
+
+    async def test_different_params_not_coalesced(self, mock_async_falkordb_service, slow_query):
+        """Test reads with different parameters run separately."""
+        await asyncio.gather(
+            mock_async_falkordb_service.execute_query("test_graph", "RETURN $x", {"x": 1}),
+            mock_async_falkordb_service.execute_query("test_graph", "RETURN $x", {"x": 2}),
+        )
+
+        assert slow_query.await_count == 2
+
+    async def test_errors_reach_every_caller(self, mock_async_falkordb_service, slow_query):
+        """Test a failed shared execution raises for every waiting caller."""
+        async def failing(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            raise Exception("Query timed out")
+
+        slow_query.side_effect = failing
+        service = mock_async_falkordb_service
+        results = await asyncio.gather(
+            *(service.execute_query("test_graph", "RETURN 1") for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert slow_query.await_count == 1
+        assert all("timed out" in str(result) for result in results)
+
+    async def test_cancelled_caller_does_not_cancel_others(
+        self, mock_async_falkordb_service, slow_query
+    ):
+        """Test a caller that goes away leaves the shared execution running."""
+        service = mock_async_falkordb_service
+        first = asyncio.create_task(service.execute_query("test_graph", "RETURN 1"))
+        second = asyncio.create_task(service.execute_query("test_graph", "RETURN 1"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        result = await second
+
+        assert result["headers"] == ["id", "name", "age"]
+        assert slow_query.await_count == 1
+
+    async def test_read_after_write_starts_new_execution(
+        self, mock_async_falkordb_service, slow_query, mock_query_result
+    ):
+        """Test a read issued after a write does not join an older flight."""
+        service = mock_async_falkordb_service
+        before = asyncio.create_task(service.execute_query("test_graph", "RETURN 1"))
+        await asyncio.sleep(0)
+        service.results.invalidate_graph("test_graph")
+        after = asyncio.create_task(service.execute_query("test_graph", "RETURN 1"))
+
+        await asyncio.gather(before, after)
+
+        assert slow_query.await_count == 2
+
+
+class TestAsyncServiceLifecycle:
+    """Test suite for async service connection lifecycle."""
+
+    async def test_list_graphs(self, mock_async_falkordb_service):
+        """Test list_graphs awaits the asyncio client."""
+        assert await mock_async_falkordb_service.list_graphs() == ["graph1", "graph2"]
+
+    async def test_client_not_initialized(self):
+        """Test accessing the client before initialize() raises."""
+        service = AsyncFalkorDBService()
+
+        with pytest.raises(RuntimeError, match="not initialized"):
+            service.client
+
+    async def test_close(self, mock_async_falkordb_service):
+        """Test close releases the client."""
+        connection = mock_async_falkordb_service.client.connection
+        await mock_async_falkordb_service.close()
+
+        connection.aclose.assert_awaited_once()
+        assert mock_async_falkordb_service._client is None
+
+    async def test_get_async_service_singleton(self):
+        """Test get_async_service initializes once and reuses the instance."""
+        import falkordb_mcp.async_service as async_service_module
+        async_service_module._async_service = None
+
+        with patch.object(AsyncFalkorDBService, "initialize", AsyncMock()) as mock_init:
+            first = await get_async_service()
+            second = await get_async_service()
+
+        assert first is second
+        mock_init.assert_awaited_once()
+        async_service_module._async_service = None
+
+
+# Raw GRAPH.QUERY --compact replies as returned through a redis pipeline
+RAW_COUNT_REPLY = [
+    [[1, "count"]],
+    [[[3, 42]]],
+    ["Cached execution: 1", "Query internal execution time: 0.25 milliseconds"],
+]
+RAW_CREATE_REPLY = [
+    ["Nodes created: 1", "Query internal execution time: 0.50 milliseconds"],
+]
+
+
+class TestExecuteBatch:
+    """Test suite for pipelined execute_batch."""
+
+    @pytest.fixture
+    def mock_pipeline(self, mock_async_falkordb_service):
+        """Pipeline mock attached to the async service's client."""
+        pipe = Mock()
+        pipe.execute = AsyncMock(return_value=[RAW_COUNT_REPLY, RAW_CREATE_REPLY])
+        mock_async_falkordb_service.client.connection.pipeline.return_value = pipe
+        mock_graph = mock_async_falkordb_service.client.select_graph("g")
+        mock_graph.name = "g"
+        mock_graph._build_params_header.side_effect = lambda params: "CYPHER " if params else ""
+        return pipe
+
+    async def test_batch_single_round_trip(self, mock_async_falkordb_service, mock_pipeline):
+        """Test every item is queued on one pipeline and executed once."""
+        batch = await mock_async_falkordb_service.execute_batch([
+            {"graph_name": "g", "query": "MATCH (n:Entity) RETURN count(n)"},
+            {"graph_name": "g", "query": "CREATE (:Entity)", "params": {"x": 1}},
+        ])
+
+        mock_pipeline.execute.assert_awaited_once()
+        commands = [c.args for c in mock_pipeline.execute_command.call_args_list]
+        assert commands[0] == (
+            "GRAPH.RO_QUERY", "g", "MATCH (n:Entity) RETURN count(n)", "--compact"
+        )
+        assert commands[1] == (
+            "GRAPH.QUERY", "g", "CYPHER CREATE (:Entity)", "--compact"
+        )
+
+        assert batch["count"] == 2 and batch["succeeded"] == 2
+        assert batch["results"][0]["graph_name"] == "g"
+        assert batch["results"][0]["data"]["result_set"] == [[42]]
+        assert batch["results"][0]["timings"]["run_time_ms"] == 0.25
+        assert batch["results"][1]["data"]["statistics"]["nodes_created"] == 1
+        json.dumps(batch)
+
+    async def test_batch_item_errors_are_isolated(self, mock_async_falkordb_service, mock_pipeline):
+        """Test invalid and failing items report errors without failing the batch."""
+        from redis.exceptions import ResponseError
+
+        mock_pipeline.execute.return_value = [ResponseError("Invalid input")]
+
+        batch = await mock_async_falkordb_service.execute_batch([
+            {"graph_name": "g", "query": "MATCH (n) RETURN n"},
+            {"query": "MATCH (n) RETURN n"},
+            {"graph_name": "g", "query": "CREATE (n)", "read_only": True},
+        ])
+
+        results = batch["results"]
+        assert batch["failed"] == 3
+        assert "Invalid input" in results[0]["error"]
+        assert "graph_name" in results[1]["error"]
+        assert "read_only" in results[2]["error"]
+        assert mock_pipeline.execute_command.call_count == 1
+
+    async def test_batch_item_timeout(self, mock_async_falkordb_service, mock_pipeline):
+        """Test items carry their own timeout and report FalkorDB aborting them."""
+        from redis.exceptions import ResponseError
+
+        mock_pipeline.execute.return_value = [ResponseError("Query timed out")]
+
+        batch = await mock_async_falkordb_service.execute_batch([
+            {"graph_name": "g", "query": "MATCH (n) RETURN n", "timeout_ms": 10},
+        ])
+
+        assert mock_pipeline.execute_command.call_args.args[-2:] == ("timeout", 10)
+        assert "10 ms timeout" in batch["results"][0]["error"]
+
+    async def test_batch_graph_list(self, mock_async_falkordb_service, mock_pipeline):
+        """Test batches skip reads on missing graphs and record created graphs."""
+        service = mock_async_falkordb_service
+        mock_pipeline.execute.return_value = [RAW_CREATE_REPLY]
+        await service.list_graphs()
+        assert service.graph_list.missing("g")
+
+        batch = await service.execute_batch([
+            {"graph_name": "absent", "query": "MATCH (n) RETURN n"},
+            {"graph_name": "g", "query": "CREATE (:Entity)"},
+        ])
+
+        assert "absent" in batch["results"][0]["error"]
+        assert batch["results"][1]["success"] is True
+        assert mock_pipeline.execute_command.call_count == 1
+        assert not service.graph_list.missing("g")
+
+    async def test_batch_leases_per_graph(self, mock_async_falkordb_service, mock_pipeline):
+        """Test each graph in a batch gets its own pipeline and pool lease."""
+        service = mock_async_falkordb_service
+        mock_pipeline.execute.return_value = [RAW_COUNT_REPLY]
+        leased = []
+        acquire = service.pool.acquire
+
+        async def record(graph_name=None):
+            leased.append(graph_name)
+            await acquire(graph_name)
+
+        with patch.object(service.pool, "acquire", record):
+            batch = await service.execute_batch([
+                {"graph_name": "a", "query": "MATCH (n:Entity) RETURN count(n)"},
+                {"graph_name": "b", "query": "MATCH (n:Entity) RETURN count(n)"},
+            ])
+
+        assert sorted(leased) == ["a", "b"]
+        assert mock_pipeline.execute.await_count == 2
+        assert [result["graph_name"] for result in batch["results"]] == ["a", "b"]
+
+    async def test_batch_reads_skip_write_bookkeeping(
+        self, mock_async_falkordb_service, mock_pipeline
+    ):
+        """Test read items do not go through write statistics handling."""
+        service = mock_async_falkordb_service
+        mock_pipeline.execute.return_value = [RAW_COUNT_REPLY]
+
+        with patch.object(service, "_record_write") as record_write:
+            await service.execute_batch([
+                {"graph_name": "g", "query": "MATCH (n:Entity) RETURN count(n)"},
+            ])
+
+        record_write.assert_not_called()
+
+    async def test_batch_size_limit(self, mock_async_falkordb_service):
+        """Test empty and oversized batches are rejected."""
+        with pytest.raises(ValueError):
+            await mock_async_falkordb_service.execute_batch([])
+
+        item = {"graph_name": "g", "query": "RETURN 1"}
+        with pytest.raises(ValueError, match="exceeds"):
+            await mock_async_falkordb_service.execute_batch([item] * 101)
@@ -0,0 +1,339 @@
+"""Test suite for the query result cache."""
+
+import sys
+from pathlib import Path
+# Add src to path
+src_path = str(Path(__file__).parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+import json
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from falkordb_mcp.cache import (
+    GraphListCache,
+    GraphNotFoundError,
+    PlanCacheStats,
+    ResultCache,
+)
+from falkordb_mcp.encoding import dumps
+from falkordb_mcp.server import execute_query, get_cache_stats
+from tests.fixtures.mock_data import create_mock_query_result
+
+
+class TestResultCache:
+    """Test suite for ResultCache."""
+
+    def test_key_normalizes_whitespace_and_params(self):
+        """Test formatting and parameter order do not split entries."""
+        a = ResultCache.make_key("g", "MATCH (n)\n  RETURN n", {"a": 1, "b": 2})
+        b = ResultCache.make_key("g", "MATCH (n) RETURN n", {"b": 2, "a": 1})
+
+        assert a == b
+        assert a != ResultCache.make_key("other", "MATCH (n) RETURN n", {"a": 1, "b": 2})
+
+    def test_hit_and_miss(self):
+        """Test get returns stored values and counts hits and misses."""
+        cache = ResultCache(max_bytes=1024, ttl=60)
+        key = ResultCache.make_key("g", "RETURN 1", None)
+
+        assert cache.get(key) is None
+        cache.put(key, {"result_set": [[1]]})
+
+        assert cache.get(key) == {"result_set": [[1]]}
+        assert cache.stats()["hit_ratio"] == 0.5
+
+    def test_ttl_expiry(self):
+        """Test entries expire after the TTL."""
+        cache = ResultCache(max_bytes=1024, ttl=60)
+        key = ResultCache.make_key("g", "RETURN 1", None)
+
+        with patch("falkordb_mcp.cache.time.monotonic", return_value=1000.0):
+            cache.put(key, [1])
+        with patch("falkordb_mcp.cache.time.monotonic", return_value=1061.0):
+            assert cache.get(key) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_byte_bound_evicts_lru(self):
+        """Test the byte bound evicts least recently used entries."""
+        cache = ResultCache(max_bytes=20, ttl=60)
+        first, second, third = (ResultCache.make_key("g", q, None) for q in ("a", "b", "c"))
+
+        cache.put(first, "x" * 5, size=8)
+        cache.put(second, "y" * 5, size=8)
+        cache.get(first)
+        cache.put(third, "z" * 5, size=8)
+
+        assert cache.get(first) is not None
+        assert cache.get(second) is None
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] == 16
+
+    def test_invalidate_graph(self):
+        """Test invalidation only drops the written graph's entries."""
+        cache = ResultCache(max_bytes=1024, ttl=60)
+        cache.put(ResultCache.make_key("g1", "RETURN 1", None), 1)
+        cache.put(ResultCache.make_key("g2", "RETURN 1", None), 1)
+
+        assert cache.invalidate_graph("g1") == 1
+        assert cache.get(ResultCache.make_key("g2", "RETURN 1", None)) == 1
+
+    def test_stale_generation_not_cached(self):
+        """Test a read that overlapped a write does not repopulate the cache."""
+        cache = ResultCache(max_bytes=1024, ttl=60)
+        key = ResultCache.make_key("g", "RETURN 1", None)
+
+        generation = cache.generation("g")
+        cache.invalidate_graph("g")
+        cache.put(key, 1, generation=generation)
+
+        assert cache.get(key) is None
+
+
+class TestPlanCacheStats:
+    """Test suite for FalkorDB plan cache tracking."""
+
+    def test_hit_ratio(self):
+        """Test the hit ratio counts cached executions."""
+        stats = PlanCacheStats()
+        stats.record(False, literals_lifted=2)
+        stats.record(True, literals_lifted=2)
+        stats.record(True)
+
+        report = stats.stats()
+        assert report["queries"] == 3
+        assert report["hit_ratio"] == round(2 / 3, 4)
+        assert report["parameterized_queries"] == 2
+        assert report["literals_lifted"] == 4
+
+    def test_ignores_missing_statistic(self):
+        """Test results without a cached_execution statistic are not counted."""
+        stats = PlanCacheStats()
+        stats.record(None)
+
+        assert stats.stats()["queries"] == 0
+
+
+class TestGraphListCache:
+    """Test suite for GraphListCache."""
+
+    def test_list_answers_existence(self):
+        """Test a fresh list makes unlisted graphs missing."""
+        cache = GraphListCache(ttl=5)
+        assert cache.missing("g3") is False
+        cache.put(["g1", "g2"], cache.generation)
+
+        assert cache.get() == ["g1", "g2"]
+        assert cache.missing("g1") is False
+        assert cache.missing("g3") is True
+        assert cache.stats()["rejected"] == 1
+
+    def test_write_to_new_graph_invalidates(self):
+        """Test a write creating a graph drops the list and its negative entry."""
+        cache = GraphListCache(ttl=5)
+        cache.put(["g1"], cache.generation)
+        cache.record_write("g1")
+        assert cache.get() == ["g1"]
+
+        cache.record_write("g2")
+
+        assert cache.get() is None
+        assert cache.missing("g2") is False
+
+    def test_list_fetched_across_write_dropped(self):
+        """Test a list requested before a graph was created is not cached."""
+        cache = GraphListCache(ttl=5)
+        generation = cache.generation
+        cache.record_write("new")
+        cache.put(["old"], generation)
+
+        assert cache.get() is None
+
+    def test_negative_entries_expire(self):
+        """Test names reported missing fail fast only until the TTL passes."""
+        cache = GraphListCache(ttl=5)
+        cache.mark_missing("nope")
+        assert cache.missing("nope") is True
+
+        with patch("falkordb_mcp.cache.time.monotonic", return_value=1e12):
+            assert cache.missing("nope") is False
+        assert cache.stats()["missing"] == 0
+
+
+class TestServiceGraphList:
+    """Test suite for graph list caching in the services."""
+
+    def test_list_graphs_cached(self, mock_falkordb_service):
+        """Test GRAPH.LIST is sent once within the TTL."""
+        mock_falkordb_service.list_graphs()
+        assert mock_falkordb_service.list_graphs() == ["graph1", "graph2"]
+
+        assert mock_falkordb_service.client.list_graphs.call_count == 1
+
+    def test_unknown_graph_fails_fast(self, mock_falkordb_service):
+        """Test reads against an unlisted graph fail without a round trip."""
+        mock_graph = mock_falkordb_service.client.select_graph("unknown")
+        mock_graph.name = "unknown"
+        mock_falkordb_service.list_graphs()
+
+        with pytest.raises(GraphNotFoundError):
+            mock_falkordb_service.execute_query("unknown", "MATCH (n) RETURN n")
+        assert mock_graph.ro_query.call_count == 0
+
+        mock_falkordb_service.execute_query("unknown", "CREATE (n)")
+        assert mock_falkordb_service.graph_list.get() is None
+
+    async def test_missing_graph_remembered(self, mock_async_falkordb_service):
+        """Test an empty-key error makes later reads on the graph fail fast."""
+        from redis.exceptions import ResponseError
+
+        mock_graph = mock_async_falkordb_service.client.select_graph("nope")
+        mock_graph.ro_query = AsyncMock(
+            side_effect=ResponseError("Invalid graph operation on empty key")
+        )
+
+        with pytest.raises(ResponseError):
+            await mock_async_falkordb_service.execute_query("nope", "MATCH (n) RETURN n")
+        with pytest.raises(GraphNotFoundError):
+            await mock_async_falkordb_service.execute_query("nope", "MATCH (n) RETURN n")
+        assert mock_graph.ro_query.await_count == 1
+
+    async def test_keyspace_events(self, mock_async_falkordb_service):
+        """Test notifications for listed deletions or unlisted keys drop the list."""
+        service = mock_async_falkordb_service
+        await service.list_graphs()
+        service.on_keyspace_event(b"__keyspace@0__:graph1", b"graph.query")
+        assert service.graph_list.get() == ["graph1", "graph2"]
+
+        service.on_keyspace_event("__keyspace@0__:graph1", "del")
+        assert service.graph_list.get() is None
+
+        await service.list_graphs()
+        service.on_keyspace_event("__keyspace@0__:graph3", "graph.query")
+        assert service.graph_list.get() is None
+        assert service.client.list_graphs.await_count == 2
+
+
+class TestServiceResultCache:
+    """Test suite for result caching in the services."""
+
+    def test_repeated_read_served_from_cache(self, mock_falkordb_service):
+        """Test an identical read is answered without a second round trip."""
+        mock_graph = mock_falkordb_service.client.select_graph("g")
+
+        first = mock_falkordb_service.execute_query("g", "MATCH (n) RETURN count(n)")
+        second = mock_falkordb_service.execute_query("g", "MATCH (n)  RETURN count(n)")
+
+        assert first["result_set"] == second["result_set"]
+        assert second["timings"]["result_cache_hit"] is True
+        assert mock_graph.ro_query.call_count == 1
+
+    def test_cached_size_reuses_row_budget(self, mock_falkordb_service):
+        """Test the cache is handed the size measured by the row budget."""
+        results = mock_falkordb_service.results
+        with patch.object(results, "put", wraps=results.put) as put:
+            data = mock_falkordb_service.execute_query("g", "MATCH (n) RETURN n")
+
+        size = put.call_args.args[2]
+        assert abs(size - len(dumps(data, pretty=False))) <= 1
+        assert results.stats()["bytes"] == size
+
+    def test_write_invalidates_graph(self, mock_falkordb_service):
+        """Test a write with non-zero statistics drops cached reads."""
+        mock_graph = mock_falkordb_service.client.select_graph("g")
+        read_result = mock_graph.query.return_value
+        mock_falkordb_service.execute_query("g", "MATCH (n) RETURN n")
+
+        mock_graph.query = Mock(return_value=create_mock_query_result([], nodes_created=1))
+        mock_falkordb_service.execute_query("g", "CREATE (n)")
+        mock_graph.ro_query = Mock(return_value=read_result)
+        mock_falkordb_service.execute_query("g", "MATCH (n) RETURN n")
+
+        assert mock_graph.ro_query.call_count == 1
+        assert mock_falkordb_service.results.stats()["invalidations"] == 1
+
+    def test_write_without_changes_keeps_cache(self, mock_falkordb_service):
+        """Test a write-path query that changed nothing keeps cached reads."""
+        mock_falkordb_service.execute_query("g", "MATCH (n) RETURN n")
+
+        mock_falkordb_service.execute_query("g", "MATCH (n:Missing) SET n.x = 1")
+
+        assert mock_falkordb_service.results.stats()["entries"] == 1
+
+    async def test_async_write_invalidates_graph(self, mock_async_falkordb_service):
+        """Test the async service invalidates cached reads after a write."""
+        mock_graph = mock_async_falkordb_service.client.select_graph("g")
+        await mock_async_falkordb_service.execute_query("g", "MATCH (n) RETURN n")
+        await mock_async_falkordb_service.execute_query("g", "MATCH (n) RETURN n")
+        assert mock_graph.query.await_count == 1
+
+        mock_graph.query.return_value = create_mock_query_result([], properties_set=2)
+        await mock_async_falkordb_service.execute_query("g", "MATCH (n) SET n.x = 1")
+
+        assert mock_async_falkordb_service.results.stats()["entries"] == 0
+
+    async def test_cache_resource(self, mock_async_falkordb_service):
+        """Test falkordb://cache reports the hit ratio."""
+        await mock_async_falkordb_service.execute_query("g", "RETURN 1")
+        await mock_async_falkordb_service.execute_query("g", "RETURN 1")
+
+        with patch(
+            'falkordb_mcp.server.get_async_service',
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            stats = json.loads(await get_cache_stats())
+
+        assert stats["results"]["hits"] == 1
+        assert stats["results"]["hit_ratio"] == 0.5
+        assert stats["coalescing"]["executions"] == 1
+
+
+class TestParameterizedExecution:
+    """Test suite for literal parameterization in execute_query."""
+
+    async def test_parameterized_query_sent(self, mock_async_falkordb_service):
+        """Test the rewritten query and merged params reach FalkorDB."""
+        mock_graph = mock_async_falkordb_service.client.select_graph("g")
+        mock_graph.query.return_value = create_mock_query_result(
+            [[31]], [[1, "n.age + $_lit1"]], cached_execution=True
+        )
+
+        result = await mock_async_falkordb_service.execute_query(
+            "g", "MATCH (n {name: 'Alice'}) WHERE n.x = $x RETURN n.age + 1",
+            {"x": 2}, parameterize=True,
+        )
+
+        mock_graph.query.assert_awaited_with(
+            "MATCH (n {name: $_lit0}) WHERE n.x = $x RETURN n.age + $_lit1",
+            {"x": 2, "_lit0": "Alice", "_lit1": 1},
+        )
+        assert result["headers"] == [[1, "n.age + 1"]]
+        stats = mock_async_falkordb_service.plan_cache.stats()
+        assert stats["hits"] == 1 and stats["parameterized_queries"] == 1
+
+    async def test_tool_opt_in(self, mock_async_falkordb_service):
+        """Test the execute_query tool passes a per-call parameterize flag."""
+        mock_graph = mock_async_falkordb_service.client.select_graph("g")
+
+        with patch(
+            "falkordb_mcp.server.get_async_service",
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            result = json.loads(await execute_query(
+                "g", "MATCH (n {name: 'Alice'}) RETURN n", parameterize=True
+            ))
+
+        assert result["success"] is True
+        mock_graph.ro_query.assert_awaited_with(
+            "MATCH (n {name: $_lit0}) RETURN n", {"_lit0": "Alice"}
+        )
+
+    def test_disabled_by_default(self, mock_falkordb_service):
+        """Test queries are sent unchanged unless parameterization is enabled."""
+        mock_graph = mock_falkordb_service.client.select_graph("g")
+
+        mock_falkordb_service.execute_query("g", "MATCH (n {name: 'Alice'}) RETURN n")
+
+        mock_graph.ro_query.assert_called_with(
+            "MATCH (n {name: 'Alice'}) RETURN n", {}
+        )
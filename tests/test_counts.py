@@ -0,0 +1,150 @@
+"""Test suite for incrementally maintained entity counts."""
+
+import sys
+from pathlib import Path
+# Add src to path
+src_path = str(Path(__file__).parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+import json
+import pytest
+from unittest.mock import AsyncMock, patch
+from falkordb_mcp.counts import CountTracker
+from falkordb_mcp.server import get_graph_stats
+from tests.fixtures.mock_data import create_mock_query_result, mock_metadata_pipeline
+
+
+class TestCountTracker:
+    """Test suite for CountTracker."""
+
+    def test_attributed_writes(self):
+        """Test writes naming one label and type adjust just those counts."""
+        tracker = CountTracker()
+        tracker.seed("g", {"Person": 2, "City": 1}, {"KNOWS": 1}, tracker.generation("g"))
+
+        tracker.apply(
+            "g",
+            "MATCH (a:Person {id: 1}) CREATE (a)-[:KNOWS]->(:Person {id: 3})",
+            {"nodes_created": 1, "relationships_created": 1},
+        )
+        tracker.apply("g", "MATCH (c:City) DETACH DELETE c", {"nodes_deleted": 1})
+
+        snapshot = tracker.snapshot("g")
+        assert snapshot["node_counts"] == {"Person": 3, "City": 0}
+        assert snapshot["relationship_counts"] == {"KNOWS": 2}
+        assert snapshot["drifted"] is False
+        assert snapshot["writes_applied"] == 2
+
+    def test_ambiguous_write_drifts(self):
+        """Test writes that cannot be attributed mark the graph for reconciliation."""
+        tracker = CountTracker()
+        tracker.seed("g", {"Person": 2}, {}, tracker.generation("g"))
+        assert tracker.due(max_age=3600) == []
+
+        tracker.apply("g", "MATCH (n) DETACH DELETE n", {"nodes_deleted": 2})
+
+        assert tracker.snapshot("g")["drifted"] is True
+        assert tracker.due(max_age=3600) == ["g"]
+
+    @pytest.mark.parametrize("query,statistics", [
+        ("MATCH (n:Person) CREATE (m)", {"nodes_created": 1}),
+        ("MATCH (n:Person) WHERE n:Employee DELETE n", {"nodes_deleted": 1}),
+    ])
+    def test_unnamed_entities_drift(self, query, statistics):
+        """Test writes touching nodes beyond the one named label drift the counts."""
+        tracker = CountTracker()
+        tracker.seed("g", {"Person": 2}, {}, tracker.generation("g"))
+
+        tracker.apply("g", query, statistics)
+
+        snapshot = tracker.snapshot("g")
+        assert snapshot["node_counts"] == {"Person": 2}
+        assert snapshot["drifted"] is True
+
+    def test_relabel_drifts(self):
+        """Test label changes drift the counts even without created entities."""
+        tracker = CountTracker()
+        tracker.seed("g", {"Person": 2}, {}, tracker.generation("g"))
+
+        tracker.apply("g", "MATCH (n:Person) SET n:Admin", {"labels_added": 2})
+
+        assert tracker.snapshot("g")["drifted"] is True
+
+    def test_seed_across_write_drifts(self):
+        """Test counts fetched while a write landed are reconciled again."""
+        tracker = CountTracker()
+        generation = tracker.generation("g")
+        tracker.apply("g", "CREATE (:Person)", {"nodes_created": 1})
+        tracker.seed("g", {"Person": 1}, {}, generation)
+
+        assert tracker.snapshot("g")["drifted"] is True
+
+    def test_reconciliation_corrections(self):
+        """Test re-seeding reports how far the tracked counts were off."""
+        tracker = CountTracker()
+        tracker.seed("g", {"Person": 2}, {"KNOWS": 1}, tracker.generation("g"))
+        tracker.seed("g", {"Person": 5}, {}, tracker.generation("g"))
+
+        snapshot = tracker.snapshot("g")
+        assert snapshot["reconciliations"] == 1
+        assert snapshot["corrections"] == 4
+        assert snapshot["drifted"] is False
+
+
+class TestGraphStats:
+    """Test suite for graph stats on the async service."""
+
+    async def test_counted_once(self, mock_async_falkordb_service):
+        """Test counts are seeded once and then follow writes without queries."""
+        mock_graph = mock_async_falkordb_service.client.select_graph("test_graph")
+        pipe = mock_metadata_pipeline(
+            mock_graph, ["Person"], ["KNOWS"], counts=[10, 4], is_async=True
+        )
+        await mock_async_falkordb_service.get_graph_stats("test_graph")
+
+        mock_graph.query.return_value = create_mock_query_result([], nodes_created=2)
+        await mock_async_falkordb_service.execute_query(
+            "test_graph", "UNWIND [1, 2] AS i CREATE (:Person {i: i})"
+        )
+        stats = await mock_async_falkordb_service.get_graph_stats("test_graph")
+
+        assert stats["node_counts"] == {"Person": 12}
+        assert stats["relationship_counts"] == {"KNOWS": 4}
+        assert pipe.execute.await_count == 2
+
+    async def test_reconcile_drifted(self, mock_async_falkordb_service):
+        """Test a drifted graph is re-counted by the reconciler."""
+        mock_graph = mock_async_falkordb_service.client.select_graph("test_graph")
+        mock_metadata_pipeline(mock_graph, ["Person"], counts=[10], is_async=True)
+        await mock_async_falkordb_service.get_graph_stats("test_graph")
+
+        mock_graph.query.return_value = create_mock_query_result([], nodes_deleted=3)
+        await mock_async_falkordb_service.execute_query("test_graph", "MATCH (n) DELETE n")
+        mock_metadata_pipeline(mock_graph, ["Person"], counts=[7], is_async=True)
+
+        assert await mock_async_falkordb_service.reconcile_counts() == ["test_graph"]
+        stats = await mock_async_falkordb_service.get_graph_stats("test_graph")
+        assert stats["node_counts"] == {"Person": 7}
+        assert stats["drifted"] is False
+        assert stats["reconciliations"] == 1
+
+    async def test_reconcile_failure_forgets(self, mock_async_falkordb_service):
+        """Test a graph that can no longer be counted stops being tracked."""
+        mock_async_falkordb_service.counts.seed("gone", {}, {}, 1)
+
+        assert await mock_async_falkordb_service.reconcile_counts() == []
+        assert not mock_async_falkordb_service.counts.is_seeded("gone")
+
+    async def test_resource(self, mock_async_falkordb_service):
+        """Test the stats resource serves tracked counts."""
+        mock_async_falkordb_service.counts.seed("test_graph", {"Person": 3}, {}, 0)
+
+        with patch(
+            "falkordb_mcp.server.get_async_service",
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            stats = json.loads(await get_graph_stats("test_graph"))
+
+        assert stats["success"] is True
+        assert stats["node_counts"] == {"Person": 3}
@@ -0,0 +1,169 @@
+"""Test suite for server-side cursors."""
+
+import sys
+from pathlib import Path
+# Add src to path
+src_path = str(Path(__file__).parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+import json
+import pytest
+from unittest.mock import AsyncMock, patch
+from falkordb_mcp.cursors import (
+    CLIENT,
+    KEYSET,
+    SKIP_LIMIT,
+    CursorRegistry,
+    choose_strategy,
+    keyset_query,
+    keyset_variable,
+)
+from falkordb_mcp.server import close_cursor, fetch_cursor, open_cursor
+from tests.fixtures.mock_data import create_mock_query_result
+
+
+class TestStrategy:
+    """Test suite for choosing how a cursor pages."""
+
+    @pytest.mark.parametrize("query,variable", [
+        ("MATCH (n) RETURN n", "n"),
+        ("MATCH (p:Person) WHERE p.age > 30 RETURN p.name, p.age", "p"),
+        ("MATCH (n:Person {name: 'x -> y'}) RETURN n", "n"),
+    ])
+    def test_keyset(self, query, variable):
+        """Test single-node matches are paged by node id."""
+        assert keyset_variable(query) == variable
+        assert choose_strategy(query) == KEYSET
+
+    @pytest.mark.parametrize("query", [
+        "MATCH (a)-[r]->(b) RETURN a, b",
+        "MATCH (a), (b) RETURN a, b",
+        "MATCH (n) RETURN n ORDER BY n.name",
+        "MATCH (n) RETURN DISTINCT n.label",
+        "MATCH (n) RETURN count(n)",
+        "MATCH (n) WITH n WHERE n.x = 1 RETURN n",
+        "MATCH (n), (:Person) RETURN n",
+    ])
+    def test_skip_limit(self, query):
+        """Test queries that may repeat or reorder nodes fall back to SKIP/LIMIT."""
+        assert keyset_variable(query) is None
+        assert choose_strategy(query) == SKIP_LIMIT
+
+    def test_client(self):
+        """Test queries that cannot be rewritten are paged on the client."""
+        assert choose_strategy("MATCH (n) RETURN n LIMIT 100") == CLIENT
+        assert choose_strategy("CALL db.labels()") == CLIENT
+
+    def test_keyset_query(self):
+        """Test the rewrite filters, orders and limits on the node id."""
+        query = keyset_query(
+            "MATCH (n:Person) WHERE n.note = 'RETURN' RETURN n.name // all", "n", 11
+        )
+
+        assert query == (
+            "MATCH (n:Person) WHERE n.note = 'RETURN'\n"
+            "WITH * WHERE id(n) > $_cursor_after\n"
+            "RETURN n.name, id(n) AS _cursor_key\n"
+            "ORDER BY _cursor_key LIMIT 11"
+        )
+
+
+class TestCursorRegistry:
+    """Test suite for CursorRegistry."""
+
+    def test_ttl_expiry(self):
+        """Test idle cursors expire."""
+        registry = CursorRegistry(ttl=60, max_open=10)
+        cursor = registry.open("g", "MATCH (n) RETURN n", None, 10)
+
+        with patch("falkordb_mcp.cursors.time.monotonic", return_value=cursor.last_used + 61):
+            with pytest.raises(ValueError, match="expired"):
+                registry.get(cursor.id)
+
+        assert registry.stats()["expired"] == 1
+
+    def test_evicts_least_recently_used(self):
+        """Test opening past the limit closes the cursor idle the longest."""
+        registry = CursorRegistry(ttl=60, max_open=2)
+        first = registry.open("g", "MATCH (n) RETURN n", None, 10)
+        second = registry.open("g", "MATCH (n) RETURN n", None, 10)
+        registry.get(first.id)
+        registry.open("g", "MATCH (n) RETURN n", None, 10)
+
+        assert registry.get(first.id) is first
+        with pytest.raises(ValueError):
+            registry.get(second.id)
+        assert registry.stats()["evicted"] == 1
+
+
+class TestCursorService:
+    """Test suite for cursors on AsyncFalkorDBService."""
+
+    async def test_keyset_walk(self, mock_async_falkordb_service):
+        """Test keyset cursors resume after the last node id and strip the key column."""
+        service = mock_async_falkordb_service
+        mock_graph = service.client.select_graph("g")
+        mock_graph.ro_query.return_value = create_mock_query_result(
+            [["a", 10], ["b", 11], ["c", 15]], [[1, "n.name"], [1, "_cursor_key"]]
+        )
+
+        first = await service.open_cursor("g", "MATCH (n) RETURN n.name", page_size=2)
+
+        sent_query, sent_params = mock_graph.ro_query.await_args.args
+        assert sent_query.endswith("ORDER BY _cursor_key LIMIT 3")
+        assert sent_params == {"_cursor_after": -1}
+        assert first["result_set"] == [["a"], ["b"]]
+        assert first["headers"] == [[1, "n.name"]]
+        assert first["strategy"] == KEYSET
+        assert first["has_more"] is True
+
+        mock_graph.ro_query.return_value = create_mock_query_result([["c", 15]])
+        second = await service.fetch_cursor(first["cursor_id"])
+
+        assert mock_graph.ro_query.await_args.args[1] == {"_cursor_after": 11}
+        assert second["result_set"] == [["c"]]
+        assert second["position"] == 3
+        assert second["has_more"] is False
+        assert len(service.cursors) == 0
+
+    async def test_skip_limit_walk(self, mock_async_falkordb_service):
+        """Test other pageable queries advance SKIP by the rows returned."""
+        service = mock_async_falkordb_service
+        mock_graph = service.client.select_graph("g")
+        mock_graph.ro_query.return_value = create_mock_query_result([[1], [2], [3]])
+        query = "MATCH (a)-[]->(b) RETURN b.v"
+
+        first = await service.open_cursor("g", query, page_size=2)
+        await service.fetch_cursor(first["cursor_id"])
+
+        mock_graph.ro_query.assert_awaited_with(f"{query}\nSKIP 2 LIMIT 3", {})
+
+    async def test_rejects_writes(self, mock_async_falkordb_service):
+        """Test cursors only run read-only queries."""
+        with pytest.raises(Exception, match="write"):
+            await mock_async_falkordb_service.open_cursor("g", "CREATE (n) RETURN n")
+
+
+class TestCursorTools:
+    """Test suite for the cursor MCP tools."""
+
+    async def test_open_fetch_close(self, mock_async_falkordb_service):
+        """Test the tools share one cursor and report unknown ids as errors."""
+        mock_graph = mock_async_falkordb_service.client.select_graph("g")
+        mock_graph.ro_query.return_value = create_mock_query_result([[i] for i in range(5)])
+
+        with patch(
+            "falkordb_mcp.server.get_async_service",
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            opened = json.loads(await open_cursor("g", "MATCH (a)-->(b) RETURN b", page_size=2))
+            cursor_id = opened["data"]["cursor_id"]
+            fetched = json.loads(await fetch_cursor(cursor_id))
+            closed = json.loads(await close_cursor(cursor_id))
+            missing = json.loads(await fetch_cursor(cursor_id))
+
+        assert opened["success"] is True and fetched["success"] is True
+        assert fetched["data"]["position"] == 4
+        assert closed["closed"] is True
+        assert missing["success"] is False
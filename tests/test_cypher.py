@@ -0,0 +1,163 @@
+"""Test suite for Cypher query analysis."""
+
+import sys
+from pathlib import Path
+# Add src to path
+src_path = str(Path(__file__).parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+import pytest
+from falkordb_mcp.cypher import (
+    ReadOnlyViolationError,
+    ambiguous_changes,
+    is_read_only,
+    parameterize_literals,
+    pattern_names,
+    resolve_read_only,
+    restore_literals,
+)
+
+
+class TestIsReadOnly:
+    """Test suite for read-only classification."""
+
+    @pytest.mark.parametrize("query", [
+        "MATCH (n:Person) RETURN n LIMIT 10",
+        "MATCH (n:Entity) RETURN count(n)",
+        "MATCH (n) WHERE n.name = 'CREATE something' RETURN n",
+        "MATCH (n) WHERE n.set = 1 RETURN n.created_at",
+        "MATCH (n:Create) RETURN n",
+        "RETURN {delete: 1, merge: 2}",
+        "MATCH (n) RETURN n // DELETE n",
+        "MATCH (n) WHERE n.`set` = $set RETURN n",
+        "CALL db.labels()",
+        "CALL db.idx.fulltext.queryNodes('Entity', 'alice') YIELD node RETURN node",
+    ])
+    def test_read_queries(self, query):
+        """Test pure reads are classified as read-only."""
+        assert is_read_only(query) is True
+
+    @pytest.mark.parametrize("query", [
+        "CREATE (n:Person {name: 'Alice'})",
+        "MATCH (n) DETACH DELETE n",
+        "MATCH (n:Person) SET n.age = 31",
+        "MERGE (n:Entity {uuid: $uuid}) RETURN n",
+        "MATCH (n) REMOVE n:Temp",
+        "MATCH (n) FOREACH (x IN [1] | CREATE (:Child))",
+        "create index for (n:Person) on (n.name)",
+        "CALL db.idx.fulltext.createNodeIndex('Entity', 'name')",
+    ])
+    def test_write_queries(self, query):
+        """Test queries that may modify the graph are classified as writes."""
+        assert is_read_only(query) is False
+
+
+class TestResolveReadOnly:
+    """Test suite for the read_only hint."""
+
+    def test_auto(self):
+        """Test None falls back to classification."""
+        assert resolve_read_only("MATCH (n) RETURN n") is True
+        assert resolve_read_only("CREATE (n)") is False
+
+    def test_force_write_path(self):
+        """Test False sends even a read through the write path."""
+        assert resolve_read_only("MATCH (n) RETURN n", False) is False
+
+    def test_reject_write_marked_read_only(self):
+        """Test True rejects queries with write clauses."""
+        with pytest.raises(ReadOnlyViolationError):
+            resolve_read_only("CREATE (n)", True)
+
+
+class TestParameterizeLiterals:
+    """Test suite for lifting literals into parameters."""
+
+    def test_lifts_strings_and_numbers(self):
+        """Test string and number literals become parameters."""
+        query, params, literals = parameterize_literals(
+            'MATCH (n {name: "Alice"}) WHERE n.age > 30 AND n.score < 0.5 RETURN n'
+        )
+
+        assert query == (
+            "MATCH (n {name: $_lit0}) WHERE n.age > $_lit1 AND n.score < $_lit2 RETURN n"
+        )
+        assert params == {"_lit0": "Alice", "_lit1": 30, "_lit2": 0.5}
+        assert literals["_lit0"] == '"Alice"'
+
+    def test_variants_share_query_text(self):
+        """Test queries differing only in literal values rewrite identically."""
+        first, _, _ = parameterize_literals("MATCH (n {name: 'Alice'}) RETURN n")
+        second, _, _ = parameterize_literals("MATCH (n {name: 'Bob'}) RETURN n")
+
+        assert first == second
+
+    def test_merges_user_params(self):
+        """Test caller parameters are kept and generated names avoid them."""
+        query, params, _ = parameterize_literals(
+            "MATCH (n) WHERE n.id = $_lit0 AND n.x = 1 RETURN n", {"_lit0": 7}
+        )
+
+        assert query == "MATCH (n) WHERE n.id = $_lit0 AND n.x = $_lit1 RETURN n"
+        assert params == {"_lit0": 7, "_lit1": 1}
+
+    def test_unescapes_strings(self):
+        """Test escape sequences are decoded into the parameter value."""
+        _, params, _ = parameterize_literals(r"RETURN 'it\'s', 'a\nb', '\u00e9'")
+
+        assert list(params.values()) == ["it's", "a\nb", "\u00e9"]
+
+    @pytest.mark.parametrize("query", [
+        "MATCH (a)-[:KNOWS*1..3]->(b) RETURN b",
+        "MATCH (n) RETURN n SKIP 5 LIMIT 10",
+        "MATCH (n:Label2) WHERE n.`weird 5` = $p RETURN n.x1",
+        "MATCH (n) RETURN n // 42",
+        "CREATE VECTOR INDEX FOR (n:Entity) ON (n.embedding) OPTIONS {dimension: 128}",
+    ])
+    def test_leaves_non_literals(self, query):
+        """Test ranges, LIMIT/SKIP, identifiers, comments and DDL are untouched."""
+        rewritten, _, literals = parameterize_literals(query)
+
+        assert rewritten == query
+        assert literals == {}
+
+    def test_restore_literals_in_headers(self):
+        """Test generated parameter names are replaced in column headers."""
+        _, _, literals = parameterize_literals("MATCH (n) RETURN n.age + 1, n.name")
+
+        headers = restore_literals([[1, "n.age + $_lit0"], [1, "n.name"]], literals)
+
+        assert headers == [[1, "n.age + 1"], [1, "n.name"]]
+
+
+class TestPatternNames:
+    """Test suite for label and relationship type extraction."""
+
+    @pytest.mark.parametrize("query,labels,types", [
+        ("CREATE (n:Person {name: 'a:b', age: x.y})", {"Person"}, set()),
+        ("MATCH (a:Person), (b:Person) CREATE (a)-[:KNOWS {since: 1}]->(b)",
+         {"Person"}, {"KNOWS"}),
+        ("MATCH (n:`odd name`)-[r:A|B*1..2]-() DETACH DELETE n", {"odd name"}, {"A", "B"}),
+        ("UNWIND $rows AS r CREATE (:Entity {meta: {x: 1}})", {"Entity"}, set()),
+        ("MATCH (n) WHERE n.tags = [1, 2] DELETE n", set(), set()),
+        ("CREATE (:A:B) // (:Comment)", {"A", "B"}, set()),
+    ])
+    def test_pattern_names(self, query, labels, types):
+        """Test labels and types come from patterns, not maps, strings or comments."""
+        assert pattern_names(query) == (labels, types)
+
+    @pytest.mark.parametrize("query,ambiguous", [
+        ("MATCH (a:Person {id: 1}) CREATE (a)-[:KNOWS]->(:Person {id: 3})", (False, False)),
+        ("MATCH (n:Person) CREATE (m)", (True, False)),
+        ("MATCH (n:Person) WHERE n.m = 1 CREATE (m)", (True, False)),
+        ("UNWIND $rows AS r MERGE (n {id: r.id})", (True, False)),
+        ("MATCH (n:Person) WHERE n:Employee DELETE n", (True, False)),
+        ("MATCH (n:Person:Employee) DELETE n", (True, False)),
+        ("MATCH (n:Person)-[r:KNOWS]->() DELETE r", (False, False)),
+        ("MATCH (c:City) DETACH DELETE c", (False, True)),
+        ("CREATE INDEX FOR (n:Person) ON (n.name)", (False, False)),
+    ])
+    def test_ambiguous_changes(self, query, ambiguous):
+        """Test unlabeled creates and multi-label deletes cannot be attributed."""
+        assert ambiguous_changes(query) == ambiguous
@@ -0,0 +1,81 @@
+"""Test suite for JSON response encoding."""
+
+import sys
+from pathlib import Path
+# Add src to path
+src_path = str(Path(__file__).parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+import json
+import pytest
+from unittest.mock import AsyncMock, patch
+from falkordb_mcp import encoding
+from falkordb_mcp.server import list_graphs
+
+PAYLOAD = {"success": True, "data": {"result_set": [[1, "Alice", 0.5, None]], "headers": ["n"]}}
+
+
+@pytest.fixture(params=[encoding.STDLIB, encoding.ORJSON])
+def backend(request):
+    """Run a test against each available encoder backend."""
+    if request.param == encoding.ORJSON and encoding.orjson is None:
+        pytest.skip("orjson is not installed")
+    with patch.object(encoding, "backend", request.param):
+        yield request.param
+
+
+class TestDumps:
+    """Test suite for encoding.dumps."""
+
+    def test_compact_by_default(self, backend):
+        """Test the default output has no indentation or spaces."""
+        encoded = encoding.dumps(PAYLOAD)
+
+        assert "\n" not in encoded
+        assert ": " not in encoded
+        assert json.loads(encoded) == PAYLOAD
+
+    def test_pretty(self, backend):
+        """Test pretty output is indented by two spaces."""
+        encoded = encoding.dumps(PAYLOAD, pretty=True)
+
+        assert '\n  "success": true' in encoded
+        assert json.loads(encoded) == PAYLOAD
+
+    def test_non_string_keys(self, backend):
+        """Test integer dictionary keys are encoded as strings."""
+        assert json.loads(encoding.dumps({1: "a"})) == {"1": "a"}
+
+
+class TestResolveBackend:
+    """Test suite for encoder backend selection."""
+
+    def test_stdlib(self):
+        """Test stdlib is always available."""
+        assert encoding.resolve_backend("stdlib") == encoding.STDLIB
+
+    def test_auto_without_orjson(self):
+        """Test auto falls back to stdlib when orjson is missing."""
+        with patch.object(encoding, "orjson", None):
+            assert encoding.resolve_backend("auto") == encoding.STDLIB
+            assert encoding.resolve_backend("orjson") == encoding.STDLIB
+
+    def test_unknown(self):
+        """Test unknown backends are rejected."""
+        with pytest.raises(ValueError, match="Unknown JSON encoder"):
+            encoding.resolve_backend("ujson")
+
+
+async def test_tool_pretty_per_call(mock_async_falkordb_service):
+    """Test a tool call can ask for indented output."""
+    with patch(
+        'falkordb_mcp.server.get_async_service',
+        AsyncMock(return_value=mock_async_falkordb_service),
+    ):
+        compact = await list_graphs()
+        pretty = await list_graphs(pretty=True)
+
+    assert "\n" not in compact
+    assert "\n" in pretty
+    assert json.loads(compact)["graphs"] == json.loads(pretty)["graphs"]
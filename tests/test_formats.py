@@ -0,0 +1,150 @@
+"""Test suite for execute_query result formats."""
+
+import sys
+from pathlib import Path
+# Add src to path
+src_path = str(Path(__file__).parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+import json
+import pytest
+from unittest.mock import AsyncMock, patch
+from falkordb_mcp.formats import normalize_entities, shape_result, to_columnar
+from falkordb_mcp.service import _serialize_value
+from falkordb_mcp.server import execute_query
+
+
+def _result(rows, headers):
+    return {"result_set": rows, "headers": headers, "statistics": {"nodes_created": 0}}
+
+
+class TestToColumnar:
+    """Test suite for the columnar layout."""
+
+    def test_plain_columns(self):
+        """Test high-cardinality columns are returned as plain arrays."""
+        data = to_columnar(_result([[1, "Alice"], [2, "Bob"]], [[1, "id"], [1, "name"]]))
+
+        assert data["format"] == "columnar"
+        assert data["row_count"] == 2
+        assert data["columns"] == [
+            {"name": "id", "values": [1, 2]},
+            {"name": "name", "values": ["Alice", "Bob"]},
+        ]
+        assert data["statistics"] == {"nodes_created": 0}
+        assert "result_set" not in data
+
+    def test_run_length_encoding(self):
+        """Test sorted low-cardinality strings are run-length encoded."""
+        labels = ["Entity"] * 6 + ["Episodic"] * 4
+        data = to_columnar(_result([[label] for label in labels], ["label"]))
+
+        column = data["columns"][0]
+        assert column == {
+            "name": "label", "encoding": "rle", "values": ["Entity", "Episodic"], "runs": [6, 4],
+        }
+
+    def test_dictionary_encoding(self):
+        """Test unsorted low-cardinality strings are dictionary encoded."""
+        types = ["KNOWS", "LIKES", "KNOWS", "MENTIONS", "LIKES", "KNOWS", "KNOWS", "LIKES"]
+        data = to_columnar(_result([[t] for t in types], ["type"]))
+
+        column = data["columns"][0]
+        assert column["encoding"] == "dictionary"
+        assert [column["dictionary"][i] for i in column["indices"]] == types
+
+    def test_mixed_types_not_encoded(self):
+        """Test only string columns are encoded."""
+        data = to_columnar(_result([[1]] * 10, ["x"]))
+
+        assert data["columns"][0] == {"name": "x", "values": [1] * 10}
+
+    def test_empty_result(self):
+        """Test an empty result keeps its column names."""
+        data = to_columnar(_result([], [[1, "n"]]))
+
+        assert data["columns"] == [{"name": "n", "values": []}]
+        assert data["row_count"] == 0
+
+    def test_unknown_format(self):
+        """Test unknown formats are rejected."""
+        with pytest.raises(ValueError, match="Unknown result format"):
+            shape_result(_result([], []), "csv")
+
+
+class TestNormalizeEntities:
+    """Test suite for the node/edge deduplication tables."""
+
+    def test_repeated_entities_emitted_once(self, mock_node, mock_edge):
+        """Test each node and edge appears once in its table."""
+        rows = [_serialize_value([mock_node, mock_edge, i]) for i in range(50)]
+        plain = _result(rows, ["n", "r", "i"])
+
+        data = normalize_entities(plain)
+
+        assert list(data["nodes"]) == ["123"]
+        assert data["nodes"]["123"]["properties"]["name"] == "Alice"
+        assert data["edges"]["456"]["dest_node"] == 789
+        assert data["result_set"][7] == [
+            {"type": "node", "id": 123}, {"type": "edge", "id": 456}, 7,
+        ]
+        assert len(json.dumps(data)) * 3 < len(json.dumps(plain))
+
+    def test_nested_entities(self, mock_node):
+        """Test entities inside lists and maps are referenced too."""
+        data = normalize_entities(
+            _result([_serialize_value([[mock_node], {"owner": mock_node}])], ["p", "m"])
+        )
+
+        assert data["result_set"][0] == [
+            [{"type": "node", "id": 123}], {"owner": {"type": "node", "id": 123}},
+        ]
+        assert len(data["nodes"]) == 1
+
+    def test_deeply_nested_values(self, mock_node):
+        """Test nesting deeper than the recursion limit is walked without recursing."""
+        deep = node = _serialize_value(mock_node)
+        for _ in range(sys.getrecursionlimit() + 100):
+            deep = [deep]
+
+        data = normalize_entities(_result([[deep]], ["d"]))
+
+        inner = data["result_set"][0][0]
+        while isinstance(inner, list):
+            inner = inner[0]
+        assert inner == {"type": "node", "id": node["id"]}
+        assert list(data["nodes"]) == [str(node["id"])]
+
+    def test_user_maps_untouched(self):
+        """Test maps that only look partly like entities are kept as they are."""
+        row = [{"type": "node", "id": 1, "extra": True}]
+
+        data = normalize_entities(_result([row], ["m"]))
+
+        assert data["result_set"] == [row]
+        assert data["nodes"] == {}
+
+    def test_combined_with_columnar(self, mock_node):
+        """Test normalized rows can also be laid out as columns."""
+        data = shape_result(
+            _result([_serialize_value([mock_node])] * 3, ["n"]), "columnar", normalize=True
+        )
+
+        assert data["columns"][0]["values"] == [{"type": "node", "id": 123}] * 3
+        assert "123" in data["nodes"]
+
+
+async def test_execute_query_columnar(mock_async_falkordb_service):
+    """Test the tool returns columns when asked for the columnar format."""
+    with patch(
+        'falkordb_mcp.server.get_async_service',
+        AsyncMock(return_value=mock_async_falkordb_service),
+    ):
+        result = json.loads(
+            await execute_query("test_graph", "MATCH (n) RETURN n", format="columnar")
+        )
+
+    assert result["success"] is True
+    assert result["data"]["columns"][1] == {"name": "name", "values": ["Alice", "Bob", "Charlie"]}
+    assert result["data"]["row_count"] == 3
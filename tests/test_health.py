@@ -0,0 +1,159 @@
+"""Test suite for health probing and the status resource."""
+
+import sys
+from pathlib import Path
+# Add src to path
+src_path = str(Path(__file__).parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+import json
+from unittest.mock import AsyncMock, Mock, patch
+from falkordb_mcp import __version__
+from falkordb_mcp.health import (
+    CONNECTED,
+    DISCONNECTED,
+    UNKNOWN,
+    HealthProber,
+    module_version,
+    percentile,
+    replication,
+)
+from falkordb_mcp.server import get_server_status
+
+PRIMARY_INFO = {
+    "role": "master",
+    "redis_version": "7.4.2",
+    "used_memory": 1048576,
+    "connected_clients": 12,
+    "connected_slaves": 1,
+    "master_repl_offset": 5000,
+    "slave0": {"ip": "10.0.0.2", "port": 6379, "state": "online", "offset": 4200, "lag": 1},
+}
+
+
+def mock_connection(info=PRIMARY_INFO):
+    """Redis client mock answering the prober's commands."""
+    connection = Mock()
+    connection.ping = AsyncMock(return_value=True)
+    connection.info = AsyncMock(return_value=info)
+    connection.module_list = AsyncMock(return_value=[{"name": "graph", "ver": 41206}])
+    return connection
+
+
+class TestHealthHelpers:
+    """Test suite for the reading parsers."""
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        values = list(range(1, 101))
+
+        assert percentile(values, 0.5) == 50
+        assert percentile(values, 0.99) == 99
+        assert percentile([7], 0.99) == 7
+        assert percentile([], 0.5) is None
+
+    def test_module_version(self):
+        """Test the integer module version is formatted."""
+        assert module_version([{"name": "graph", "ver": 41206}]) == "4.12.6"
+        assert module_version([{"name": "search", "ver": 20000}]) is None
+
+    def test_primary_replication_lag(self):
+        """Test a primary reports each replica's lag and offset gap."""
+        assert replication(PRIMARY_INFO) == {
+            "role": "primary",
+            "replicas": [{
+                "address": "10.0.0.2:6379",
+                "state": "online",
+                "lag_s": 1,
+                "offset_lag": 800,
+            }],
+        }
+
+    def test_replica_replication_lag(self):
+        """Test a replica reports its link to the primary."""
+        info = {"role": "slave", "master_link_status": "up", "master_last_io_seconds_ago": 2}
+
+        assert replication(info)["lag_s"] == 2
+        assert replication(info)["role"] == "replica"
+
+
+class TestHealthProber:
+    """Test suite for HealthProber."""
+
+    async def test_probe_readings(self):
+        """Test a probe records latency, version, memory and clients."""
+        prober = HealthProber(interval=2, window=10)
+        assert prober.status()["status"] == UNKNOWN
+
+        await prober.probe(mock_connection())
+        await prober.probe(mock_connection())
+
+        status = prober.status()
+        assert status["status"] == CONNECTED
+        assert status["ping_ms"]["samples"] == 2
+        assert status["ping_ms"]["p99"] is not None
+        assert status["version"] == "4.12.6"
+        assert status["used_memory"] == 1048576
+        assert status["connected_clients"] == 12
+        assert status["replication"]["replicas"][0]["offset_lag"] == 800
+
+    async def test_ping_failure(self):
+        """Test a failed ping reports disconnected and keeps earlier readings."""
+        prober = HealthProber(interval=2, window=10)
+        connection = mock_connection()
+        await prober.probe(connection)
+        connection.ping.side_effect = ConnectionError("refused")
+
+        await prober.probe(connection)
+
+        status = prober.status()
+        assert status["status"] == DISCONNECTED
+        assert status["consecutive_failures"] == 1
+        assert status["last_error"] == "refused"
+        assert status["version"] == "4.12.6"
+
+    async def test_window_bounds_samples(self):
+        """Test only the most recent round-trip times are kept."""
+        prober = HealthProber(interval=2, window=3)
+        connection = mock_connection()
+        for _ in range(5):
+            await prober.probe(connection)
+
+        assert prober.status()["ping_ms"]["samples"] == 3
+
+
+class TestStatusResource:
+    """Test suite for health in falkordb://status."""
+
+    async def test_status_from_readings(self, mock_async_falkordb_service):
+        """Test the resource serves cached readings without contacting FalkorDB."""
+        connection = mock_async_falkordb_service.client.connection
+        await mock_async_falkordb_service.health.probe(mock_connection())
+        pings = connection.ping.await_count
+
+        with patch(
+            "falkordb_mcp.server.get_async_service",
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            status = json.loads(await get_server_status())
+
+        assert status["status"] == CONNECTED
+        assert status["health"]["version"] == "4.12.6"
+        assert status["version"] == __version__
+        assert connection.ping.await_count == pings
+
+    async def test_status_reports_probe_failure(self, mock_async_falkordb_service):
+        """Test a failing prober turns the status to disconnected."""
+        connection = mock_connection()
+        connection.ping.side_effect = ConnectionError("refused")
+        await mock_async_falkordb_service.health.probe(connection)
+
+        with patch(
+            "falkordb_mcp.server.get_async_service",
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            status = json.loads(await get_server_status())
+
+        assert status["status"] == DISCONNECTED
+        assert status["health"]["last_error"] == "refused"
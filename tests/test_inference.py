@@ -0,0 +1,246 @@
+"""Test suite for sampled schema inference."""
+
+import sys
+from pathlib import Path
+# Add src to path
+src_path = str(Path(__file__).parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+import json
+import random
+import pytest
+from unittest.mock import AsyncMock, patch
+from falkordb_mcp.inference import HyperLogLog, plan_probes, reservoir, value_type
+from falkordb_mcp.server import infer_schema
+from tests.fixtures.mock_data import create_mock_query_result, mock_metadata_pipeline
+
+
+def _scalar(value):
+    """Compact-encoded scalar for the probe replies."""
+    if value is None:
+        return [1, None]
+    if isinstance(value, str):
+        return [2, value]
+    if isinstance(value, bool):
+        return [4, "true" if value else "false"]
+    if isinstance(value, int):
+        return [3, value]
+    return [5, str(value)]
+
+
+def probe_reply(rows):
+    """Raw reply of one probe query from ``(id, properties)`` pairs."""
+    cells = []
+    for entity_id, properties in rows:
+        flat = []
+        for key, value in properties.items():
+            flat.extend([key, _scalar(value)])
+        cells.append([[3, entity_id], [10, flat]])
+    header = [[1, "id(e)"], [1, "properties(e)"]]
+    return [header, cells, ["Query internal execution time: 0.10 milliseconds"]]
+
+
+def async_graph(service):
+    """The fixture's shared graph with a params header builder."""
+    graph = service.client.select_graph("test_graph")
+    graph._build_params_header.side_effect = lambda params: f"CYPHER start={params['start']} "
+    return graph
+
+
+PEOPLE = [
+    (0, {"name": "Alice", "age": 30}),
+    (1, {"name": "Bob", "age": 30.5}),
+    (2, {"name": "Alice", "age": None}),
+]
+
+
+class TestSampling:
+    """Test suite for the sampling helpers."""
+
+    def test_hyperloglog_estimate(self):
+        """Test the sketch estimates cardinality within a few percent."""
+        sketch = HyperLogLog()
+        for value in range(5000):
+            sketch.add(value)
+            sketch.add(value)
+
+        assert abs(sketch.count() - 5000) < 5000 * 0.1
+
+    def test_reservoir_bounded(self):
+        """Test the reservoir keeps at most its size, without duplicates."""
+        sample = reservoir(range(1000), 50, random.Random(1))
+
+        assert len(sample) == 50
+        assert len(set(sample)) == 50
+        assert reservoir(range(3), 50, random.Random(1)) == [0, 1, 2]
+
+    def test_plan_probes(self):
+        """Test small populations are read whole and large ones stratified."""
+        assert plan_probes(10, 1000, 200, 8, random.Random(1)) == ([0], 10)
+
+        starts, limit = plan_probes(10000, 80000, 200, 8, random.Random(1))
+        assert len(starts) == 8
+        assert all(index * 10000 <= start < (index + 1) * 10000
+                   for index, start in enumerate(starts))
+        assert limit == 50
+
+    def test_value_types(self):
+        """Test serialized values map to schema type names."""
+        assert value_type(True, 8) == "boolean"
+        assert value_type([0.1] * 8, 8) == "vector"
+        assert value_type([1, 2], 8) == "list"
+        assert value_type({"latitude": 1.0, "longitude": 2.0}, 8) == "point"
+
+
+class TestInferSchema:
+    """Test suite for infer_schema on the async service."""
+
+    async def test_profiles(self, mock_async_falkordb_service):
+        """Test types, null rates and distinct estimates per label."""
+        graph = async_graph(mock_async_falkordb_service)
+        pipe = mock_metadata_pipeline(
+            graph, ["Person"], counts=[3], is_async=True, extra=[[probe_reply(PEOPLE)]]
+        )
+
+        schema = await mock_async_falkordb_service.infer_schema("test_graph")
+
+        person = schema["nodes"]["Person"]
+        assert person["count"] == 3
+        assert person["sampled"] == 3
+        assert person["properties"]["age"] == {
+            "types": {"integer": 1, "float": 1},
+            "null_rate": 0.3333,
+            "distinct_estimate": 2,
+        }
+        assert person["properties"]["name"]["distinct_estimate"] == 2
+        assert schema["cache_hit"] is False
+        probe = pipe.execute_command.call_args_list[-1].args
+        assert probe[2].startswith("CYPHER start=0 MATCH (e:`Person`)")
+
+    async def test_cached_then_refreshed(self, mock_async_falkordb_service):
+        """Test fresh results are served from cache and refresh samples again."""
+        graph = async_graph(mock_async_falkordb_service)
+        more = [(3, {"name": "Carol", "age": 41})]
+        pipe = mock_metadata_pipeline(
+            graph,
+            ["Person"],
+            counts=[4],
+            is_async=True,
+            extra=[[probe_reply(PEOPLE)], [probe_reply(PEOPLE + more)]],
+        )
+
+        await mock_async_falkordb_service.infer_schema("test_graph")
+        cached = await mock_async_falkordb_service.infer_schema("test_graph")
+        assert cached["cache_hit"] is True
+        assert pipe.execute.await_count == 3
+
+        refreshed = await mock_async_falkordb_service.infer_schema("test_graph", refresh=True)
+
+        assert refreshed["refreshes"] == 2
+        assert refreshed["nodes"]["Person"]["sampled"] == 4
+        assert refreshed["nodes"]["Person"]["properties"]["name"]["distinct_estimate"] == 3
+        assert mock_async_falkordb_service.inference.stats()["refreshes"] == 1
+
+    async def test_refresh_bounded_by_sample_size(self, mock_async_falkordb_service):
+        """Test refreshing over the same entities does not grow the profile."""
+        graph = async_graph(mock_async_falkordb_service)
+        mock_metadata_pipeline(
+            graph,
+            ["Person"],
+            counts=[3],
+            is_async=True,
+            extra=[[probe_reply(PEOPLE)], [probe_reply(PEOPLE)], [probe_reply(PEOPLE)]],
+        )
+
+        first = await mock_async_falkordb_service.infer_schema("test_graph", sample_size=3)
+        for _ in range(2):
+            again = await mock_async_falkordb_service.infer_schema(
+                "test_graph", sample_size=3, refresh=True
+            )
+
+        assert again["refreshes"] == 3
+        assert again["nodes"]["Person"] == first["nodes"]["Person"]
+        assert again["nodes"]["Person"]["sampled"] == 3
+
+    async def test_probes_bounded_by_total_nodes(self, mock_async_falkordb_service):
+        """Test nodes with several labels do not stretch the probed id range."""
+        graph = async_graph(mock_async_falkordb_service)
+        # Every node carries both labels: 16 nodes, counted 16 times per label
+        pipe = mock_metadata_pipeline(
+            graph,
+            ["A", "B"],
+            counts=[16, 16],
+            totals=(16, 0),
+            is_async=True,
+            extra=[[probe_reply([])] * 16],
+        )
+
+        await mock_async_falkordb_service.infer_schema("test_graph", sample_size=2)
+
+        starts = [
+            int(call.args[2].split()[1].removeprefix("start="))
+            for call in pipe.execute_command.call_args_list
+            if call.args[2].startswith("CYPHER start=")
+        ]
+        assert len(starts) == 16
+        assert max(starts) < 16
+
+    async def test_schema_write_rebuilds(self, mock_async_falkordb_service):
+        """Test a write adding labels discards the cached profiles."""
+        graph = async_graph(mock_async_falkordb_service)
+        mock_metadata_pipeline(graph, ["Person"], counts=[3], is_async=True,
+                               extra=[[probe_reply(PEOPLE)]])
+        await mock_async_falkordb_service.infer_schema("test_graph")
+
+        graph.query.return_value = create_mock_query_result([], labels_added=1)
+        await mock_async_falkordb_service.execute_query("test_graph", "CREATE (:City)")
+        mock_metadata_pipeline(graph, ["City"], counts=[1], is_async=True,
+                               extra=[[probe_reply([(9, {"name": "Oslo"})])]])
+
+        schema = await mock_async_falkordb_service.infer_schema("test_graph")
+
+        assert list(schema["nodes"]) == ["City"]
+        assert schema["refreshes"] == 1
+        assert mock_async_falkordb_service.inference.stats()["rebuilds"] == 2
+
+    async def test_data_write_refreshes(self, mock_async_falkordb_service):
+        """Test a write keeping labels rebuilds the profiles from a new sample."""
+        graph = async_graph(mock_async_falkordb_service)
+        mock_metadata_pipeline(graph, ["Person"], counts=[3], is_async=True,
+                               extra=[[probe_reply(PEOPLE)]])
+        await mock_async_falkordb_service.infer_schema("test_graph")
+
+        graph.query.return_value = create_mock_query_result([], nodes_created=1)
+        await mock_async_falkordb_service.execute_query("test_graph", "CREATE (:Person)")
+        more = [(3, {"name": "Carol", "age": 41})]
+        mock_metadata_pipeline(graph, ["Person"], counts=[4], is_async=True,
+                               extra=[[probe_reply(PEOPLE + more)]])
+
+        schema = await mock_async_falkordb_service.infer_schema("test_graph")
+
+        assert schema["cache_hit"] is False
+        assert schema["refreshes"] == 2
+        assert schema["nodes"]["Person"]["sampled"] == 4
+        stats = mock_async_falkordb_service.inference.stats()
+        assert (stats["rebuilds"], stats["refreshes"]) == (1, 1)
+
+    async def test_invalid_sample_size(self, mock_async_falkordb_service):
+        """Test a non-positive sample size is rejected."""
+        with pytest.raises(ValueError):
+            await mock_async_falkordb_service.infer_schema("test_graph", sample_size=0)
+
+    async def test_tool(self, mock_async_falkordb_service):
+        """Test the MCP tool wraps the inferred schema."""
+        graph = async_graph(mock_async_falkordb_service)
+        mock_metadata_pipeline(graph, ["Person"], counts=[3], is_async=True,
+                               extra=[[probe_reply(PEOPLE)]])
+
+        with patch(
+            "falkordb_mcp.server.get_async_service",
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            result = json.loads(await infer_schema("test_graph"))
+
+        assert result["success"] is True
+        assert result["schema"]["nodes"]["Person"]["sampled"] == 3
@@ -0,0 +1,123 @@
+"""Test suite for pipelined graph metadata and the schema cache."""
+
+import sys
+from pathlib import Path
+# Add src to path
+src_path = str(Path(__file__).parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+import pytest
+from unittest.mock import patch
+from falkordb_mcp.cache import SchemaCache
+from falkordb_mcp.metadata import changes_schema, changes_structure, count_queries
+from tests.fixtures.mock_data import create_mock_query_result, mock_metadata_pipeline
+
+
+class TestMetadataQueries:
+    """Test suite for the metadata query helpers."""
+
+    def test_count_queries_quote_names(self):
+        """Test labels and types are backtick-quoted, escaping backticks."""
+        assert count_queries(["Person", "odd`name"], ["KNOWS"]) == [
+            "MATCH (n:`Person`) RETURN count(n)",
+            "MATCH (n:`odd``name`) RETURN count(n)",
+            "MATCH ()-[r:`KNOWS`]->() RETURN count(r)",
+            "MATCH (n) RETURN count(n)",
+            "MATCH ()-[r]->() RETURN count(r)",
+        ]
+
+    def test_changes_schema(self):
+        """Test property removals alone leave metadata valid."""
+        assert changes_schema({"labels_added": 1})
+        assert changes_schema({"nodes_created": 2})
+        assert not changes_schema({"properties_removed": 3})
+
+    def test_changes_structure(self):
+        """Test only label and index changes count as structural."""
+        assert changes_structure({"labels_added": 1})
+        assert changes_structure({"indices_deleted": 1})
+        assert not changes_structure({"nodes_created": 2, "properties_set": 4})
+
+
+class TestSchemaCache:
+    """Test suite for SchemaCache."""
+
+    def test_ttl_expiry(self):
+        """Test entries expire after the TTL."""
+        cache = SchemaCache(ttl=5)
+        cache.put("g", {"labels": []}, cache.generation("g"))
+
+        with patch("falkordb_mcp.cache.time.monotonic", return_value=1e12):
+            assert cache.get("g") is None
+
+    def test_stale_put_dropped(self):
+        """Test metadata fetched across an invalidation is not cached."""
+        cache = SchemaCache(ttl=60)
+        generation = cache.generation("g")
+        cache.invalidate("g")
+        cache.put("g", {"labels": []}, generation)
+
+        assert cache.get("g") is None
+
+
+class TestGetGraphMetadata:
+    """Test suite for get_graph_metadata on the services."""
+
+    def test_two_round_trips(self, mock_falkordb_service):
+        """Test schema and counts come from two pipelines."""
+        mock_graph = mock_falkordb_service.client.select_graph("test_graph")
+        pipe = mock_metadata_pipeline(
+            mock_graph, ["Person"], ["KNOWS"], ["name", "age"], counts=[10, 25]
+        )
+
+        metadata = mock_falkordb_service.get_graph_metadata("test_graph")
+
+        assert pipe.execute.call_count == 2
+        assert mock_graph.ro_query.call_count == 0
+        assert metadata["relationship_types"] == ["KNOWS"]
+        assert metadata["property_keys"] == ["name", "age"]
+        assert metadata["node_counts"] == {"Person": 10}
+        assert metadata["relationship_counts"] == {"KNOWS": 25}
+        assert (metadata["node_count"], metadata["relationship_count"]) == (10, 25)
+        assert metadata["indexes"] == []
+        assert metadata["cache_hit"] is False
+
+    def test_cached_until_schema_write(self, mock_falkordb_service):
+        """Test metadata is served from cache until a write changes the graph."""
+        mock_graph = mock_falkordb_service.client.select_graph("test_graph")
+        pipe = mock_metadata_pipeline(mock_graph, ["Person"], counts=[1])
+
+        mock_falkordb_service.get_graph_metadata("test_graph")
+        again = mock_falkordb_service.get_graph_metadata("test_graph")
+        assert again["cache_hit"] is True
+        assert pipe.execute.call_count == 2
+
+        mock_graph.query.return_value = create_mock_query_result([], labels_added=1)
+        mock_falkordb_service.execute_query("test_graph", "CREATE (:City)")
+
+        assert mock_falkordb_service.schema.get("test_graph") is None
+
+    async def test_async_cached(self, mock_async_falkordb_service):
+        """Test the async service pipelines once and then serves the cache."""
+        mock_graph = mock_async_falkordb_service.client.select_graph("test_graph")
+        pipe = mock_metadata_pipeline(mock_graph, ["Person"], counts=[7], is_async=True)
+
+        first = await mock_async_falkordb_service.get_graph_metadata("test_graph")
+        second = await mock_async_falkordb_service.get_graph_metadata("test_graph")
+
+        assert first["node_counts"] == {"Person": 7}
+        assert second["cache_hit"] is True
+        assert pipe.execute.await_count == 2
+
+    async def test_pipeline_error_raised(self, mock_async_falkordb_service):
+        """Test a failing procedure fails the call instead of caching partial metadata."""
+        from redis.exceptions import ResponseError
+
+        mock_graph = mock_async_falkordb_service.client.select_graph("test_graph")
+        pipe = mock_metadata_pipeline(mock_graph, [], is_async=True)
+        pipe.execute.side_effect = [[ResponseError("Invalid graph operation")] * 4]
+
+        with pytest.raises(ResponseError):
+            await mock_async_falkordb_service.get_graph_metadata("test_graph")
+        assert mock_async_falkordb_service.schema.get("test_graph") is None
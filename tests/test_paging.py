@@ -0,0 +1,254 @@
+"""Test suite for result budgets and continuation tokens."""
+
+import sys
+from pathlib import Path
+# Add src to path
+src_path = str(Path(__file__).parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+import json
+import pytest
+from unittest.mock import AsyncMock, patch
+from falkordb_mcp.paging import (
+    InvalidContinuationError,
+    decode_token,
+    encode_token,
+    pageable,
+    paged_query,
+    plan_page,
+)
+from falkordb_mcp.server import execute_query
+from tests.fixtures.mock_data import create_mock_query_result
+
+
+class TestPageable:
+    """Test suite for deciding when SKIP/LIMIT can be appended."""
+
+    @pytest.mark.parametrize("query", [
+        "MATCH (n) RETURN n",
+        "MATCH (n) RETURN n ORDER BY n.name",
+        "MATCH (n) WITH n LIMIT 5 RETURN n",
+        "MATCH (n) WHERE n.note = 'LIMIT 3' RETURN n",
+    ])
+    def test_pageable(self, query):
+        """Test queries ending in a plain RETURN are pageable."""
+        assert pageable(query)
+
+    @pytest.mark.parametrize("query", [
+        "MATCH (n) RETURN n LIMIT 5",
+        "MATCH (n) RETURN n SKIP 5",
+        "RETURN 1 UNION RETURN 2",
+        "CALL db.labels()",
+    ])
+    def test_not_pageable(self, query):
+        """Test queries with their own paging, unions and calls are left alone."""
+        assert not pageable(query)
+
+    def test_paged_query(self):
+        """Test trailing comments and semicolons are dropped before the clauses."""
+        assert paged_query("MATCH (n) RETURN n // all", 0, 11) == "MATCH (n) RETURN n\nLIMIT 11"
+        assert paged_query("MATCH (n) RETURN n; // done", 0, 11) == "MATCH (n) RETURN n\nLIMIT 11"
+        assert paged_query("MATCH (n) RETURN '//x' /* c */ ;", 0, 11) == (
+            "MATCH (n) RETURN '//x'\nLIMIT 11"
+        )
+        assert paged_query("MATCH (n) RETURN n;", 20, 11) == "MATCH (n) RETURN n\nSKIP 20 LIMIT 11"
+
+
+class TestContinuationToken:
+    """Test suite for continuation tokens."""
+
+    def test_round_trip(self):
+        """Test a token decodes to its offset for the same query."""
+        token = encode_token("g", "MATCH (n) RETURN n", {"a": 1}, 100)
+
+        assert decode_token(token, "g", "MATCH (n)\n RETURN n", {"a": 1}) == 100
+
+    @pytest.mark.parametrize("graph,query,params", [
+        ("other", "MATCH (n) RETURN n", {"a": 1}),
+        ("g", "MATCH (m) RETURN m", {"a": 1}),
+        ("g", "MATCH (n) RETURN n", {"a": 2}),
+    ])
+    def test_rejects_other_query(self, graph, query, params):
+        """Test a token cannot be replayed against another query."""
+        token = encode_token("g", "MATCH (n) RETURN n", {"a": 1}, 100)
+
+        with pytest.raises(InvalidContinuationError):
+            decode_token(token, graph, query, params)
+
+    @pytest.mark.parametrize("token", ["not-a-token!", "e30", ""])
+    def test_rejects_malformed(self, token):
+        """Test garbage tokens raise InvalidContinuationError."""
+        with pytest.raises(InvalidContinuationError):
+            decode_token(token, "g", "RETURN 1", None)
+
+    def test_write_rejects_token(self):
+        """Test writes cannot be continued."""
+        token = encode_token("g", "CREATE (n)", None, 10)
+
+        with pytest.raises(InvalidContinuationError):
+            plan_page("g", "CREATE (n)", None, False, continuation=token)
+
+    def test_plan_defaults(self):
+        """Test budgets default to the config and pageable reads page server side."""
+        with patch("falkordb_mcp.paging.config") as mock_config:
+            mock_config.result_max_rows = 50
+            mock_config.result_max_bytes = 1024
+            mock_config.vector_policy = "drop"
+            page = plan_page("g", "MATCH (n) RETURN n", None, True)
+
+        assert (page.offset, page.max_rows, page.max_bytes) == (0, 50, 1024)
+        assert page.server_side
+        assert page.vectors == "drop"
+        with pytest.raises(ValueError, match="Unknown vector policy"):
+            plan_page("g", "MATCH (n) RETURN n", None, True, vectors="zip")
+        assert not plan_page("g", "MATCH (n) RETURN n", None, True, max_rows=0).server_side
+
+
+class TestBudgets:
+    """Test suite for truncating results in execute_query."""
+
+    def test_server_side_paging(self, mock_falkordb_service):
+        """Test pageable reads fetch one row past the budget and continue at the offset."""
+        mock_graph = mock_falkordb_service.client.select_graph("g")
+        mock_graph.ro_query.return_value = create_mock_query_result([[i] for i in range(4)])
+
+        first = mock_falkordb_service.execute_query("g", "MATCH (n) RETURN n.v", max_rows=3)
+
+        mock_graph.ro_query.assert_called_with("MATCH (n) RETURN n.v\nLIMIT 4", {})
+        assert first["result_set"] == [[0], [1], [2]]
+        assert first["truncated"] is True
+
+        mock_graph.ro_query.return_value = create_mock_query_result([[3]])
+        second = mock_falkordb_service.execute_query(
+            "g", "MATCH (n) RETURN n.v", max_rows=3, continuation=first["continuation"]
+        )
+
+        mock_graph.ro_query.assert_called_with("MATCH (n) RETURN n.v\nSKIP 3 LIMIT 4", {})
+        assert second["result_set"] == [[3]]
+        assert second["truncated"] is False
+        assert second["continuation"] is None
+
+    def test_client_side_paging(self, mock_falkordb_service):
+        """Test queries that cannot be rewritten are paged on the client."""
+        query = "MATCH (n) RETURN n.v LIMIT 100"
+        mock_graph = mock_falkordb_service.client.select_graph("g")
+        mock_graph.ro_query.return_value = create_mock_query_result([[i] for i in range(5)])
+
+        first = mock_falkordb_service.execute_query("g", query, max_rows=2)
+        second = mock_falkordb_service.execute_query(
+            "g", query, max_rows=2, continuation=first["continuation"]
+        )
+
+        mock_graph.ro_query.assert_called_with(query, {})
+        assert first["result_set"] == [[0], [1]]
+        assert second["result_set"] == [[2], [3]]
+        assert second["truncated"] is True
+
+    def test_byte_budget(self, mock_falkordb_service):
+        """Test the size budget cuts rows but always keeps the first."""
+        mock_graph = mock_falkordb_service.client.select_graph("g")
+        mock_graph.ro_query.return_value = create_mock_query_result([["x" * 100]] * 10)
+
+        result = mock_falkordb_service.execute_query(
+            "g", "MATCH (n) RETURN n.s", max_rows=0, max_bytes=250
+        )
+        tiny = mock_falkordb_service.execute_query(
+            "g", "MATCH (n) RETURN n.s", max_rows=0, max_bytes=1
+        )
+
+        assert len(result["result_set"]) == 2
+        assert result["truncated"] is True
+        assert len(tiny["result_set"]) == 1
+
+    def test_unlimited(self, mock_falkordb_service):
+        """Test zero budgets return every row and leave the query alone."""
+        mock_graph = mock_falkordb_service.client.select_graph("g")
+        mock_graph.ro_query.return_value = create_mock_query_result([[i] for i in range(50)])
+
+        result = mock_falkordb_service.execute_query(
+            "g", "MATCH (n) RETURN n.v", max_rows=0, max_bytes=0
+        )
+
+        mock_graph.ro_query.assert_called_with("MATCH (n) RETURN n.v", {})
+        assert len(result["result_set"]) == 50
+        assert result["truncated"] is False
+
+    def test_write_not_truncated(self, mock_falkordb_service):
+        """Test write results ignore the budgets, since their rows cannot be fetched again."""
+        mock_graph = mock_falkordb_service.client.select_graph("g")
+        mock_graph.query.return_value = create_mock_query_result(
+            [[i] for i in range(5)], nodes_created=5
+        )
+
+        result = mock_falkordb_service.execute_query(
+            "g", "UNWIND range(0, 4) AS i CREATE (n {v: i}) RETURN i", max_rows=2, max_bytes=4
+        )
+
+        assert result["result_set"] == [[i] for i in range(5)]
+        assert result["truncated"] is False
+        assert result["continuation"] is None
+
+    async def test_async_write_not_truncated(self, mock_async_falkordb_service):
+        """Test the async service returns every row of a write."""
+        mock_graph = mock_async_falkordb_service.client.select_graph("g")
+        mock_graph.query.return_value = create_mock_query_result(
+            [[i] for i in range(5)], nodes_created=5
+        )
+
+        result = await mock_async_falkordb_service.execute_query(
+            "g", "UNWIND range(0, 4) AS i MERGE (n {v: i}) RETURN i", max_rows=2
+        )
+
+        assert len(result["result_set"]) == 5
+        assert result["truncated"] is False
+
+    async def test_async_pages_cached_separately(self, mock_async_falkordb_service):
+        """Test each page has its own cache entry."""
+        mock_graph = mock_async_falkordb_service.client.select_graph("g")
+        mock_graph.ro_query.return_value = create_mock_query_result([[i] for i in range(3)])
+
+        service = mock_async_falkordb_service
+        first = await service.execute_query("g", "MATCH (n) RETURN n", max_rows=2)
+        again = await service.execute_query("g", "MATCH (n) RETURN n", max_rows=2)
+        await service.execute_query(
+            "g", "MATCH (n) RETURN n", max_rows=2, continuation=first["continuation"]
+        )
+
+        assert again["timings"]["result_cache_hit"] is True
+        assert again["continuation"] == first["continuation"]
+        assert mock_graph.ro_query.await_count == 2
+
+
+class TestExecuteQueryTool:
+    """Test suite for budgets on the MCP tool."""
+
+    async def test_invalid_token(self, mock_async_falkordb_service):
+        """Test a bad token is reported as a failed call."""
+        with patch(
+            "falkordb_mcp.server.get_async_service",
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            result = json.loads(await execute_query(
+                "g", "MATCH (n) RETURN n", continuation="bogus"
+            ))
+
+        assert result["success"] is False
+        assert "continuation" in result["error"].lower()
+
+    async def test_columnar_keeps_continuation(self, mock_async_falkordb_service):
+        """Test truncation fields survive result shaping."""
+        mock_graph = mock_async_falkordb_service.client.select_graph("g")
+        mock_graph.ro_query.return_value = create_mock_query_result([[i] for i in range(3)], ["v"])
+
+        with patch(
+            "falkordb_mcp.server.get_async_service",
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            result = json.loads(await execute_query(
+                "g", "MATCH (n) RETURN n.v AS v", max_rows=2, format="columnar"
+            ))
+
+        assert result["data"]["row_count"] == 2
+        assert result["data"]["truncated"] is True
+        assert result["data"]["continuation"]
@@ -0,0 +1,161 @@
+"""Test suite for the fair connection pool."""
+
+import sys
+from pathlib import Path
+# Add src to path
+src_path = str(Path(__file__).parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, patch
+from redis.asyncio import BlockingConnectionPool
+from redis.exceptions import ConnectionError as RedisConnectionError
+from falkordb_mcp.pool import FairConnectionPool, IdleConnectionPool, PoolTimeoutError
+from falkordb_mcp.server import get_server_status
+
+
+class TestFairConnectionPool:
+    """Test suite for FairConnectionPool."""
+
+    async def test_acquire_within_capacity(self):
+        """Test slots are granted immediately while the pool has capacity."""
+        pool = FairConnectionPool(max_size=2, max_per_graph=2, acquire_timeout=1)
+
+        await pool.acquire("g1")
+        await pool.acquire("g2")
+
+        stats = pool.stats()
+        assert stats["in_use"] == 2
+        assert stats["utilization"] == 1.0
+        assert stats["in_use_by_graph"] == {"g1": 1, "g2": 1}
+
+    async def test_acquire_timeout(self):
+        """Test acquire fails with PoolTimeoutError when the pool stays full."""
+        pool = FairConnectionPool(max_size=1, max_per_graph=1, acquire_timeout=0.01)
+        await pool.acquire("g1")
+
+        with pytest.raises(PoolTimeoutError):
+            await pool.acquire("g1")
+
+        stats = pool.stats()
+        assert stats["timeouts_total"] == 1
+        assert stats["waiting"] == 0
+        assert stats["in_use"] == 1
+
+    async def test_release_wakes_waiter(self):
+        """Test releasing a slot hands it to a queued caller."""
+        pool = FairConnectionPool(max_size=1, max_per_graph=1, acquire_timeout=1)
+        await pool.acquire("g1")
+
+        waiter = asyncio.create_task(pool.acquire("g1"))
+        await asyncio.sleep(0)
+        assert pool.waiting == 1
+
+        pool.release("g1")
+        await waiter
+        assert pool.stats()["in_use"] == 1
+
+    async def test_round_robin_across_graphs(self):
+        """Test a hot graph's backlog does not starve another graph."""
+        pool = FairConnectionPool(max_size=1, max_per_graph=1, acquire_timeout=1)
+        order = []
+
+        async def call(graph_name):
+            async with pool.lease(graph_name):
+                order.append(graph_name)
+                await asyncio.sleep(0)
+
+        await pool.acquire("hot")
+        tasks = [asyncio.create_task(call("hot")) for _ in range(3)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(call("cold")))
+        await asyncio.sleep(0)
+
+        pool.release("hot")
+        await asyncio.gather(*tasks)
+
+        assert order.index("cold") == 1
+
+    async def test_per_graph_cap(self):
+        """Test one graph cannot hold every connection."""
+        pool = FairConnectionPool(max_size=4, max_per_graph=0, acquire_timeout=0.01)
+        assert pool.max_per_graph == 3
+
+        for _ in range(3):
+            await pool.acquire("hot")
+        with pytest.raises(PoolTimeoutError):
+            await pool.acquire("hot")
+
+        # The reserved slot is still available to another graph
+        await pool.acquire("cold")
+        assert pool.stats()["in_use"] == 4
+
+
+class TestIdleConnectionPool:
+    """Test suite for the redis connection pool."""
+
+    async def test_exhaustion_is_pool_timeout(self):
+        """Test waiting out the pool timeout is not reported as a connection error."""
+        async def exhausted(*args, **kwargs):
+            raise RedisConnectionError("No connection available.") from asyncio.TimeoutError()
+
+        async def refused(*args, **kwargs):
+            raise RedisConnectionError("Connection refused")
+
+        pool = IdleConnectionPool(max_connections=1, timeout=0.01)
+        with patch.object(BlockingConnectionPool, "get_connection", exhausted):
+            with pytest.raises(PoolTimeoutError):
+                await pool.get_connection()
+        with patch.object(BlockingConnectionPool, "get_connection", refused):
+            with pytest.raises(RedisConnectionError):
+                await pool.get_connection()
+
+
+class TestPoolIntegration:
+    """Test pool usage from the async service and status resource."""
+
+    async def test_execute_query_releases_slot(self, mock_async_falkordb_service):
+        """Test execute_query returns its slot even when the query fails."""
+        mock_graph = mock_async_falkordb_service.client.select_graph("test_graph")
+        mock_graph.query.side_effect = Exception("boom")
+
+        with pytest.raises(Exception, match="boom"):
+            await mock_async_falkordb_service.execute_query("test_graph", "RETURN 1")
+
+        stats = mock_async_falkordb_service.pool_stats()
+        assert stats["in_use"] == 0
+        assert stats["acquired_total"] == 1
+
+    async def test_status_reports_pool(self, mock_async_falkordb_service):
+        """Test falkordb://status includes pool utilization."""
+        with patch(
+            'falkordb_mcp.server.get_async_service',
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            status = json.loads(await get_server_status())
+
+        assert status["status"] == "connected"
+        assert status["pool"]["max_size"] == 16
+        assert status["pool"]["in_use"] == 0
+        assert "open_connections" in status["pool"]
+
+    async def test_background_connections_reserved(self, mock_async_falkordb_service):
+        """Test the prober's connection is added on top of the pool's max size."""
+        connection_pool = mock_async_falkordb_service._connection_pool
+
+        assert connection_pool.max_connections == mock_async_falkordb_service.pool.max_size + 1
+        assert mock_async_falkordb_service.pool_stats()["reserved_connections"] == 1
+
+    async def test_status_reports_disconnected(self):
+        """Test falkordb://status reports connection failures."""
+        with patch(
+            'falkordb_mcp.server.get_async_service',
+            AsyncMock(side_effect=ConnectionError("refused")),
+        ):
+            status = json.loads(await get_server_status())
+
+        assert status["status"] == "disconnected"
+        assert "refused" in status["error"]
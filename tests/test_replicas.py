@@ -0,0 +1,182 @@
+"""Test suite for read-replica routing."""
+
+import sys
+from pathlib import Path
+# Add src to path
+src_path = str(Path(__file__).parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from redis.exceptions import ConnectionError as RedisConnectionError
+from falkordb_mcp.config import _parse_endpoints, config
+from falkordb_mcp.pool import PoolTimeoutError
+from falkordb_mcp.replicas import Replica, ReplicaRouter
+from tests.fixtures.mock_data import mock_metadata_pipeline
+
+
+def make_replica(host, rtt=0.0):
+    """Build a Replica whose client pings with the given delay."""
+    with patch('falkordb_mcp.replicas.FalkorDB') as mock_fdb:
+        client = Mock()
+
+        async def ping():
+            await asyncio.sleep(rtt)
+            return True
+
+        client.connection.ping = AsyncMock(side_effect=ping)
+        mock_fdb.return_value = client
+        return Replica(host, 6379, Mock(disconnect=AsyncMock()), graph_cache_size=8)
+
+
+class TestReplicaRouter:
+    """Test suite for ReplicaRouter balancing and health checks."""
+
+    def test_parse_endpoints(self):
+        """Test FALKORDB_REPLICAS parsing with and without ports."""
+        assert _parse_endpoints("r1:6380, r2", 6379) == [("r1", 6380), ("r2", 6379)]
+        assert _parse_endpoints("", 6379) == []
+
+    def test_round_robin(self):
+        """Test round-robin cycles through healthy replicas."""
+        router = ReplicaRouter([make_replica("r1"), make_replica("r2")])
+
+        picks = [router.choose().host for _ in range(4)]
+
+        assert picks == ["r1", "r2", "r1", "r2"]
+
+    def test_least_outstanding(self):
+        """Test least-outstanding picks the least loaded replica."""
+        busy, idle = make_replica("busy"), make_replica("idle")
+        busy.outstanding = 3
+        router = ReplicaRouter([busy, idle], strategy="least_outstanding")
+
+        assert all(router.choose() is idle for _ in range(3))
+
+    def test_unknown_strategy(self):
+        """Test an unknown strategy is rejected."""
+        with pytest.raises(ValueError):
+            ReplicaRouter([], strategy="random")
+
+    def test_no_healthy_replica_uses_primary(self):
+        """Test choose returns None when every replica is down."""
+        replica = make_replica("r1")
+        replica.healthy = False
+
+        assert ReplicaRouter([replica]).choose() is None
+
+    async def test_health_check_pulls_slow_and_dead_replicas(self):
+        """Test slow or failing replicas leave the rotation and come back."""
+        fast, dead = make_replica("fast"), make_replica("dead")
+        slow = make_replica("slow", rtt=0.05)
+        dead.client.connection.ping.side_effect = RedisConnectionError("refused")
+        router = ReplicaRouter([fast, slow, dead], max_latency_ms=20)
+
+        await router.check_all()
+
+        assert fast.healthy is True
+        assert slow.healthy is False
+        assert dead.healthy is False
+        assert router.stats()["healthy"] == 1
+
+        dead.client.connection.ping.side_effect = None
+        await router.check(dead)
+        assert dead.healthy is True
+
+
+class TestServiceReplicaRouting:
+    """Test suite for replica routing in AsyncFalkorDBService."""
+
+    @pytest.fixture
+    async def service_with_replica(self, mock_async_falkordb_service, mock_query_result):
+        """Async service with one healthy replica attached."""
+        replica = make_replica("r1")
+        replica_graph = Mock()
+        replica_graph.ro_query = AsyncMock(return_value=mock_query_result)
+        replica.client.select_graph.return_value = replica_graph
+        replica.client.list_graphs = AsyncMock(return_value=["graph1"])
+        mock_async_falkordb_service.replicas.replicas = [replica]
+        yield mock_async_falkordb_service, replica, replica_graph
+
+    async def test_reads_go_to_replica(self, service_with_replica):
+        """Test read-only queries, metadata and list_graphs use the replica."""
+        service, replica, replica_graph = service_with_replica
+        primary_graph = service.client.select_graph("test_graph")
+        pipe = mock_metadata_pipeline(replica_graph, ["Entity"], counts=[1], is_async=True)
+
+        await service.execute_query("test_graph", "MATCH (n) RETURN n")
+        await service.get_graph_metadata("test_graph")
+        assert await service.list_graphs() == ["graph1"]
+
+        assert replica_graph.ro_query.await_count == 1
+        assert pipe.execute.await_count == 2
+        primary_graph.query.assert_not_called()
+        assert replica.requests_total == 3
+
+    async def test_writes_go_to_primary(self, service_with_replica):
+        """Test writes never touch a replica."""
+        service, replica, replica_graph = service_with_replica
+        primary_graph = service.client.select_graph("test_graph")
+
+        await service.execute_query("test_graph", "CREATE (n:Person)")
+
+        primary_graph.query.assert_awaited_once()
+        replica_graph.ro_query.assert_not_called()
+
+    async def test_replica_failure_falls_back_to_primary(self, service_with_replica):
+        """Test a connection error pulls the replica and retries on the primary."""
+        service, replica, replica_graph = service_with_replica
+        replica_graph.ro_query.side_effect = RedisConnectionError("replica down")
+
+        result = await service.execute_query("test_graph", "MATCH (n) RETURN n")
+
+        assert result["result_set"][0] == [1, "Alice", 30]
+        assert replica.healthy is False
+        service.client.select_graph("test_graph").query.assert_awaited_once()
+
+    async def test_replica_reads_hold_lease(self, service_with_replica, mock_query_result):
+        """Test replica reads count against the fair pool like primary reads."""
+        service, replica, replica_graph = service_with_replica
+        in_use = []
+
+        async def read(*args, **kwargs):
+            in_use.append(service.pool_stats()["in_use"])
+            return mock_query_result
+
+        replica_graph.ro_query.side_effect = read
+        await service.execute_query("test_graph", "MATCH (n) RETURN n")
+
+        assert in_use == [1]
+        assert service.pool_stats()["in_use"] == 0
+
+    async def test_replica_pool_exhaustion_not_a_fault(self, service_with_replica):
+        """Test running out of replica connections keeps the replica in rotation."""
+        service, replica, replica_graph = service_with_replica
+        replica_graph.ro_query.side_effect = PoolTimeoutError("No connection available")
+
+        with pytest.raises(PoolTimeoutError):
+            await service.execute_query("test_graph", "MATCH (n) RETURN n")
+
+        assert replica.healthy is True
+        service.client.select_graph("test_graph").query.assert_not_called()
+
+    async def test_replicas_configured_at_initialize(self):
+        """Test configured replica endpoints are health-checked at startup."""
+        from falkordb_mcp.async_service import AsyncFalkorDBService
+
+        with patch.object(config, "replicas", [("r1", 6380)]), \
+                patch('falkordb_mcp.async_service.FalkorDB') as mock_fdb, \
+                patch('falkordb_mcp.replicas.FalkorDB') as mock_replica_fdb:
+            mock_fdb.return_value.connection.ping = AsyncMock(return_value=True)
+            mock_fdb.return_value.connection.aclose = AsyncMock()
+            mock_replica_fdb.return_value.connection.ping = AsyncMock(return_value=True)
+
+            service = AsyncFalkorDBService()
+            await service.initialize()
+
+            assert [r.address for r in service.replicas.replicas] == ["r1:6380"]
+            assert service.replicas.replicas[0].healthy is True
+            assert service.replicas.replicas[0].last_rtt_ms is not None
+            await service.close()
@@ -166,3 +166,44 @@ class TestSerializeValue:
         # Verify JSON compatibility
         json_str = json.dumps(result)
         assert json_str is not None
+
+    def test_serialize_deep_nesting(self):
+        """Test deeply nested values do not hit the recursion limit."""
+        value = leaf = []
+        for _ in range(sys.getrecursionlimit() * 2):
+            child = [{"depth": [None]}]
+            leaf.append(child)
+            leaf = child
+
+        result = _serialize_value(value)
+
+        level, depth = result[0], 1
+        while len(level) > 1:
+            assert level[0] == {"depth": [None]}
+            level, depth = level[1], depth + 1
+        assert depth == sys.getrecursionlimit() * 2
+
+    def test_primitive_containers_not_copied(self, mock_edge):
+        """Test primitive-only lists and property dicts are shared, not copied."""
+        primitives = [1, "a", 2.5, None, True]
+        assert _serialize_value(primitives) is primitives
+
+        result = _serialize_value(mock_edge)
+        assert result["properties"] is mock_edge.properties
+
+    def test_mixed_container_copied(self, mock_node):
+        """Test containers holding graph objects are copied, leaving the input intact."""
+        row = [mock_node, 1]
+
+        result = _serialize_value(row)
+
+        assert result is not row
+        assert row[0] is mock_node
+
+    def test_serialize_dict_subclass(self, mock_node):
+        """Test mapping subclasses are serialized like dicts."""
+        from collections import OrderedDict
+
+        result = _serialize_value(OrderedDict(node=mock_node))
+
+        assert result["node"]["type"] == "node"
@@ -9,26 +9,41 @@ if src_path not in sys.path:
 
 import pytest
 import json
-from unittest.mock import Mock, patch
-from falkordb_mcp.server import execute_query, list_graphs, get_graph_metadata
+from unittest.mock import AsyncMock, Mock, patch
+from falkordb_mcp.admission import AdmissionController
+from falkordb_mcp.server import execute_batch, execute_query, list_graphs, get_graph_metadata
+from tests.fixtures.mock_data import mock_metadata_pipeline
+
+
+def make_service():
+    """Mock async service with a real, unlimited admission controller."""
+    mock_service = Mock()
+    mock_service.admission = AdmissionController(0, 0, 0, 1.0)
+    return mock_service
 
 
 class TestExecuteQueryTool:
     """Test suite for execute_query MCP tool."""
 
-    def test_execute_query_returns_json_string(self, mock_falkordb_service):
+    async def test_execute_query_returns_json_string(self, mock_async_falkordb_service):
         """Test execute_query tool returns valid JSON string."""
-        with patch('falkordb_mcp.server.get_service', return_value=mock_falkordb_service):
-            result_json = execute_query("test_graph", "MATCH (n) RETURN n")
+        with patch(
+            'falkordb_mcp.server.get_async_service',
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            result_json = await execute_query("test_graph", "MATCH (n) RETURN n")
 
             assert isinstance(result_json, str)
             result = json.loads(result_json)
             assert result["success"] is True
 
-    def test_execute_query_success_structure(self, mock_falkordb_service):
+    async def test_execute_query_success_structure(self, mock_async_falkordb_service):
         """Test execute_query success response structure."""
-        with patch('falkordb_mcp.server.get_service', return_value=mock_falkordb_service):
-            result_json = execute_query("test_graph", "MATCH (n) RETURN n")
+        with patch(
+            'falkordb_mcp.server.get_async_service',
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            result_json = await execute_query("test_graph", "MATCH (n) RETURN n")
             result = json.loads(result_json)
 
             assert result["success"] is True
@@ -38,23 +53,40 @@ class TestExecuteQueryTool:
             assert result["metadata"]["query"] == "MATCH (n) RETURN n"
             assert "timestamp" in result["metadata"]
 
-    def test_execute_query_data_contains_result_set(self, mock_falkordb_service):
+    async def test_execute_query_reports_timings(self, mock_async_falkordb_service):
+        """Test network, serialization and JSON encoding times are reported."""
+        with patch(
+            'falkordb_mcp.server.get_async_service',
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            result = json.loads(await execute_query("test_graph", "MATCH (n) RETURN n"))
+
+            timings = result["data"]["timings"]
+            assert timings["network_ms"] >= 0
+            assert timings["serialize_ms"] >= 0
+            assert timings["result_cache_hit"] is False
+            assert isinstance(result["metadata"]["json_encode_ms"], float)
+
+    async def test_execute_query_data_contains_result_set(self, mock_async_falkordb_service):
         """Test execute_query data contains result_set."""
-        with patch('falkordb_mcp.server.get_service', return_value=mock_falkordb_service):
-            result_json = execute_query("test_graph", "MATCH (n) RETURN n")
+        with patch(
+            'falkordb_mcp.server.get_async_service',
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            result_json = await execute_query("test_graph", "MATCH (n) RETURN n")
             result = json.loads(result_json)
 
             assert "result_set" in result["data"]
             assert isinstance(result["data"]["result_set"], list)
             assert len(result["data"]["result_set"]) == 3
 
-    def test_execute_query_error_handling(self):
+    async def test_execute_query_error_handling(self):
         """Test execute_query error response structure."""
-        mock_service = Mock()
-        mock_service.execute_query.side_effect = Exception("Test error")
+        mock_service = make_service()
+        mock_service.execute_query = AsyncMock(side_effect=Exception("Test error"))
 
-        with patch('falkordb_mcp.server.get_service', return_value=mock_service):
-            result_json = execute_query("test_graph", "INVALID")
+        with patch('falkordb_mcp.server.get_async_service', AsyncMock(return_value=mock_service)):
+            result_json = await execute_query("test_graph", "INVALID")
             result = json.loads(result_json)
 
             assert result["success"] is False
@@ -62,11 +94,14 @@ class TestExecuteQueryTool:
             assert "Test error" in result["error"]
             assert result["graphName"] == "test_graph"
 
-    def test_execute_query_with_params(self, mock_falkordb_service):
+    async def test_execute_query_with_params(self, mock_async_falkordb_service):
         """Test execute_query with parameters."""
-        with patch('falkordb_mcp.server.get_service', return_value=mock_falkordb_service):
+        with patch(
+            'falkordb_mcp.server.get_async_service',
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
             params = {"id": 123}
-            result_json = execute_query(
+            result_json = await execute_query(
                 "test_graph",
                 "MATCH (n) WHERE n.id = $id RETURN n",
                 params
@@ -74,21 +109,104 @@ class TestExecuteQueryTool:
             result = json.loads(result_json)
 
             assert result["success"] is True
-            mock_falkordb_service.execute_query.assert_called_with(
-                "test_graph",
+            mock_graph = mock_async_falkordb_service.client.select_graph("test_graph")
+            mock_graph.query.assert_awaited_with(
                 "MATCH (n) WHERE n.id = $id RETURN n",
-                params
+                params,
+            )
+
+
+    async def test_execute_query_read_only_rejects_write(self, mock_async_falkordb_service):
+        """Test the read_only hint returns an error for write queries."""
+        with patch(
+            'falkordb_mcp.server.get_async_service',
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            result = json.loads(
+                await execute_query("test_graph", "CREATE (n:Person)", read_only=True)
             )
 
+            assert result["success"] is False
+            assert "read_only" in result["error"]
+
+
+class TestExecuteBatchTool:
+    """Test suite for execute_batch MCP tool."""
+
+    async def test_execute_batch_returns_results(self):
+        """Test execute_batch wraps per-item results in one response."""
+        mock_service = make_service()
+        mock_service.execute_batch = AsyncMock(return_value={
+            "results": [{"success": True, "data": {"result_set": [[1]]}}],
+            "count": 1,
+            "succeeded": 1,
+            "failed": 0,
+            "round_trip_ms": 0.4,
+        })
+
+        with patch('falkordb_mcp.server.get_async_service', AsyncMock(return_value=mock_service)):
+            result = json.loads(await execute_batch([{"graph_name": "g", "query": "RETURN 1"}]))
+
+        assert result["success"] is True
+        assert result["results"][0]["data"]["result_set"] == [[1]]
+        assert "timestamp" in result
+
+    async def test_execute_batch_error(self):
+        """Test execute_batch reports batch-level failures."""
+        mock_service = make_service()
+        mock_service.execute_batch = AsyncMock(side_effect=ValueError("Batch must contain"))
+
+        with patch('falkordb_mcp.server.get_async_service', AsyncMock(return_value=mock_service)):
+            result = json.loads(await execute_batch([]))
+
+        assert result["success"] is False
+        assert "Batch must contain" in result["error"]
+
+
+class TestListGraphsTool:
+    """Test suite for list_graphs and get_graph_metadata MCP tools."""
+
+    async def test_list_graphs_returns_graphs(self, mock_async_falkordb_service):
+        """Test list_graphs tool awaits the async service."""
+        with patch(
+            'falkordb_mcp.server.get_async_service',
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            result = json.loads(await list_graphs())
+
+            assert result["success"] is True
+            assert result["graphs"] == ["graph1", "graph2"]
+            assert result["count"] == 2
+
+    async def test_get_graph_metadata_returns_labels(self, mock_async_falkordb_service):
+        """Test get_graph_metadata tool returns labels from the async service."""
+        mock_graph = mock_async_falkordb_service.client.select_graph("test_graph")
+        mock_metadata_pipeline(mock_graph, ["Entity", "Episodic"], counts=[3, 4], is_async=True)
+
+        with patch(
+            'falkordb_mcp.server.get_async_service',
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            result = json.loads(await get_graph_metadata("test_graph"))
+
+            assert result["success"] is True
+            assert result["metadata"]["labels"] == ["Entity", "Episodic"]
+            assert result["metadata"]["node_counts"] == {"Entity": 3, "Episodic": 4}
+
 
 class TestRegressionTests:
     """Regression tests for BUG-001 fix."""
 
-    def test_bug_001_query_result_serialization(self, mock_falkordb_service):
+    async def test_bug_001_query_result_serialization(self, mock_async_falkordb_service):
         """Regression test: QueryResult must be JSON serializable."""
-        with patch('falkordb_mcp.server.get_service', return_value=mock_falkordb_service):
+        with patch(
+            'falkordb_mcp.server.get_async_service',
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
             # This should not raise "Object of type QueryResult is not JSON serializable"
-            result_json = execute_query("graphiti_meta_knowledge", "MATCH (n) RETURN count(n)")
+            result_json = await execute_query(
+                "graphiti_meta_knowledge", "MATCH (n) RETURN count(n)"
+            )
             result = json.loads(result_json)
 
             assert result["success"] is True
@@ -96,13 +214,16 @@ class TestRegressionTests:
             # Should be able to serialize to JSON without error
             json.dumps(result)
 
-    def test_bug_001_count_query(self, mock_falkordb_service, mock_query_result_count):
+    async def test_bug_001_count_query(self, mock_async_falkordb_service, mock_query_result_count):
         """Regression test: Count queries work correctly."""
-        mock_graph = mock_falkordb_service.client.select_graph("test_graph")
+        mock_graph = mock_async_falkordb_service.client.select_graph("test_graph")
         mock_graph.query.return_value = mock_query_result_count
 
-        with patch('falkordb_mcp.server.get_service', return_value=mock_falkordb_service):
-            result_json = execute_query("test_graph", "MATCH (n) RETURN count(n)")
+        with patch(
+            'falkordb_mcp.server.get_async_service',
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            result_json = await execute_query("test_graph", "MATCH (n) RETURN count(n)")
             result = json.loads(result_json)
 
             assert result["success"] is True
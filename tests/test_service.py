@@ -11,6 +11,7 @@ import pytest
 import json
 from unittest.mock import Mock, patch
 from falkordb_mcp.service import FalkorDBService, get_service
+from tests.fixtures.mock_data import mock_metadata_pipeline
 
 
 class TestExecuteQuery:
@@ -198,3 +199,88 @@ class TestNodeEdgeSerialization:
         # Verify round-trip
         parsed = json.loads(json_str)
         assert parsed["result_set"][0][0]["type"] == "edge"
+
+
+class TestGraphHandleCache:
+    """Test suite for graph handle reuse."""
+
+    def test_select_graph_reuses_handle(self, mock_falkordb_service):
+        """Test repeated queries reuse one Graph handle."""
+        mock_metadata_pipeline(mock_falkordb_service.client.select_graph("test_graph"), [])
+        mock_falkordb_service.client.select_graph.reset_mock()
+        mock_falkordb_service.execute_query("test_graph", "MATCH (n) RETURN n")
+        mock_falkordb_service.execute_query("test_graph", "MATCH (n) RETURN n")
+        mock_falkordb_service.get_graph_metadata("test_graph")
+
+        mock_falkordb_service.client.select_graph.assert_called_once_with("test_graph")
+
+    def test_list_graphs_evicts_missing_graphs(self, mock_falkordb_service):
+        """Test handles for graphs missing from GRAPH.LIST are dropped."""
+        mock_falkordb_service.execute_query("graph1", "RETURN 1")
+        mock_falkordb_service.execute_query("deleted_graph", "RETURN 1")
+
+        mock_falkordb_service.list_graphs()
+
+        assert "graph1" in mock_falkordb_service._graphs
+        assert "deleted_graph" not in mock_falkordb_service._graphs
+
+    def test_evict_graph(self, mock_falkordb_service):
+        """Test evict_graph forces a fresh handle on the next call."""
+        mock_falkordb_service.execute_query("test_graph", "RETURN 1")
+        mock_falkordb_service.evict_graph("test_graph")
+        mock_falkordb_service.execute_query("test_graph", "RETURN 1")
+
+        assert mock_falkordb_service.client.select_graph.call_count == 2
+
+    def test_lru_bound(self):
+        """Test the cache keeps at most max_size handles, dropping the oldest."""
+        from falkordb_mcp.cache import GraphHandleCache
+
+        cache = GraphHandleCache(max_size=2)
+        cache.get("a", str.upper)
+        cache.get("b", str.upper)
+        cache.get("a", str.upper)
+        cache.get("c", str.upper)
+
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert cache.stats() == {"size": 2, "max_size": 2, "hits": 1, "misses": 3}
+
+
+class TestReadOnlyRouting:
+    """Test suite for GRAPH.RO_QUERY routing."""
+
+    def test_read_query_uses_ro_query(self, mock_falkordb_service, mock_query_result):
+        """Test pure reads are sent through ro_query."""
+        mock_graph = mock_falkordb_service.client.select_graph("test_graph")
+        mock_graph.ro_query = Mock(return_value=mock_query_result)
+        mock_graph.query = Mock(return_value=mock_query_result)
+
+        mock_falkordb_service.execute_query("test_graph", "MATCH (n) RETURN n")
+
+        mock_graph.ro_query.assert_called_once_with("MATCH (n) RETURN n", {})
+        mock_graph.query.assert_not_called()
+
+    def test_write_query_uses_query(self, mock_falkordb_service, mock_query_result):
+        """Test writes are sent through query."""
+        mock_graph = mock_falkordb_service.client.select_graph("test_graph")
+        mock_graph.ro_query = Mock(return_value=mock_query_result)
+        mock_graph.query = Mock(return_value=mock_query_result)
+
+        mock_falkordb_service.execute_query("test_graph", "CREATE (n:Person)")
+
+        mock_graph.query.assert_called_once_with("CREATE (n:Person)", {})
+        mock_graph.ro_query.assert_not_called()
+
+    def test_read_only_hint_rejects_writes(self, mock_falkordb_service):
+        """Test read_only=True rejects a write before it reaches FalkorDB."""
+        from falkordb_mcp.cypher import ReadOnlyViolationError
+
+        mock_graph = mock_falkordb_service.client.select_graph("test_graph")
+        mock_graph.query.reset_mock()
+
+        with pytest.raises(ReadOnlyViolationError):
+            mock_falkordb_service.execute_query(
+                "test_graph", "MATCH (n) DELETE n", read_only=True
+            )
+        mock_graph.query.assert_not_called()
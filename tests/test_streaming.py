@@ -0,0 +1,107 @@
+"""Test suite for streaming results as progress notifications."""
+
+import sys
+from pathlib import Path
+# Add src to path
+src_path = str(Path(__file__).parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+import json
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from falkordb_mcp.server import execute_query
+from tests.fixtures.mock_data import create_mock_query_result
+
+
+def make_context(progress_token="token"):
+    """Mock tool Context whose request carries a progress token."""
+    ctx = Mock()
+    ctx.request_context.meta = {"progressToken": progress_token} if progress_token else {}
+    ctx.report_progress = AsyncMock()
+    return ctx
+
+
+class TestStreamQuery:
+    """Test suite for AsyncFalkorDBService.stream_query."""
+
+    async def test_chunks(self, mock_async_falkordb_service):
+        """Test rows arrive in order in chunks of the requested size."""
+        mock_graph = mock_async_falkordb_service.client.select_graph("g")
+        mock_graph.ro_query.return_value = create_mock_query_result(
+            [[i] for i in range(5)], [[1, "i"]]
+        )
+        received = []
+
+        async def on_chunk(chunk, offset, total):
+            received.append((chunk["result_set"], offset, total))
+
+        result = await mock_async_falkordb_service.stream_query(
+            "g", "UNWIND range(0, 4) AS i RETURN i", on_chunk, chunk_rows=2
+        )
+
+        assert received == [([[0], [1]], 0, 5), ([[2], [3]], 2, 5), ([[4]], 4, 5)]
+        assert result["row_count"] == 5
+        assert result["chunks"] == 3
+        assert result["headers"] == [[1, "i"]]
+        assert result["timings"]["first_chunk_ms"] is not None
+        assert "result_set" not in result
+
+    async def test_write_invalidates_cache(self, mock_async_falkordb_service):
+        """Test streamed writes go to the primary and drop cached reads."""
+        mock_graph = mock_async_falkordb_service.client.select_graph("g")
+        mock_graph.query.return_value = create_mock_query_result([], nodes_created=1)
+
+        with patch.object(mock_async_falkordb_service.results, "invalidate_graph") as invalidate:
+            await mock_async_falkordb_service.stream_query("g", "CREATE (n)", AsyncMock())
+
+        invalidate.assert_called_once_with("g")
+
+    async def test_rejects_bad_chunk_size(self, mock_async_falkordb_service):
+        """Test chunk sizes must be positive."""
+        with pytest.raises(ValueError):
+            await mock_async_falkordb_service.stream_query(
+                "g", "RETURN 1", AsyncMock(), chunk_rows=0
+            )
+
+
+class TestStreamingTool:
+    """Test suite for execute_query with stream=True."""
+
+    async def test_sends_progress_notifications(self, mock_async_falkordb_service):
+        """Test each chunk is a progress notification and the response holds no rows."""
+        mock_graph = mock_async_falkordb_service.client.select_graph("g")
+        mock_graph.ro_query.return_value = create_mock_query_result([[i] for i in range(3)], ["i"])
+        ctx = make_context()
+
+        with patch(
+            "falkordb_mcp.server.get_async_service",
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ), patch("falkordb_mcp.async_service.config.stream_chunk_rows", 2):
+            result = json.loads(await execute_query(
+                "g", "UNWIND range(0, 2) AS i RETURN i", stream=True, format="columnar", ctx=ctx
+            ))
+
+        assert result["success"] is True
+        assert result["data"]["streamed"] is True
+        assert result["data"]["row_count"] == 3
+        progress = [call.args for call in ctx.report_progress.await_args_list]
+        assert [(done, total) for done, total, _ in progress] == [(2, 3), (3, 3)]
+        first = json.loads(progress[0][2])
+        assert first["offset"] == 0
+        assert first["columns"] == [{"name": "i", "values": [0, 1]}]
+
+    async def test_falls_back_without_token(self, mock_async_falkordb_service):
+        """Test requests without a progress token get the rows in the response."""
+        ctx = make_context(progress_token=None)
+
+        with patch(
+            "falkordb_mcp.server.get_async_service",
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            result = json.loads(
+                await execute_query("g", "MATCH (n) RETURN n", stream=True, ctx=ctx)
+            )
+
+        assert "result_set" in result["data"]
+        ctx.report_progress.assert_not_awaited()
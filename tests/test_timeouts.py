@@ -0,0 +1,152 @@
+"""Test suite for per-query timeouts."""
+
+import sys
+from pathlib import Path
+# Add src to path
+src_path = str(Path(__file__).parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, patch
+from redis.exceptions import ResponseError
+from falkordb_mcp.server import execute_query
+from falkordb_mcp.timeouts import (
+    CLIENT,
+    SERVER,
+    QueryTimeoutError,
+    is_server_timeout,
+    resolve_timeout,
+)
+
+
+class TestResolveTimeout:
+    """Test suite for choosing a query's timeout."""
+
+    def test_defaults_to_config(self):
+        """Test None falls back to FALKORDB_QUERY_TIMEOUT_MS."""
+        with patch("falkordb_mcp.timeouts.config.query_timeout_ms", 1234):
+            assert resolve_timeout(None) == 1234
+        assert resolve_timeout(0) == 0
+
+    def test_rejects_negative(self):
+        """Test negative timeouts are refused."""
+        with pytest.raises(ValueError):
+            resolve_timeout(-1)
+
+    def test_is_server_timeout(self):
+        """Test only FalkorDB's timeout reply counts as a server timeout."""
+        assert is_server_timeout(ResponseError("Query timed out"))
+        assert not is_server_timeout(ResponseError("Unknown function 'foo'"))
+        assert not is_server_timeout(TimeoutError("timed out"))
+
+
+class TestServiceTimeouts:
+    """Test suite for timeouts in the query services."""
+
+    def test_sync_server_timeout(self, mock_falkordb_service):
+        """Test FalkorDB aborting a query raises QueryTimeoutError."""
+        mock_graph = mock_falkordb_service.client.select_graph("g")
+        mock_graph.ro_query.side_effect = ResponseError("Query timed out")
+
+        with pytest.raises(QueryTimeoutError) as excinfo:
+            mock_falkordb_service.execute_query("g", "MATCH (n) RETURN n", timeout_ms=50)
+
+        assert excinfo.value.enforced_by == SERVER
+        assert excinfo.value.timeout_ms == 50
+
+    def test_sync_failed_write_invalidates(self, mock_falkordb_service):
+        """Test a write FalkorDB timed out drops the graph's cached reads."""
+        mock_graph = mock_falkordb_service.client.select_graph("g")
+        mock_graph.name = "g"
+        mock_falkordb_service.execute_query("g", "MATCH (n) RETURN n")
+        mock_graph.query.side_effect = ResponseError("Query timed out")
+
+        with pytest.raises(QueryTimeoutError):
+            mock_falkordb_service.execute_query("g", "CREATE (n)", timeout_ms=50)
+
+        assert mock_falkordb_service.results.stats()["entries"] == 0
+
+    def test_zero_disables(self, mock_falkordb_service):
+        """Test a zero timeout sends the query without a TIMEOUT argument."""
+        mock_graph = mock_falkordb_service.client.select_graph("g")
+
+        mock_falkordb_service.execute_query("g", "CREATE (n)", timeout_ms=0)
+
+        mock_graph.query.assert_called_once_with("CREATE (n)", {})
+
+    async def test_client_deadline(self, mock_async_falkordb_service):
+        """Test the client gives up when FalkorDB does not answer in time."""
+        mock_graph = mock_async_falkordb_service.client.select_graph("g")
+
+        async def stall(*args, **kwargs):
+            await asyncio.sleep(1)
+
+        mock_graph.ro_query.side_effect = stall
+
+        with patch("falkordb_mcp.timeouts.config.query_timeout_grace_ms", 0):
+            with pytest.raises(QueryTimeoutError) as excinfo:
+                await mock_async_falkordb_service.execute_query(
+                    "g", "MATCH (n) RETURN n", timeout_ms=20
+                )
+
+        assert excinfo.value.enforced_by == CLIENT
+        assert excinfo.value.elapsed_ms < 1000
+        assert mock_async_falkordb_service.pool_stats()["in_use"] == 0
+
+    async def test_timed_out_write_invalidates(self, mock_async_falkordb_service):
+        """Test a write cut off at the client deadline still drops cached state."""
+        service = mock_async_falkordb_service
+        mock_graph = service.client.select_graph("g")
+        await service.execute_query("g", "MATCH (n) RETURN n")
+        service.counts.seed("g", {"Person": 1}, {}, service.counts.generation("g"))
+
+        async def stall(*args, **kwargs):
+            await asyncio.sleep(1)
+
+        mock_graph.query.side_effect = stall
+        with patch("falkordb_mcp.timeouts.config.query_timeout_grace_ms", 0):
+            with pytest.raises(QueryTimeoutError):
+                await service.execute_query("g", "CREATE (:Person)", timeout_ms=20)
+
+        assert service.results.stats()["entries"] == 0
+        assert service.counts.snapshot("g")["drifted"] is True
+
+    async def test_flights_split_by_timeout(self, mock_async_falkordb_service):
+        """Test reads with different deadlines do not share one execution."""
+        mock_graph = mock_async_falkordb_service.client.select_graph("g")
+        result = mock_graph.ro_query.return_value
+
+        async def slow(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return result
+
+        mock_graph.ro_query = AsyncMock(side_effect=slow)
+        await asyncio.gather(
+            mock_async_falkordb_service.execute_query("g", "MATCH (n) RETURN n", timeout_ms=50),
+            mock_async_falkordb_service.execute_query("g", "MATCH (n) RETURN n", timeout_ms=5000),
+        )
+
+        assert mock_graph.ro_query.await_count == 2
+
+
+class TestTimeoutTool:
+    """Test suite for timeouts on the execute_query tool."""
+
+    async def test_structured_error(self, mock_async_falkordb_service):
+        """Test a timeout is reported with its type and details."""
+        mock_graph = mock_async_falkordb_service.client.select_graph("g")
+        mock_graph.ro_query.side_effect = ResponseError("Query timed out")
+
+        with patch(
+            "falkordb_mcp.server.get_async_service",
+            AsyncMock(return_value=mock_async_falkordb_service),
+        ):
+            result = json.loads(await execute_query("g", "MATCH (n) RETURN n", timeout_ms=100))
+
+        assert result["success"] is False
+        assert result["errorType"] == "timeout"
+        assert result["timeout"]["timeout_ms"] == 100
+        assert result["timeout"]["enforced_by"] == SERVER
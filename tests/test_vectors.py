@@ -0,0 +1,177 @@
+"""Test suite for embedding vector projection."""
+
+import sys
+from pathlib import Path
+# Add src to path
+src_path = str(Path(__file__).parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+import base64
+import json
+import struct
+import pytest
+from unittest.mock import AsyncMock, patch
+from falkordb_mcp.server import execute_query
+from falkordb_mcp.vectors import is_vector, project_vectors
+
+EMBEDDING = [(i * 0.0123456789) % 1 for i in range(128)]
+
+
+def _node(properties):
+    return {"type": "node", "id": 1, "labels": ["Entity"], "properties": properties}
+
+
+def _result(rows):
+    return {"result_set": rows, "headers": ["n"], "statistics": {}}
+
+
+class TestIsVector:
+    """Test suite for vector detection."""
+
+    def test_detected_by_shape(self):
+        """Test long float lists are vectors whatever they are called."""
+        assert is_vector(EMBEDDING, 64)
+        assert is_vector([0, 1.5] * 32, 64)
+
+    @pytest.mark.parametrize("value", [
+        EMBEDDING[:10],
+        list(range(128)),
+        ["a"] * 128,
+        [True] * 128,
+        EMBEDDING[:127] + ["x"],
+        tuple(EMBEDDING),
+    ])
+    def test_not_vectors(self, value):
+        """Test short lists, integer lists and mixed lists are left alone."""
+        assert not is_vector(value, 64)
+
+
+class TestProjectVectors:
+    """Test suite for the projection policies."""
+
+    def test_drop_removes_property(self):
+        """Test drop removes vector properties and leaves the input untouched."""
+        properties = {"name": "Alice", "name_embedding": EMBEDDING}
+        data = _result([[_node(properties)], [EMBEDDING]])
+
+        projected = project_vectors(data, "drop")
+
+        assert projected["result_set"][0][0]["properties"] == {"name": "Alice"}
+        assert projected["result_set"][1] == [None]
+        assert properties["name_embedding"] is EMBEDDING
+
+    def test_truncate(self):
+        """Test truncate keeps the dimension count and a short preview."""
+        projected = project_vectors(_result([[{"fact_embedding": EMBEDDING}]]), "truncate",
+                                    preview_size=4)
+
+        assert projected["result_set"][0][0]["fact_embedding"] == {
+            "dims": 128, "preview": EMBEDDING[:4],
+        }
+
+    @pytest.mark.parametrize("policy,code,dtype", [
+        ("base64_f32", "f", "float32"),
+        ("base64_f16", "e", "float16"),
+    ])
+    def test_base64(self, policy, code, dtype):
+        """Test base64 blobs decode back to the vector."""
+        projected = project_vectors(_result([[_node({"v": EMBEDDING})]]), policy)
+
+        blob = projected["result_set"][0][0]["properties"]["v"]
+        assert blob["dtype"] == dtype and blob["dims"] == 128
+        decoded = struct.unpack(f"<128{code}", base64.b64decode(blob["base64"]))
+        assert decoded == pytest.approx(EMBEDDING, abs=1e-3)
+
+    def test_shrinks_node_results(self):
+        """Test projected node results are much smaller."""
+        data = _result([[_node({"name": f"n{i}", "name_embedding": EMBEDDING})] for i in range(20)])
+
+        projected = project_vectors(data, "base64_f16")
+
+        assert len(json.dumps(projected)) * 4 < len(json.dumps(data))
+
+    def test_rows_are_not_vectors(self):
+        """Test a row with many numeric columns is kept as it is."""
+        data = _result([EMBEDDING])
+
+        assert project_vectors(data, "drop") is data
+
+    def test_keep_and_unknown(self):
+        """Test keep is a no-op and unknown policies are rejected."""
+        data = _result([[EMBEDDING]])
+        assert project_vectors(data, "keep") is data
+
+        with pytest.raises(ValueError, match="Unknown vector policy"):
+            project_vectors(data, "zip")
+
+
+async def test_execute_query_vectors(mock_async_falkordb_service):
+    """Test the tool applies the per-call vector policy."""
+    mock_graph = mock_async_falkordb_service.client.select_graph("test_graph")
+    mock_graph.query.return_value.result_set = [[EMBEDDING]]
+
+    with patch(
+        'falkordb_mcp.server.get_async_service',
+        AsyncMock(return_value=mock_async_falkordb_service),
+    ):
+        result = json.loads(
+            await execute_query("test_graph", "MATCH (n) RETURN n.embedding", vectors="truncate")
+        )
+
+    assert result["data"]["result_set"][0][0]["dims"] == 128
+
+
+async def test_byte_budget_counts_projected_rows(mock_async_falkordb_service):
+    """Test dropped vectors do not count against the size budget."""
+    mock_graph = mock_async_falkordb_service.client.select_graph("test_graph")
+    mock_graph.query.return_value.result_set = [[i, EMBEDDING] for i in range(5)]
+
+    with patch(
+        'falkordb_mcp.server.get_async_service',
+        AsyncMock(return_value=mock_async_falkordb_service),
+    ):
+        dropped = json.loads(await execute_query(
+            "test_graph", "MATCH (n) RETURN n.id, n.embedding", vectors="drop", max_bytes=200
+        ))
+        kept = json.loads(await execute_query(
+            "test_graph", "MATCH (n) RETURN n.id, n.embedding", vectors="keep", max_bytes=200
+        ))
+
+    assert dropped["data"]["result_set"] == [[i, None] for i in range(5)]
+    assert dropped["data"]["truncated"] is False
+    assert len(kept["data"]["result_set"]) == 1
+    assert kept["data"]["truncated"] is True
+
+
+async def test_stream_chunks_projected(mock_async_falkordb_service):
+    """Test streamed chunks carry rows projected by the vector policy."""
+    mock_graph = mock_async_falkordb_service.client.select_graph("test_graph")
+    mock_graph.ro_query.return_value.result_set = [[i, EMBEDDING] for i in range(3)]
+    received = []
+
+    async def on_chunk(chunk, offset, total):
+        received.extend(chunk["result_set"])
+
+    await mock_async_falkordb_service.stream_query(
+        "test_graph", "MATCH (n) RETURN n.id, n.embedding", on_chunk, vectors="drop"
+    )
+
+    assert received == [[i, None] for i in range(3)]
+
+
+async def test_cursor_pages_projected(mock_async_falkordb_service):
+    """Test cursor pages are projected by the per-call vector policy."""
+    mock_graph = mock_async_falkordb_service.client.select_graph("test_graph")
+    # Keyset pages end in the node id column, which the cursor strips
+    mock_graph.ro_query.return_value.result_set = [[EMBEDDING, 7]]
+
+    page = await mock_async_falkordb_service.open_cursor(
+        "test_graph", "MATCH (n) RETURN n.embedding", vectors="truncate"
+    )
+
+    assert page["result_set"][0][0]["dims"] == 128
+    with pytest.raises(ValueError, match="Unknown vector policy"):
+        await mock_async_falkordb_service.open_cursor(
+            "test_graph", "MATCH (n) RETURN n.embedding", vectors="zip"
+        )